@@ -0,0 +1,14 @@
+from django.contrib import admin
+from .models import JobDailyStats, RecruiterDailyStats
+
+@admin.register(JobDailyStats)
+class JobDailyStatsAdmin(admin.ModelAdmin):
+    list_display = ('job', 'date', 'applications', 'reviews', 'interviews', 'offers', 'hires', 'rejections')
+    list_filter = ('date',)
+    raw_id_fields = ('job', 'recruiter')
+
+@admin.register(RecruiterDailyStats)
+class RecruiterDailyStatsAdmin(admin.ModelAdmin):
+    list_display = ('recruiter', 'date', 'applications', 'reviews', 'interviews', 'offers', 'hires', 'rejections')
+    list_filter = ('date',)
+    raw_id_fields = ('recruiter',)
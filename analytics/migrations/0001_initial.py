@@ -0,0 +1,62 @@
+# Generated by Django 5.2.6 on 2026-10-18 13:17
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("jobs", "0006_job_application_counters"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="JobDailyStats",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("date", models.DateField()),
+                ("applications", models.PositiveIntegerField(default=0)),
+                ("reviews", models.PositiveIntegerField(default=0)),
+                ("interviews", models.PositiveIntegerField(default=0)),
+                ("offers", models.PositiveIntegerField(default=0)),
+                ("hires", models.PositiveIntegerField(default=0)),
+                ("rejections", models.PositiveIntegerField(default=0)),
+                ("withdrawals", models.PositiveIntegerField(default=0)),
+                ("first_responses", models.PositiveIntegerField(default=0)),
+                ("response_seconds", models.BigIntegerField(default=0)),
+                ("job", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="daily_stats", to="jobs.job")),
+                ("recruiter", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="+", to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                "ordering": ["-date"],
+                "indexes": [models.Index(fields=["recruiter", "date"], name="job_stats_recruiter_date_idx")],
+                "constraints": [models.UniqueConstraint(fields=("job", "date"), name="unique_job_daily_stats")],
+            },
+        ),
+        migrations.CreateModel(
+            name="RecruiterDailyStats",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("date", models.DateField()),
+                ("applications", models.PositiveIntegerField(default=0)),
+                ("reviews", models.PositiveIntegerField(default=0)),
+                ("interviews", models.PositiveIntegerField(default=0)),
+                ("offers", models.PositiveIntegerField(default=0)),
+                ("hires", models.PositiveIntegerField(default=0)),
+                ("rejections", models.PositiveIntegerField(default=0)),
+                ("withdrawals", models.PositiveIntegerField(default=0)),
+                ("first_responses", models.PositiveIntegerField(default=0)),
+                ("response_seconds", models.BigIntegerField(default=0)),
+                ("recruiter", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="daily_stats", to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                "ordering": ["-date"],
+                "constraints": [models.UniqueConstraint(fields=("recruiter", "date"), name="unique_recruiter_daily_stats")],
+            },
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.6 on 2026-10-18 14:04
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analytics", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="jobdailystats",
+            name="withdrawals",
+        ),
+        migrations.RemoveField(
+            model_name="recruiterdailystats",
+            name="withdrawals",
+        ),
+    ]
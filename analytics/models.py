@@ -0,0 +1,56 @@
+from django.conf import settings
+from django.db import models
+
+from jobs.models import Job
+
+
+class DailyStats(models.Model):
+    """
+    Application activity on one day, maintained incrementally by
+    analytics.rollups so the dashboard never aggregates Application rows.
+    Status counters count applications that moved into the stage that day.
+    """
+    date = models.DateField()
+    applications = models.PositiveIntegerField(default=0)
+    reviews = models.PositiveIntegerField(default=0)
+    interviews = models.PositiveIntegerField(default=0)
+    offers = models.PositiveIntegerField(default=0)
+    hires = models.PositiveIntegerField(default=0)
+    rejections = models.PositiveIntegerField(default=0)
+    # Applications first moved on from 'applied' that day, and their total wait
+    first_responses = models.PositiveIntegerField(default=0)
+    response_seconds = models.BigIntegerField(default=0)
+
+    class Meta:
+        abstract = True
+
+
+class JobDailyStats(DailyStats):
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='daily_stats')
+    # The job's poster, copied here so per-recruiter breakdowns don't join jobs
+    recruiter = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='+')
+
+    class Meta:
+        ordering = ['-date']
+        constraints = [
+            models.UniqueConstraint(fields=['job', 'date'], name='unique_job_daily_stats'),
+        ]
+        indexes = [
+            models.Index(fields=['recruiter', 'date'], name='job_stats_recruiter_date_idx'),
+        ]
+
+    def __str__(self):
+        return f"Job {self.job_id} on {self.date}"
+
+
+class RecruiterDailyStats(DailyStats):
+    recruiter = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='daily_stats')
+
+    class Meta:
+        ordering = ['-date']
+        constraints = [
+            models.UniqueConstraint(fields=['recruiter', 'date'], name='unique_recruiter_daily_stats'),
+        ]
+
+    def __str__(self):
+        return f"Recruiter {self.recruiter_id} on {self.date}"
@@ -0,0 +1,123 @@
+"""
+Daily application rollups per job and per recruiter.
+
+Application creates and status changes add to the (job, day) and
+(recruiter, day) rows with UPDATE ... SET n = n + 1, creating the row on the
+first event of the day, in the same transaction as the change itself. The
+dashboard then reads at most one row per day instead of grouping the
+Application table. rebuild() recomputes everything from Application and
+ApplicationStatusChange, e.g. after bulk loads that skip signals.
+"""
+from collections import Counter, defaultdict
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from .models import JobDailyStats, RecruiterDailyStats
+from applications.models import Application, ApplicationStatusChange
+from jobs.models import Job
+
+COUNTER_FIELDS = [
+    'applications', 'reviews', 'interviews', 'offers', 'hires', 'rejections',
+    'first_responses', 'response_seconds',
+]
+
+# Application status -> stage counter incremented when an application enters it
+STAGE_FIELDS = {
+    'review': 'reviews',
+    'interview_scheduled': 'interviews',
+    'interview_completed': 'interviews',
+    'offer': 'offers',
+    'accepted': 'hires',
+    'rejected': 'rejections',
+}
+
+
+def change_deltas(from_status, to_status, applied_date, changed_at):
+    """Counter changes for one application moving between statuses"""
+    deltas = Counter()
+    field = STAGE_FIELDS.get(to_status)
+    # A completed interview was already counted when it was scheduled
+    if field and not (field == 'interviews' and STAGE_FIELDS.get(from_status) == 'interviews'):
+        deltas[field] += 1
+    if from_status == 'applied':
+        deltas['first_responses'] += 1
+        deltas['response_seconds'] += max(0, int((changed_at - applied_date).total_seconds()))
+    return deltas
+
+
+def increment(model, lookup, deltas, create_defaults=None):
+    """Add ``deltas`` to the row matching ``lookup``, creating it if needed"""
+    changes = {field: F(field) + amount for field, amount in deltas.items() if amount}
+    if not changes or model.objects.filter(**lookup).update(**changes):
+        return
+    try:
+        with transaction.atomic():
+            model.objects.create(**lookup, **(create_defaults or {}), **deltas)
+    except IntegrityError:
+        # Another transaction created the row first
+        model.objects.filter(**lookup).update(**changes)
+
+
+def record(job_deltas):
+    """Apply ``{(job_id, date): Counter}`` to the job rollups and their recruiters'"""
+    recruiters = dict(Job.objects.filter(pk__in={job_id for job_id, _ in job_deltas}).values_list('pk', 'posted_by_id'))
+    recruiter_deltas = defaultdict(Counter)
+    for (job_id, date), deltas in job_deltas.items():
+        recruiter_id = recruiters.get(job_id)
+        if recruiter_id is None:
+            continue
+        increment(JobDailyStats, {'job_id': job_id, 'date': date}, deltas, {'recruiter_id': recruiter_id})
+        recruiter_deltas[recruiter_id, date].update(deltas)
+    for (recruiter_id, date), deltas in recruiter_deltas.items():
+        increment(RecruiterDailyStats, {'recruiter_id': recruiter_id, 'date': date}, deltas)
+
+
+def application_created(application):
+    day = timezone.localdate(application.applied_date)
+    record({(application.job_id, day): Counter(applications=1)})
+
+
+def statuses_changed(changes, changed_at):
+    day = timezone.localdate(changed_at)
+    job_deltas = defaultdict(Counter)
+    for change in changes:
+        job_deltas[change['job_id'], day].update(
+            change_deltas(change['from_status'], change['to_status'], change['applied_date'], changed_at)
+        )
+    record(job_deltas)
+
+
+def rebuild():
+    """Recompute every rollup from the Application and ApplicationStatusChange tables"""
+    job_deltas = defaultdict(Counter)
+    created = Application.objects.order_by().values('job_id', day=TruncDate('applied_date')).annotate(n=Count('pk'))
+    for row in created:
+        job_deltas[row['job_id'], row['day']]['applications'] += row['n']
+
+    history = ApplicationStatusChange.objects.values_list(
+        'application__job_id', 'from_status', 'to_status', 'application__applied_date', 'changed_at',
+    )
+    for job_id, from_status, to_status, applied_date, changed_at in history.iterator(chunk_size=5000):
+        job_deltas[job_id, timezone.localdate(changed_at)].update(
+            change_deltas(from_status, to_status, applied_date, changed_at)
+        )
+
+    recruiters = dict(Job.objects.values_list('pk', 'posted_by_id'))
+    recruiter_deltas = defaultdict(Counter)
+    job_rows = []
+    for (job_id, date), deltas in job_deltas.items():
+        recruiter_deltas[recruiters[job_id], date].update(deltas)
+        job_rows.append(JobDailyStats(job_id=job_id, recruiter_id=recruiters[job_id], date=date, **deltas))
+
+    with transaction.atomic():
+        JobDailyStats.objects.all().delete()
+        RecruiterDailyStats.objects.all().delete()
+        JobDailyStats.objects.bulk_create(job_rows, batch_size=1000)
+        RecruiterDailyStats.objects.bulk_create(
+            [RecruiterDailyStats(recruiter_id=r, date=d, **deltas) for (r, d), deltas in recruiter_deltas.items()],
+            batch_size=1000,
+        )
+    return len(job_rows)
@@ -0,0 +1,17 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from . import rollups
+from applications.models import Application
+from applications.signals import statuses_changed
+
+
+@receiver(post_save, sender=Application)
+def count_new_application(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        rollups.application_created(instance)
+
+
+@receiver(statuses_changed, sender=Application)
+def count_status_changes(sender, changes, changed_at, **kwargs):
+    rollups.statuses_changed(changes, changed_at)
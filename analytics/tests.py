@@ -0,0 +1,82 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from . import rollups
+from .models import JobDailyStats, RecruiterDailyStats
+from applications import transitions
+from applications.models import Application
+from jobs.models import Job
+from users.models import CustomUser
+
+
+class RollupTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.recruiter = CustomUser.objects.create_user(
+            username='recruiter', email='recruiter@example.com', password='pass12345',
+            user_type='recruiter', profile_completed=True,
+        )
+        cls.seekers = [
+            CustomUser.objects.create_user(username=f'seeker{i}', user_type='job_seeker') for i in range(3)
+        ]
+        cls.jobs = [
+            Job.objects.create(
+                title=title, description='Build things.', requirements='Experience.', company_name='Acme',
+                location='Atlanta, GA', location_type='onsite', job_type='full_time', posted_by=cls.recruiter,
+            )
+            for title in ('Engineer', 'Designer')
+        ]
+
+    def stats(self, model, **lookup):
+        row = model.objects.get(date=timezone.localdate(), **lookup)
+        return {field: getattr(row, field) for field in rollups.COUNTER_FIELDS if getattr(row, field)}
+
+    def test_creates_and_status_changes_roll_up(self):
+        for seeker in self.seekers:
+            Application.objects.create(job=self.jobs[0], applicant=seeker)
+        Application.objects.create(job=self.jobs[1], applicant=self.seekers[0])
+
+        application = Application.objects.get(job=self.jobs[1])
+        application.status = 'interview_scheduled'
+        application.save()
+        transitions.transition(Application.objects.filter(job=self.jobs[0]), 'interview_completed')
+        transitions.transition(Application.objects.filter(applicant=self.seekers[0]), 'offer')
+
+        job_stats = self.stats(JobDailyStats, job=self.jobs[0])
+        self.assertEqual(job_stats, {'applications': 3, 'interviews': 3, 'offers': 1, 'first_responses': 3})
+        recruiter_stats = self.stats(RecruiterDailyStats, recruiter=self.recruiter)
+        self.assertEqual(recruiter_stats, {'applications': 4, 'interviews': 4, 'offers': 2, 'first_responses': 4})
+
+        # Rebuilding from the tables and history gives the same rollups
+        rollups.rebuild()
+        self.assertEqual(self.stats(JobDailyStats, job=self.jobs[0]), job_stats)
+        self.assertEqual(self.stats(RecruiterDailyStats, recruiter=self.recruiter), recruiter_stats)
+
+    def test_response_time(self):
+        application = Application.objects.create(job=self.jobs[0], applicant=self.seekers[0])
+        Application.objects.filter(pk=application.pk).update(applied_date=timezone.now() - timedelta(hours=6))
+        transitions.transition(Application.objects.filter(pk=application.pk), 'review')
+
+        stats = RecruiterDailyStats.objects.get(recruiter=self.recruiter, date=timezone.localdate())
+        self.assertEqual(stats.first_responses, 1)
+        self.assertAlmostEqual(stats.response_seconds, 6 * 3600, delta=60)
+
+    def test_dashboard_reads_rollups_only(self):
+        self.client.force_login(self.recruiter)
+        self.assertRedirects(self.client.get(reverse('dashboard')), reverse('analytics:dashboard'))
+
+        for seeker in self.seekers:
+            Application.objects.create(job=self.jobs[0], applicant=seeker)
+        transitions.transition(Application.objects.filter(applicant=self.seekers[0]), 'review')
+
+        self.client.get(reverse('analytics:dashboard'))  # warm the unread notification count
+        with self.assertNumQueries(5):
+            response = self.client.get(reverse('analytics:dashboard'), {'days': 7})
+        self.assertEqual(response.context['totals']['applications'], 3)
+        self.assertEqual(len(response.context['series']), 7)
+        self.assertEqual(response.context['series'][-1]['applications'], 3)
+        self.assertEqual(dict(response.context['pipeline'])['Under review'], 1)
+        self.assertContains(response, 'Engineer')
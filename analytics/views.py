@@ -0,0 +1,87 @@
+from datetime import timedelta
+
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.db.models import Sum
+from django.utils import timezone
+from django.views.generic import TemplateView
+
+from .models import JobDailyStats, RecruiterDailyStats
+from .rollups import COUNTER_FIELDS
+from jobs.models import Job
+from jobs.views import RecruiterRequiredMixin
+
+PERIODS = (7, 30, 90)
+
+# (label, counter) pairs shown as the hiring funnel, widest stage first
+FUNNEL = (
+    ('Applications', 'applications'),
+    ('Reviewed', 'reviews'),
+    ('Interviews', 'interviews'),
+    ('Offers', 'offers'),
+    ('Hires', 'hires'),
+)
+
+PIPELINE = (
+    ('Applied', 'applied_count'),
+    ('Under review', 'review_count'),
+    ('Interviewing', 'interview_count'),
+    ('Offer', 'offer_count'),
+    ('Rejected', 'rejected_count'),
+)
+
+
+class RecruiterDashboardView(LoginRequiredMixin, RecruiterRequiredMixin, TemplateView):
+    """Hiring activity over the last 7, 30 or 90 days, read from the daily rollups"""
+    template_name = 'analytics/dashboard.html'
+
+    def get_period(self):
+        try:
+            days = int(self.request.GET.get('days', 30))
+        except ValueError:
+            days = 30
+        return days if days in PERIODS else 30
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        user = self.request.user
+        days = self.get_period()
+        today = timezone.localdate()
+        start = today - timedelta(days=days - 1)
+
+        # At most one row per day
+        stats = {row.date: row for row in RecruiterDailyStats.objects.filter(recruiter=user, date__gte=start)}
+        totals = {field: sum(getattr(row, field) for row in stats.values()) for field in COUNTER_FIELDS}
+
+        series = []
+        for offset in range(days):
+            date = start + timedelta(days=offset)
+            row = stats.get(date)
+            series.append({'date': date, 'applications': row.applications if row else 0})
+        peak = max([day['applications'] for day in series] + [1])
+        for day in series:
+            day['percent'] = round(100 * day['applications'] / peak)
+
+        widest = max(totals['applications'], 1)
+        context['funnel'] = [
+            {'label': label, 'count': totals[field], 'percent': round(100 * totals[field] / widest)}
+            for label, field in FUNNEL
+        ]
+
+        if totals['first_responses']:
+            context['avg_response_hours'] = totals['response_seconds'] / totals['first_responses'] / 3600
+
+        # Current pipeline from the counters maintained on each job
+        pipeline = Job.objects.filter(posted_by=user).aggregate(
+            **{field: Sum(field) for _, field in PIPELINE}
+        )
+        context['pipeline'] = [(label, pipeline[field] or 0) for label, field in PIPELINE]
+
+        context['top_jobs'] = (
+            JobDailyStats.objects.filter(recruiter=user, date__gte=start)
+            .values('job_id', 'job__title')
+            .annotate(applications=Sum('applications'), interviews=Sum('interviews'),
+                      offers=Sum('offers'), hires=Sum('hires'))
+            .order_by('-applications', 'job_id')[:10]
+        )
+        context.update(days=days, periods=PERIODS, start=start, totals=totals, series=series)
+        return context
@@ -1,6 +1,19 @@
 from django.contrib import admin
 from django.utils.html import format_html
-from .models import Application
+from . import transitions
+from .models import Application, ApplicationStatusChange
+
+
+class StatusChangeInline(admin.TabularInline):
+    model = ApplicationStatusChange
+    fields = ['from_status', 'to_status', 'changed_by', 'changed_at']
+    readonly_fields = fields
+    extra = 0
+    can_delete = False
+
+    def has_add_permission(self, request, obj=None):
+        return False
+
 
 @admin.register(Application)
 class ApplicationAdmin(admin.ModelAdmin):
@@ -44,6 +57,8 @@ class ApplicationAdmin(admin.ModelAdmin):
         })
     )
     
+    inlines = [StatusChangeInline]
+
     actions = ['mark_under_review', 'mark_interviewed', 'mark_rejected']
     
     def applicant_name(self, obj):
@@ -94,20 +109,30 @@ class ApplicationAdmin(admin.ModelAdmin):
     status_badge.admin_order_field = 'status'
     
     def mark_under_review(self, request, queryset):
-        updated = queryset.update(status='review')
+        updated = transitions.transition(queryset, 'review', changed_by=request.user)
         self.message_user(request, f'{updated} applications marked as under review.')
     mark_under_review.short_description = "Mark as under review"
     
     def mark_interviewed(self, request, queryset):
-        updated = queryset.update(status='interview_completed')
+        updated = transitions.transition(queryset, 'interview_completed', changed_by=request.user)
         self.message_user(request, f'{updated} applications marked as interviewed.')
     mark_interviewed.short_description = "Mark as interviewed"
     
     def mark_rejected(self, request, queryset):
-        updated = queryset.update(status='rejected')
+        updated = transitions.transition(queryset, 'rejected', changed_by=request.user)
         self.message_user(request, f'{updated} applications marked as rejected.')
     mark_rejected.short_description = "Mark as rejected"
     
+    def save_model(self, request, obj, form, change):
+        # Status edits go through the transition service so they get history and a notification
+        status = obj.status
+        if change and 'status' in form.changed_data:
+            obj.status = form.initial['status']
+        super().save_model(request, obj, form, change)
+        if obj.status != status:
+            transitions.transition(Application.objects.filter(pk=obj.pk), status, changed_by=request.user)
+            obj.status = obj._loaded_status = status
+
     def get_queryset(self, request):
         return super().get_queryset(request).select_related(
             'job', 'job__company', 'applicant'
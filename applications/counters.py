@@ -0,0 +1,88 @@
+"""
+Denormalized application counters on Job.
+
+Every change goes through an UPDATE with F() expressions in the same
+transaction as the Application write, so concurrent applies and status
+changes never lose increments and recruiter pages read counts without joins.
+"""
+from collections import defaultdict
+
+from django.db.models import Count, F
+
+from jobs.models import Job
+
+# Application status -> Job counter field. Withdrawing deletes the application
+# (see application_deleted), so there is no withdrawn counter.
+STATUS_COUNTERS = {
+    'applied': 'applied_count',
+    'review': 'review_count',
+    'interview_scheduled': 'interview_count',
+    'interview_completed': 'interview_count',
+    'offer': 'offer_count',
+    'accepted': 'offer_count',
+    'rejected': 'rejected_count',
+}
+
+COUNTER_FIELDS = list(Job.COUNTER_FIELDS)
+
+
+def apply_deltas(job_id, deltas):
+    """Add ``deltas`` ({field: amount}) to a job's counters in one UPDATE"""
+    changes = {field: F(field) + amount for field, amount in deltas.items() if amount}
+    if changes:
+        Job.objects.filter(pk=job_id).update(**changes)
+
+
+def status_deltas(old_status, new_status, count=1):
+    """Counter changes for ``count`` applications moving from one status to another"""
+    deltas = defaultdict(int)
+    if old_status in STATUS_COUNTERS:
+        deltas[STATUS_COUNTERS[old_status]] -= count
+    if new_status in STATUS_COUNTERS:
+        deltas[STATUS_COUNTERS[new_status]] += count
+    return deltas
+
+
+def application_created(application):
+    deltas = status_deltas(None, application.status)
+    deltas['application_count'] += 1
+    apply_deltas(application.job_id, deltas)
+
+
+def application_deleted(application):
+    deltas = status_deltas(application.status, None)
+    deltas['application_count'] -= 1
+    apply_deltas(application.job_id, deltas)
+
+
+def status_changed(application, old_status):
+    if old_status != application.status:
+        apply_deltas(application.job_id, status_deltas(old_status, application.status))
+
+
+def reconcile(job_ids=None):
+    """
+    Recompute counters from the Application table. Returns the number of jobs
+    whose stored counters were wrong.
+    """
+    from .models import Application
+
+    jobs = Job.objects.all() if job_ids is None else Job.objects.filter(pk__in=job_ids)
+    applications = Application.objects.all() if job_ids is None else Application.objects.filter(job_id__in=job_ids)
+
+    actual = defaultdict(lambda: dict.fromkeys(COUNTER_FIELDS, 0))
+    for row in applications.order_by().values('job_id', 'status').annotate(n=Count('pk')):
+        counts = actual[row['job_id']]
+        counts['application_count'] += row['n']
+        if row['status'] in STATUS_COUNTERS:
+            counts[STATUS_COUNTERS[row['status']]] += row['n']
+
+    stale = []
+    for job in jobs.only('pk', *COUNTER_FIELDS).iterator(chunk_size=1000):
+        counts = actual.get(job.pk, dict.fromkeys(COUNTER_FIELDS, 0))
+        if any(getattr(job, field) != value for field, value in counts.items()):
+            for field, value in counts.items():
+                setattr(job, field, value)
+            stale.append(job)
+    Job.objects.bulk_update(stale, COUNTER_FIELDS, batch_size=500)
+    return len(stale)
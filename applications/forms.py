@@ -1,5 +1,7 @@
 from django import forms
+from django.db.models import Q
 from .models import Application
+from profiles.models import ResumeDocument
 
 class ApplicationForm(forms.ModelForm):
     class Meta:
@@ -18,4 +20,53 @@ class ApplicationForm(forms.ModelForm):
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.fields['cover_letter'].required = False  # Make it optional
\ No newline at end of file
+        self.fields['cover_letter'].required = False  # Make it optional
+
+class ApplicationFilterForm(forms.Form):
+    """Status filter, applicant search (name or resume) and sort order for a job's applications"""
+    SORT_CHOICES = (
+        ('newest', 'Newest first'),
+        ('oldest', 'Oldest first'),
+        ('name', 'Applicant name'),
+        ('status', 'Status'),
+    )
+    ORDERINGS = {
+        'newest': ['-applied_date', '-id'],
+        'oldest': ['applied_date', 'id'],
+        'name': ['applicant__last_name', 'applicant__first_name', 'applicant__username', 'id'],
+        'status': ['status', '-applied_date', '-id'],
+    }
+
+    status = forms.ChoiceField(
+        required=False,
+        choices=(('', 'All statuses'),) + Application.STATUS_CHOICES,
+        widget=forms.Select(attrs={'class': 'form-select'})
+    )
+    q = forms.CharField(
+        required=False,
+        label='Applicant',
+        widget=forms.TextInput(attrs={'placeholder': 'Search by name or resume', 'class': 'form-control'})
+    )
+    sort = forms.ChoiceField(
+        required=False,
+        choices=SORT_CHOICES,
+        widget=forms.Select(attrs={'class': 'form-select'})
+    )
+
+    def filter(self, queryset):
+        """Apply the valid filters to ``queryset`` and order it"""
+        data = self.cleaned_data if self.is_bound and self.is_valid() else {}
+        if data.get('status'):
+            queryset = queryset.filter(status=data['status'])
+        for term in (data.get('q') or '').split():
+            queryset = queryset.filter(
+                Q(applicant__first_name__icontains=term) |
+                Q(applicant__last_name__icontains=term) |
+                Q(applicant__username__icontains=term) |
+                # Extracted resume text, and the catalog skills found in it
+                Q(applicant__profile__resume_document__text__icontains=term) |
+                Q(applicant__profile__resume_document__in=ResumeDocument.objects.filter(
+                    inferred_skills__name__iexact=term,
+                ))
+            )
+        return queryset.order_by(*self.ORDERINGS[data.get('sort') or 'newest'])
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from applications import counters
+
+
+class Command(BaseCommand):
+    help = "Recompute the denormalized application counters on Job from the Application table"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--job', type=int, nargs='*', dest='job_ids', help='Only reconcile these job ids')
+
+    def handle(self, *args, **options):
+        fixed = counters.reconcile(options['job_ids'])
+        if fixed:
+            self.stdout.write(self.style.WARNING(f'Corrected counters on {fixed} jobs.'))
+        else:
+            self.stdout.write(self.style.SUCCESS('All job counters are up to date.'))
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.6 on 2026-10-18 13:03
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("applications", "0002_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ApplicationStatusChange",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("from_status", models.CharField(choices=[("applied", "Applied"), ("review", "Under Review"), ("interview_scheduled", "Interview Scheduled"), ("interview_completed", "Interview Completed"), ("offer", "Offer Extended"), ("accepted", "Accepted"), ("rejected", "Rejected"), ("withdrawn", "Withdrawn")], max_length=20)),
+                ("to_status", models.CharField(choices=[("applied", "Applied"), ("review", "Under Review"), ("interview_scheduled", "Interview Scheduled"), ("interview_completed", "Interview Completed"), ("offer", "Offer Extended"), ("accepted", "Accepted"), ("rejected", "Rejected"), ("withdrawn", "Withdrawn")], max_length=20)),
+                ("changed_at", models.DateTimeField(auto_now_add=True)),
+                ("application", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="status_changes", to="applications.application")),
+                ("changed_by", models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name="+", to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                "ordering": ["-changed_at", "-id"],
+            },
+        ),
+    ]
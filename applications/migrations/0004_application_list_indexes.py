@@ -0,0 +1,24 @@
+# Generated by Django 5.2.6 on 2026-10-18 13:14
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("applications", "0003_application_status_change"),
+        ("jobs", "0006_job_application_counters"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="application",
+            index=models.Index(fields=["job", "status", "applied_date"], name="application_job_status_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="application",
+            index=models.Index(fields=["job", "-applied_date"], name="application_job_recent_idx"),
+        ),
+    ]
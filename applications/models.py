@@ -27,6 +27,38 @@ class Application(models.Model):
     class Meta:
         unique_together = ['job', 'applicant']
         ordering = ['-applied_date']
+        indexes = [
+            # A job's applications filtered by status and paged by date (JobApplicationsView)
+            models.Index(fields=['job', 'status', 'applied_date'], name='application_job_status_idx'),
+            # ... and all of a job's applications, newest first
+            models.Index(fields=['job', '-applied_date'], name='application_job_recent_idx'),
+        ]
+
+    # Status as last read from or written to the database (see applications.signals)
+    _loaded_status = None
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_status = instance.__dict__.get('status')
+        return instance
+
+    def __str__(self):
+        return f"{self.applicant.username} - {self.job.title}"
+
+
+class ApplicationStatusChange(models.Model):
+    """History of status transitions (see applications.transitions and applications.signals)"""
+    application = models.ForeignKey(Application, on_delete=models.CASCADE, related_name='status_changes')
+    from_status = models.CharField(max_length=20, choices=Application.STATUS_CHOICES)
+    to_status = models.CharField(max_length=20, choices=Application.STATUS_CHOICES)
+    changed_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True, related_name='+'
+    )
+    changed_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['-changed_at', '-id']
 
     def __str__(self):
-        return f"{self.applicant.username} - {self.job.title}"
\ No newline at end of file
+        return f"{self.application_id}: {self.from_status} -> {self.to_status}"
@@ -0,0 +1,63 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import Signal, receiver
+from django.utils import timezone
+
+from . import counters
+from .models import Application, ApplicationStatusChange
+from notifications import events
+from notifications.tasks import create_notifications
+
+# Sent after applications change status, whether saved one at a time or moved
+# in bulk by applications.transitions. ``changes`` is a list of dicts with
+# application_id, job_id, from_status, to_status and applied_date; all of them
+# changed at ``changed_at``.
+statuses_changed = Signal()
+
+
+def status_change(application, from_status):
+    return {
+        'application_id': application.pk,
+        'job_id': application.job_id,
+        'from_status': from_status,
+        'to_status': application.status,
+        'applied_date': application.applied_date,
+    }
+
+
+def notify_status_change(application):
+    """The applicant's notification and stream event, as transition() sends them"""
+    # transitions imports this module for statuses_changed
+    from .transitions import status_notification
+
+    create_notifications([status_notification({
+        'pk': application.pk,
+        'applicant_id': application.applicant_id,
+        'job_id': application.job_id,
+        'job__title': application.job.title,
+    }, application.status)])
+    events.publish_application_status(application)
+
+
+@receiver(post_save, sender=Application)
+def update_counters_on_save(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    if created:
+        counters.application_created(instance)
+    elif instance._loaded_status is not None:
+        counters.status_changed(instance, instance._loaded_status)
+        if instance._loaded_status != instance.status:
+            ApplicationStatusChange.objects.create(
+                application=instance, from_status=instance._loaded_status, to_status=instance.status,
+            )
+            notify_status_change(instance)
+            statuses_changed.send(
+                sender=Application, changes=[status_change(instance, instance._loaded_status)],
+                changed_at=instance.last_updated or timezone.now(),
+            )
+    instance._loaded_status = instance.status
+
+
+@receiver(post_delete, sender=Application)
+def update_counters_on_delete(sender, instance, **kwargs):
+    counters.application_deleted(instance)
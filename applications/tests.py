@@ -1,3 +1,129 @@
+from django.db import DatabaseError, transaction
 from django.test import TestCase
 
-# Create your tests here.
+from . import counters, transitions
+from .models import Application, ApplicationStatusChange
+from jobs.models import Job
+from notifications.models import Notification
+from users.models import CustomUser
+
+
+class ApplicationTestData:
+    @classmethod
+    def setUpTestData(cls):
+        cls.recruiter = CustomUser.objects.create_user(
+            username='recruiter', email='recruiter@example.com', password='pass12345',
+            user_type='recruiter', profile_completed=True,
+        )
+        cls.seekers = [
+            CustomUser.objects.create_user(
+                username=f'seeker{i}', email=f'seeker{i}@example.com', password='pass12345',
+                user_type='job_seeker', profile_completed=True,
+            )
+            for i in range(4)
+        ]
+        cls.job = Job.objects.create(
+            title='Engineer', description='Build things.', requirements='Experience.',
+            company_name='Acme', location='Atlanta, GA', location_type='onsite',
+            job_type='full_time', posted_by=cls.recruiter,
+        )
+
+
+class ApplicationCounterTests(ApplicationTestData, TestCase):
+    def counts(self):
+        self.job.refresh_from_db()
+        return {field: getattr(self.job, field) for field in counters.COUNTER_FIELDS if getattr(self.job, field)}
+
+    def test_create_status_change_and_delete(self):
+        applications = [Application.objects.create(job=self.job, applicant=s) for s in self.seekers]
+        self.assertEqual(self.counts(), {'application_count': 4, 'applied_count': 4})
+
+        application = Application.objects.get(pk=applications[0].pk)
+        application.status = 'interview_scheduled'
+        application.save()
+        application.save()  # saving again without a change must not move counts twice
+        self.assertEqual(self.counts(), {'application_count': 4, 'applied_count': 3, 'interview_count': 1})
+
+        application.delete()
+        self.assertEqual(self.counts(), {'application_count': 3, 'applied_count': 3})
+
+    def test_job_edits_keep_concurrent_counts(self):
+        job = Job.objects.get(pk=self.job.pk)
+        # Someone applies while the job is being edited
+        Application.objects.create(job=self.job, applicant=self.seekers[0])
+        job.title = 'Senior Engineer'
+        job.save()
+        self.assertEqual(self.counts(), {'application_count': 1, 'applied_count': 1})
+        self.assertEqual(self.job.title, 'Senior Engineer')
+
+    def test_saving_a_deleted_job_is_an_error(self):
+        job = Job.objects.get(pk=self.job.pk)
+        Job.objects.filter(pk=job.pk).delete()
+        job.title = 'Senior Engineer'
+        with self.assertRaises(DatabaseError), transaction.atomic():
+            job.save()
+        self.assertFalse(Job.objects.filter(pk=job.pk).exists())
+
+        job.save(force_insert=True)
+        self.assertEqual(Job.objects.get(pk=job.pk).title, 'Senior Engineer')
+
+    def test_bulk_transition(self):
+        for seeker in self.seekers:
+            Application.objects.create(job=self.job, applicant=seeker)
+        Application.objects.filter(applicant=self.seekers[0]).update(status='review')
+
+        # update() bypassed the counters above, so reconcile first
+        self.assertEqual(counters.reconcile(), 1)
+        updated = transitions.transition(Application.objects.filter(job=self.job), 'rejected')
+        self.assertEqual(updated, 4)
+        self.assertEqual(self.counts(), {'application_count': 4, 'rejected_count': 4})
+        self.assertEqual(counters.reconcile(), 0)
+
+
+class StatusTransitionTests(ApplicationTestData, TestCase):
+    def test_transition_records_history_and_notifies(self):
+        applications = [Application.objects.create(job=self.job, applicant=s) for s in self.seekers]
+        Application.objects.filter(pk=applications[0].pk).update(status='review')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            updated = transitions.transition(
+                Application.objects.filter(job=self.job), 'review', changed_by=self.recruiter,
+            )
+        self.assertEqual(updated, 3)
+        self.assertEqual(Application.objects.filter(status='review').count(), 4)
+
+        history = ApplicationStatusChange.objects.filter(application__job=self.job)
+        self.assertEqual(history.count(), 3)
+        self.assertEqual({(h.from_status, h.to_status, h.changed_by_id) for h in history},
+                         {('applied', 'review', self.recruiter.pk)})
+
+        notifications = Notification.objects.filter(notification_type='application_status')
+        self.assertEqual(sorted(n.recipient_id for n in notifications), sorted(s.pk for s in self.seekers[1:]))
+        self.assertEqual(notifications[0].title, 'Application update: Engineer')
+        self.assertIn('under review', notifications[0].message)
+
+    def test_single_save_notifies_like_transition(self):
+        application = Application.objects.create(job=self.job, applicant=self.seekers[0])
+        application.status = 'offer'
+        application.save()
+
+        notification = Notification.objects.get(notification_type='application_status')
+        self.assertEqual(
+            (notification.recipient_id, notification.related_application_id, notification.title),
+            (self.seekers[0].pk, application.pk, 'Application update: Engineer'),
+        )
+        self.assertIn('offer extended', notification.message)
+        application.save()
+        self.assertEqual(Notification.objects.count(), 1)
+
+    def test_query_count_does_not_grow_with_applications(self):
+        for seeker in self.seekers[:2]:
+            Application.objects.create(job=self.job, applicant=seeker)
+        with self.assertNumQueries(10) as small:
+            transitions.transition(Application.objects.filter(job=self.job), 'rejected')
+
+        for seeker in self.seekers[2:]:
+            Application.objects.create(job=self.job, applicant=seeker)
+        with self.assertNumQueries(len(small.captured_queries)):
+            transitions.transition(Application.objects.filter(job=self.job), 'offer')
+        self.assertEqual(counters.reconcile(), 0)
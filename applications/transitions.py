@@ -0,0 +1,97 @@
+"""
+Application status transitions.
+
+transition() moves any number of applications to a new status in one
+transaction: one SELECT ... FOR UPDATE of the rows that actually change, one
+UPDATE, a bulk INSERT of ApplicationStatusChange history rows, one counter
+UPDATE per affected job and batched INSERTs of the applicants' notifications.
+One statuses_changed signal covers the whole batch (analytics rollups listen
+to it), and events for open notification streams go out once the
+transaction commits.
+The number of queries depends on the number of jobs and batches, never on the
+number of applications, and no model save() or post_save handler runs per row.
+"""
+from collections import defaultdict
+
+from django.db import transaction
+from django.utils import timezone
+
+from . import counters
+from .models import Application, ApplicationStatusChange
+from .signals import statuses_changed
+from notifications import events
+from notifications.models import Notification
+from notifications.tasks import create_notifications
+
+STATUS_LABELS = dict(Application.STATUS_CHOICES)
+
+
+def status_notification(application, status):
+    """The applicant's notification for ``application`` (a values() row) moving to ``status``"""
+    return Notification(
+        recipient_id=application['applicant_id'],
+        notification_type='application_status',
+        title=f"Application update: {application['job__title']}",
+        message=f"Your application for {application['job__title']} is now "
+                f"{STATUS_LABELS[status].lower()}.",
+        related_job_id=application['job_id'],
+        related_application_id=application['pk'],
+    )
+
+
+def transition(queryset, status, changed_by=None, notify=True):
+    """
+    Move every application in ``queryset`` to ``status``, recording history and
+    notifying applicants. Applications already in ``status`` are left alone.
+    Returns the number of applications changed.
+    """
+    if status not in STATUS_LABELS:
+        raise ValueError(f'Unknown application status {status!r}')
+
+    with transaction.atomic():
+        rows = list(
+            queryset.exclude(status=status).order_by().select_for_update(of=('self',))
+            .values('pk', 'job_id', 'applicant_id', 'status', 'applied_date', 'job__title')
+        )
+        if not rows:
+            return 0
+
+        now = timezone.now()
+        Application.objects.filter(pk__in=[row['pk'] for row in rows]).update(status=status, last_updated=now)
+        ApplicationStatusChange.objects.bulk_create([
+            ApplicationStatusChange(
+                application_id=row['pk'], from_status=row['status'], to_status=status, changed_by=changed_by,
+            )
+            for row in rows
+        ])
+
+        per_job = defaultdict(lambda: defaultdict(int))
+        for row in rows:
+            for field, amount in counters.status_deltas(row['status'], status).items():
+                per_job[row['job_id']][field] += amount
+        for job_id, deltas in per_job.items():
+            counters.apply_deltas(job_id, deltas)
+
+        statuses_changed.send(sender=Application, changed_at=now, changes=[
+            {
+                'application_id': row['pk'],
+                'job_id': row['job_id'],
+                'from_status': row['status'],
+                'to_status': status,
+                'applied_date': row['applied_date'],
+            }
+            for row in rows
+        ])
+
+        if notify:
+            create_notifications(status_notification(row, status) for row in rows)
+        events.publish_many(
+            (row['applicant_id'], 'application_status', {
+                'application_id': row['pk'],
+                'job_id': row['job_id'],
+                'status': status,
+                'status_display': STATUS_LABELS[status],
+            })
+            for row in rows
+        )
+    return len(rows)
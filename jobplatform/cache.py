@@ -0,0 +1,308 @@
+"""
+Two-tier caching.
+
+TieredCache is a Django cache backend that keeps a small in-process LRU (with
+a short TTL) in front of a shared backend: Redis when REDIS_URL is set, or a
+LocMemCache stand-in for development and tests. Reads are served from process
+memory when possible, writes go to both tiers, and deletes/increments drop the
+local copy, so a value changed in another worker is seen at most
+LOCAL_TIMEOUT seconds late.
+
+On top of any backend this module provides:
+
+* namespaced, versioned keys (``namespaced_key('jobs', ...)``) that are all
+  invalidated at once by ``bump_namespace('jobs')``;
+* ``get_or_compute``, a single-flight get-or-set so that only one thread or
+  process recomputes an expired value while the others wait for it.
+"""
+import pickle
+import threading
+import time
+import zlib
+from collections import Counter, OrderedDict
+
+from django.core.cache import BaseCache, cache as default_cache, caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.utils.functional import cached_property
+
+MISSING = object()
+
+# Bounded set of locks for in-process single-flight (keys hash onto a stripe)
+_stripes = [threading.Lock() for _ in range(64)]
+
+# Local tiers by TieredCache configuration. Django makes a backend instance per
+# thread (and per async context), so the LRU and its counters live here to be
+# shared by every instance in the process.
+_local_tiers = {}
+_local_tiers_lock = threading.Lock()
+
+
+class LocalLRU:
+    """Thread-safe, size-bounded in-process store with per-entry expiry"""
+
+    def __init__(self, max_entries, timeout):
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = Counter()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires, value = entry
+            if expires <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+        # Stored pickled so callers can't mutate the cached copy
+        return pickle.loads(value)
+
+    def set(self, key, value, timeout=None):
+        timeout = self.timeout if timeout is None else min(timeout, self.timeout)
+        if timeout <= 0:
+            self.delete(key)
+            return
+        value = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._data[key] = (time.monotonic() + timeout, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            return self._data.pop(key, None) is not None
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+    def record(self, name, count=1):
+        with self._lock:
+            self.stats[name] += count
+
+    def stats_snapshot(self):
+        with self._lock:
+            return Counter(self.stats)
+
+
+def local_tier(key, max_entries, timeout):
+    """The process-wide LocalLRU for ``key``, created on first use"""
+    with _local_tiers_lock:
+        tier = _local_tiers.get(key)
+        if tier is None:
+            tier = _local_tiers[key] = LocalLRU(max_entries, timeout)
+        return tier
+
+
+class TieredCache(BaseCache):
+    """
+    In-process LRU in front of another configured cache. The LRU and its hit
+    counters are shared by all of the process's instances of the backend.
+
+    OPTIONS: SHARED (alias of the shared cache, default 'shared'),
+    LOCAL_MAX_ENTRIES (default 1000) and LOCAL_TIMEOUT (seconds, default 5).
+    """
+
+    def __init__(self, location, params):
+        super().__init__(params)
+        options = params.get('OPTIONS', {})
+        self.shared_alias = options.get('SHARED', 'shared')
+        max_entries = options.get('LOCAL_MAX_ENTRIES', 1000)
+        local_timeout = options.get('LOCAL_TIMEOUT', 5)
+        # Caches configured alike hold the same keys, so they can share a tier
+        self.local = local_tier(
+            (location, self.shared_alias, self.key_prefix, max_entries, local_timeout), max_entries, local_timeout,
+        )
+
+    @property
+    def stats(self):
+        return self.local.stats_snapshot()
+
+    @cached_property
+    def shared(self):
+        return caches[self.shared_alias]
+
+    def local_timeout(self, timeout):
+        timeout = self._shared_timeout(timeout)
+        return self.local.timeout if timeout is None else timeout
+
+    def get(self, key, default=None, version=None):
+        local_key = self.make_and_validate_key(key, version)
+        value = self.local.get(local_key, MISSING)
+        if value is not MISSING:
+            self.local.record('local_hits')
+            return value
+        value = self.shared.get(key, MISSING, version=version)
+        if value is MISSING:
+            self.local.record('misses')
+            return default
+        self.local.record('shared_hits')
+        self.local.set(local_key, value)
+        return value
+
+    def get_many(self, keys, version=None):
+        found, remote = {}, []
+        for key in keys:
+            value = self.local.get(self.make_and_validate_key(key, version), MISSING)
+            if value is MISSING:
+                remote.append(key)
+            else:
+                found[key] = value
+        self.local.record('local_hits', len(found))
+        if remote:
+            shared = self.shared.get_many(remote, version=version)
+            for key, value in shared.items():
+                self.local.set(self.make_and_validate_key(key, version), value)
+            found.update(shared)
+            self.local.record('shared_hits', len(shared))
+            self.local.record('misses', len(remote) - len(shared))
+        return found
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self.shared.set(key, value, self._shared_timeout(timeout), version=version)
+        self.local.set(self.make_and_validate_key(key, version), value, self.local_timeout(timeout))
+        self.local.record('sets')
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        failed = self.shared.set_many(data, self._shared_timeout(timeout), version=version)
+        for key, value in data.items():
+            if key not in failed:
+                self.local.set(self.make_and_validate_key(key, version), value, self.local_timeout(timeout))
+        self.local.record('sets', len(data))
+        return failed
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        # Always decided by the shared tier, since it's used for cross-process locks
+        added = self.shared.add(key, value, self._shared_timeout(timeout), version=version)
+        if added:
+            self.local.set(self.make_and_validate_key(key, version), value, self.local_timeout(timeout))
+        return added
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        return self.shared.touch(key, self._shared_timeout(timeout), version=version)
+
+    def delete(self, key, version=None):
+        self.local.delete(self.make_and_validate_key(key, version))
+        return self.shared.delete(key, version=version)
+
+    def delete_many(self, keys, version=None):
+        for key in keys:
+            self.local.delete(self.make_and_validate_key(key, version))
+        self.shared.delete_many(keys, version=version)
+
+    def has_key(self, key, version=None):
+        return self.get(key, MISSING, version=version) is not MISSING
+
+    def incr(self, key, delta=1, version=None):
+        self.local.delete(self.make_and_validate_key(key, version))
+        return self.shared.incr(key, delta, version=version)
+
+    def clear(self):
+        self.local.clear()
+        self.shared.clear()
+
+    def close(self, **kwargs):
+        self.shared.close(**kwargs)
+
+    def _shared_timeout(self, timeout):
+        # Resolve our own default here so the shared tier doesn't apply its own
+        return self.default_timeout if timeout is DEFAULT_TIMEOUT else timeout
+
+
+def cache_stats(cache=None):
+    """Hit/miss counters of a TieredCache since the process started, with the hit rate"""
+    cache = cache or default_cache
+    stats = dict(getattr(cache, 'stats', {}))
+    lookups = stats.get('local_hits', 0) + stats.get('shared_hits', 0) + stats.get('misses', 0)
+    if lookups:
+        stats['hit_rate'] = round(1 - stats.get('misses', 0) / lookups, 4)
+    return stats
+
+
+def get_or_compute(key, compute, timeout=DEFAULT_TIMEOUT, cache=None, lock_timeout=30, wait=5.0):
+    """
+    Return the cached value for ``key``, computing and storing it on a miss.
+
+    Only one caller recomputes a missing key at a time: threads of this
+    process queue on a local lock, and other processes see the shared
+    ``<key>:lock`` entry and poll for the result for up to ``wait`` seconds
+    before computing it themselves.
+    """
+    cache = cache or default_cache
+    value = cache.get(key, MISSING)
+    if value is not MISSING:
+        return value
+
+    with _stripes[zlib.crc32(key.encode()) % len(_stripes)]:
+        value = cache.get(key, MISSING)
+        if value is not MISSING:
+            return value
+
+        lock_key = f'{key}:lock'
+        if not cache.add(lock_key, 1, lock_timeout):
+            deadline = time.monotonic() + wait
+            while time.monotonic() < deadline:
+                time.sleep(0.05)
+                value = cache.get(key, MISSING)
+                if value is not MISSING:
+                    return value
+            return compute()
+
+        try:
+            value = compute()
+            cache.set(key, value, timeout)
+        finally:
+            cache.delete(lock_key)
+        return value
+
+
+def initial_version():
+    # Seeded from the clock rather than 1, so a version lost to eviction or a
+    # cache flush never repeats one that something may still hold on to
+    return time.time_ns() // 1000
+
+
+def namespace_version(namespace, cache=None):
+    cache = cache or default_cache
+    return cache.get_or_set(f'{namespace}:version', initial_version, None)
+
+
+def namespaced_key(namespace, *parts, cache=None):
+    """``<namespace>:v<version>:<parts...>``; bumping the namespace orphans every such key"""
+    version = namespace_version(namespace, cache)
+    return ':'.join([namespace, f'v{version}'] + [str(part) for part in parts])
+
+
+def bump_namespace(namespace, cache=None):
+    cache = cache or default_cache
+    key = f'{namespace}:version'
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, initial_version(), None)
+
+
+def bump_namespace_on_change(namespace, *models):
+    """
+    Bump ``namespace`` on post_save/post_delete of ``models``; for automatic
+    many-to-many through models (e.g. ``Profile.skills.through``), on m2m_changed
+    """
+    def handler(sender, raw=False, action='post_', **kwargs):
+        if not raw and action.startswith('post_'):
+            bump_namespace(namespace)
+
+    for model in models:
+        uid = f'cache:{namespace}:{model._meta.label}'
+        if model._meta.auto_created:
+            m2m_changed.connect(handler, sender=model, weak=False, dispatch_uid=f'{uid}:m2m')
+        else:
+            post_save.connect(handler, sender=model, weak=False, dispatch_uid=f'{uid}:save')
+            post_delete.connect(handler, sender=model, weak=False, dispatch_uid=f'{uid}:delete')
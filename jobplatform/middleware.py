@@ -0,0 +1,112 @@
+"""
+Per-request SQL instrumentation.
+
+QueryInstrumentationMiddleware records every query a request runs, logs N+1
+patterns (the same statement shape repeated QUERY_NPLUS1_THRESHOLD times) with
+the line of project code that issued them, and checks the total against the
+per-URL-name limits in QUERY_BUDGETS. With QUERY_BUDGET_ENFORCE on (as in the
+budget tests) an overrun raises QueryBudgetExceeded so the test fails.
+"""
+import logging
+import re
+import time
+import traceback
+from collections import Counter
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+logger = logging.getLogger('jobplatform.queries')
+
+STRING_RE = re.compile(r"'(?:[^']|'')*'")
+NUMBER_RE = re.compile(r'\b\d+(?:\.\d+)?\b')
+IN_LIST_RE = re.compile(r'\bIN \((?:\s*(?:\?|%s)\s*,?)+\)', re.IGNORECASE)
+SPACE_RE = re.compile(r'\s+')
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+def fingerprint(sql):
+    """Reduce a statement to its shape: literals become ? and IN lists collapse"""
+    sql = STRING_RE.sub('?', sql)
+    sql = NUMBER_RE.sub('?', sql)
+    sql = IN_LIST_RE.sub('IN (...)', sql)
+    return SPACE_RE.sub(' ', sql).strip()
+
+
+def caller_location():
+    """The innermost stack frame in project code (outside Django and this module)"""
+    base_dir = str(settings.BASE_DIR)
+    for frame in reversed(traceback.extract_stack()[:-1]):
+        filename = frame.filename
+        if (filename.startswith(base_dir) and 'site-packages' not in filename
+                and not filename.endswith('jobplatform/middleware.py')):
+            return f'{filename[len(base_dir) + 1:]}:{frame.lineno} in {frame.name}'
+    return 'unknown'
+
+
+class QueryRecorder:
+    """connection.execute_wrapper hook collecting timings and statement shapes"""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.fingerprints = Counter()
+        self.locations = {}
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+            shape = fingerprint(sql)
+            self.fingerprints[shape] += 1
+            # Walking the stack is the expensive part, so only do it once a shape repeats
+            if self.fingerprints[shape] == 2:
+                self.locations[shape] = caller_location()
+
+    def repeated(self, threshold):
+        """[(fingerprint, count, location)] for shapes run at least ``threshold`` times"""
+        return [
+            (shape, count, self.locations.get(shape, 'unknown'))
+            for shape, count in self.fingerprints.most_common()
+            if count >= threshold
+        ]
+
+
+class QueryInstrumentationMiddleware:
+    """Record query count, DB time and repeated statements for each request"""
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'QUERY_INSTRUMENTATION', False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        recorder = QueryRecorder()
+        with connections['default'].execute_wrapper(recorder):
+            response = self.get_response(request)
+
+        request.query_stats = recorder
+        url_name = request.resolver_match.view_name if request.resolver_match else None
+
+        threshold = getattr(settings, 'QUERY_NPLUS1_THRESHOLD', 5)
+        for shape, count, location in recorder.repeated(threshold):
+            logger.warning('Possible N+1 on %s (%s): %d x %s at %s', request.path, url_name, count, shape, location)
+
+        budget = getattr(settings, 'QUERY_BUDGETS', {}).get(url_name)
+        if budget is not None and recorder.count > budget:
+            message = f'{url_name} ran {recorder.count} queries (budget {budget}) for {request.path}'
+            if getattr(settings, 'QUERY_BUDGET_ENFORCE', False):
+                raise QueryBudgetExceeded(message)
+            logger.warning(message)
+
+        if settings.DEBUG:
+            response['X-DB-Queries'] = str(recorder.count)
+            response['X-DB-Time-Ms'] = f'{recorder.duration * 1000:.1f}'
+        return response
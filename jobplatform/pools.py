@@ -0,0 +1,78 @@
+"""
+Process pools for CPU-heavy work done by the background worker.
+
+Parsing resumes and decoding images run third-party code on uploaded files,
+which can be slow, hang or crash the interpreter. WorkerPool runs such
+functions in a lazily started pool of processes, sized by a setting (0 runs
+them in the calling process), and waits for each result at most a timeout
+setting's seconds. When a call times out or a child dies, the pool's
+processes are killed and the next call starts a fresh pool, so a stuck child
+can't keep spinning the CPU or hold up the worker's exit.
+"""
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from django.conf import settings
+
+
+def kill_pool(pool):
+    """Kill a ProcessPoolExecutor's processes, including one busy with a task"""
+    if hasattr(pool, 'kill_workers'):
+        # Python 3.14+
+        pool.kill_workers()
+    else:
+        processes = list((pool._processes or {}).values())
+        for process in processes:
+            process.kill()
+        for process in processes:
+            process.join(5)
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+class WorkerPool:
+    def __init__(self, workers_setting, timeout_setting, default_workers=2, default_timeout=60):
+        self.workers_setting = workers_setting
+        self.timeout_setting = timeout_setting
+        self.default_workers = default_workers
+        self.default_timeout = default_timeout
+        self._pool = None
+        self._lock = threading.Lock()
+
+    def run(self, func, *args):
+        """``func(*args)`` in one of the pool's processes"""
+        workers = getattr(settings, self.workers_setting, self.default_workers)
+        if not workers:
+            return func(*args)
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=workers)
+            pool = self._pool
+        try:
+            return pool.submit(func, *args).result(
+                timeout=getattr(settings, self.timeout_setting, self.default_timeout),
+            )
+        except (BrokenProcessPool, TimeoutError):
+            with self._lock:
+                if self._pool is pool:
+                    self._pool = None
+            kill_pool(pool)
+            raise
+
+    def shutdown(self):
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown()
+
+
+def path_or_content(storage, name):
+    """
+    The local path of a stored file, or for remote storage its content, as
+    something that can be sent to a pool process
+    """
+    try:
+        return storage.path(name)
+    except NotImplementedError:
+        with storage.open(name, 'rb') as f:
+            return f.read()
@@ -14,6 +14,8 @@ INSTALLED_APPS = [
     'django.contrib.contenttypes',
     'django.contrib.sessions',
     'django.contrib.messages',
+    # Lets runserver serve static files through WhiteNoise too, as in production
+    'whitenoise.runserver_nostatic',
     'django.contrib.staticfiles',
     'django.contrib.sites',
     # Third-party
@@ -30,10 +32,14 @@ INSTALLED_APPS = [
     'applications',
     'companies',
     'notifications',
+    'analytics',
+    'thumbnails',
 ]
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'whitenoise.middleware.WhiteNoiseMiddleware',
+    'jobplatform.middleware.QueryInstrumentationMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -41,7 +47,7 @@ MIDDLEWARE = [
     'allauth.account.middleware.AccountMiddleware',  # ← ADD THIS LINE
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
-    # 'users.middleware.ProfileCompletionMiddleware',
+    'users.middleware.ProfileCompletionMiddleware',
 ]
 
 ROOT_URLCONF = 'jobplatform.urls'
@@ -57,6 +63,7 @@ TEMPLATES = [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
+                'notifications.context_processors.unread_notifications',
             ],
         },
     },
@@ -64,12 +71,147 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'jobplatform.wsgi.application'
 
-# Database - Start with SQLite, migrate to PostgreSQL later
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+# Database: SQLite by default (local development, tests). Set
+# DATABASE_ENGINE=postgresql and the DB_* variables in production.
+DATABASE_ENGINE = config('DATABASE_ENGINE', default='sqlite')
+if DATABASE_ENGINE == 'postgresql':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': config('DB_NAME', default='jobplatform'),
+            'USER': config('DB_USER', default='jobplatform'),
+            'PASSWORD': config('DB_PASSWORD', default=''),
+            'HOST': config('DB_HOST', default='localhost'),
+            'PORT': config('DB_PORT', default='5432'),
+            # Reuse each worker's connection across requests, checking it is
+            # still alive before the first query of a request
+            'CONN_MAX_AGE': config('DB_CONN_MAX_AGE', default=600, cast=int),
+            'CONN_HEALTH_CHECKS': True,
+            'OPTIONS': {
+                'connect_timeout': config('DB_CONNECT_TIMEOUT', default=5, cast=int),
+                'application_name': 'jobplatform',
+            },
+        }
+    }
+    # Alternatively, a psycopg connection pool per process (e.g. for ASGI
+    # workers, whose requests don't reuse persistent connections); it
+    # replaces CONN_MAX_AGE
+    if config('DB_POOL', default=False, cast=bool):
+        DATABASES['default']['CONN_MAX_AGE'] = 0
+        DATABASES['default']['OPTIONS']['pool'] = {
+            'min_size': config('DB_POOL_MIN_SIZE', default=2, cast=int),
+            'max_size': config('DB_POOL_MAX_SIZE', default=10, cast=int),
+            'timeout': config('DB_POOL_TIMEOUT', default=10, cast=int),
+        }
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': BASE_DIR / 'db.sqlite3',
+        }
     }
+
+# Caching (see jobplatform/cache.py): a small per-process LRU in front of a
+# shared cache. Set REDIS_URL to share entries between workers; without it the
+# shared tier is a local-memory stand-in.
+REDIS_URL = config('REDIS_URL', default='')
+CACHES = {
+    'default': {
+        'BACKEND': 'jobplatform.cache.TieredCache',
+        'TIMEOUT': 300,
+        'OPTIONS': {
+            'SHARED': 'shared',
+            'LOCAL_MAX_ENTRIES': config('CACHE_LOCAL_MAX_ENTRIES', default=1000, cast=int),
+            'LOCAL_TIMEOUT': config('CACHE_LOCAL_TIMEOUT', default=5, cast=int),
+        },
+    },
+    'shared': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': REDIS_URL,
+        'KEY_PREFIX': 'jobplatform',
+    } if REDIS_URL else {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'shared',
+    },
+}
+
+# Job search backend (see jobs/search.py)
+JOB_SEARCH_BACKEND = config(
+    'JOB_SEARCH_BACKEND',
+    default='jobs.search.PostgresSearchBackend' if DATABASE_ENGINE == 'postgresql' else 'jobs.search.SQLiteFTSBackend',
+)
+
+# Job list result counts stop at this many rows and are shown as "N+" (0 = always exact)
+JOB_LIST_COUNT_LIMIT = config('JOB_LIST_COUNT_LIMIT', default=10000, cast=int)
+
+# Seconds to cache job list facet counts (also invalidated on every Job write)
+JOB_FACET_CACHE_TIMEOUT = config('JOB_FACET_CACHE_TIMEOUT', default=300, cast=int)
+
+# Seconds to keep rendered job cards and detail bodies (keys change on every edit)
+JOB_FRAGMENT_CACHE_TIMEOUT = config('JOB_FRAGMENT_CACHE_TIMEOUT', default=3600, cast=int)
+
+# Rows validated and inserted per transaction by jobs.feeds imports
+JOB_IMPORT_BATCH_SIZE = 1000
+
+# 'offset' (page numbers) or 'cursor' (keyset pagination on created_at, id)
+JOB_PAGINATION_MODE = config('JOB_PAGINATION_MODE', default='offset')
+
+# Notification fan-out queue (see notifications/tasks.py). Run
+# `manage.py run_notification_worker`, or set NOTIFICATION_TASKS_EAGER to run
+# tasks in-process right after the enqueuing transaction commits.
+NOTIFICATION_TASKS_EAGER = config('NOTIFICATION_TASKS_EAGER', default=False, cast=bool)
+NOTIFICATION_BATCH_SIZE = 1000
+# Failed tasks are retried after NOTIFICATION_TASK_RETRY_DELAY seconds, doubling
+# each time, until they have been attempted NOTIFICATION_TASK_MAX_ATTEMPTS times.
+# Tasks running for longer than NOTIFICATION_TASK_TIMEOUT seconds are assumed
+# to belong to a dead worker and are queued again.
+NOTIFICATION_TASK_MAX_ATTEMPTS = config('NOTIFICATION_TASK_MAX_ATTEMPTS', default=3, cast=int)
+NOTIFICATION_TASK_RETRY_DELAY = config('NOTIFICATION_TASK_RETRY_DELAY', default=30, cast=int)
+NOTIFICATION_TASK_TIMEOUT = config('NOTIFICATION_TASK_TIMEOUT', default=600, cast=int)
+NOTIFICATION_UNREAD_CACHE_TIMEOUT = 3600
+# Job seekers notified about a new posting: at most this many, scoring at least the minimum
+JOB_MATCH_NOTIFY_LIMIT = config('JOB_MATCH_NOTIFY_LIMIT', default=1000, cast=int)
+JOB_MATCH_MIN_SCORE = config('JOB_MATCH_MIN_SCORE', default=0.6, cast=float)
+
+# Server-Sent Events stream (see notifications/events.py). Only turn it on when
+# serving through ASGI (uvicorn): under WSGI every open stream would hold a
+# worker thread. Redis pub/sub reaches every worker; the local broker only
+# reaches streams held by the same process.
+NOTIFICATIONS_STREAM_ENABLED = config('NOTIFICATIONS_STREAM_ENABLED', default=False, cast=bool)
+NOTIFICATION_EVENT_BROKER = config(
+    'NOTIFICATION_EVENT_BROKER',
+    default='notifications.events.RedisBroker' if REDIS_URL else 'notifications.events.LocalBroker',
+)
+NOTIFICATION_STREAM_QUEUE_SIZE = 100
+NOTIFICATION_STREAM_HEARTBEAT = 15
+
+# Resume uploads (see profiles/resumes.py). Text is extracted by the
+# notification worker in a pool of this many processes (0 = in the worker).
+RESUME_MAX_UPLOAD_SIZE = 10 * 1024 * 1024
+RESUME_EXTRACTION_WORKERS = config('RESUME_EXTRACTION_WORKERS', default=2, cast=int)
+RESUME_EXTRACTION_TIMEOUT = 60
+
+# Image thumbnails (see thumbnails/derivatives.py), generated by the
+# notification worker in a pool of this many processes (0 = in the worker),
+# each image given at most THUMBNAIL_TIMEOUT seconds
+THUMBNAIL_SIZES = [64, 128, 256, 512]
+THUMBNAIL_FORMAT = config('THUMBNAIL_FORMAT', default='WEBP')
+THUMBNAIL_QUALITY = 80
+THUMBNAIL_WORKERS = config('THUMBNAIL_WORKERS', default=2, cast=int)
+THUMBNAIL_TIMEOUT = 60
+
+# SQL instrumentation (see jobplatform/middleware.py). Budgets are max queries
+# per URL name with a cold cache, including the session and user lookups of
+# logged-in requests.
+QUERY_INSTRUMENTATION = config('QUERY_INSTRUMENTATION', default=DEBUG, cast=bool)
+QUERY_BUDGET_ENFORCE = config('QUERY_BUDGET_ENFORCE', default=False, cast=bool)
+QUERY_NPLUS1_THRESHOLD = 5
+QUERY_BUDGETS = {
+    'jobs:job_list': 9,
+    'jobs:job_detail': 6,
+    'jobs:my_jobs': 5,
+    'jobs:job_applications': 8,
+    'applications:my_applications': 5,
 }
 
 # Password validation
@@ -90,10 +232,21 @@ DATE_INPUT_FORMATS = ['%Y-%m-%d', '%m/%d/%Y', '%m/%d/%y']  # ← ADD THIS LINE
 DATETIME_FORMAT = 'Y-m-d H:i:s'  # ← ADD THIS LINE
 TIME_FORMAT = 'H:i:s'  # ← ADD THIS LINE
 
-# Static files
+# Static files, served by WhiteNoise. Outside DEBUG, collectstatic writes
+# content-hashed copies plus .gz/.br versions of each file, and WhiteNoise
+# serves the hashed names with a one-year immutable Cache-Control.
 STATIC_URL = '/static/'
 STATICFILES_DIRS = [BASE_DIR / 'static']
 STATIC_ROOT = BASE_DIR / 'staticfiles'
+STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {
+        'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage' if DEBUG
+        else 'whitenoise.storage.CompressedManifestStaticFilesStorage',
+    },
+}
+# Seconds to cache static files whose names aren't hashed
+WHITENOISE_MAX_AGE = config('WHITENOISE_MAX_AGE', default=0 if DEBUG else 3600, cast=int)
 
 # Media files
 MEDIA_URL = '/media/'
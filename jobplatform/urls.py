@@ -12,13 +12,14 @@ urlpatterns = [
     path('accounts/', include('allauth.urls')),
     path('jobs/', include('jobs.urls')),
     path('applications/', include('applications.urls')),
+    path('notifications/', include('notifications.urls')),
+    path('analytics/', include('analytics.urls')),
     path('users/', include('users.urls')),
     path('profile-completion/', profile_completion_required, name='profile_completion'),
     path('', TemplateView.as_view(template_name='home.html'), name='home'),
     path('profiles/', include(('profiles.urls', 'profiles'), namespace='profiles')),
 ]
 
-# Serve media files in development
+# Serve media files in development (static files are served by WhiteNoise)
 if settings.DEBUG:
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
-    urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
\ No newline at end of file
+    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
\ No newline at end of file
@@ -1,5 +1,6 @@
 from django.contrib import admin
 from django.utils.html import format_html
+from . import facets
 from .models import Job
 from profiles.models import Skill
 
@@ -35,7 +36,10 @@ class JobAdmin(admin.ModelAdmin):
         'posted_by__email'
     ]
     
-    readonly_fields = ['created_at', 'updated_at', 'application_count']
+    readonly_fields = [
+        'created_at', 'updated_at', 'application_count', 'applied_count', 'review_count',
+        'interview_count', 'offer_count', 'rejected_count'
+    ]
     
     filter_horizontal = ['required_skills']
     
@@ -55,6 +59,13 @@ class JobAdmin(admin.ModelAdmin):
         ('Settings', {
             'fields': ('visa_sponsorship', 'is_active', 'application_deadline')
         }),
+        ('Applications', {
+            'fields': (
+                'application_count', 'applied_count', 'review_count', 'interview_count',
+                'offer_count', 'rejected_count'
+            ),
+            'classes': ('collapse',)
+        }),
         ('Administrative', {
             'fields': ('posted_by', 'created_at', 'updated_at'),
             'classes': ('collapse',)
@@ -89,7 +100,7 @@ class JobAdmin(admin.ModelAdmin):
     
     def application_count(self, obj):
         """Show number of applications"""
-        count = obj.applications.count()
+        count = obj.application_count
         if count > 0:
             return format_html(
                 '<a href="/admin/applications/application/?job__id__exact={}">{} applications</a>',
@@ -98,10 +109,12 @@ class JobAdmin(admin.ModelAdmin):
             )
         return "0 applications"
     application_count.short_description = "Applications"
+    application_count.admin_order_field = 'application_count'
     
     def activate_jobs(self, request, queryset):
         """Bulk action to activate jobs"""
         updated = queryset.update(is_active=True)
+        facets.invalidate()
         self.message_user(
             request, 
             f'{updated} jobs have been activated.'
@@ -111,6 +124,7 @@ class JobAdmin(admin.ModelAdmin):
     def deactivate_jobs(self, request, queryset):
         """Bulk action to deactivate jobs"""
         updated = queryset.update(is_active=False)
+        facets.invalidate()
         self.message_user(
             request, 
             f'{updated} jobs have been deactivated.'
@@ -120,6 +134,7 @@ class JobAdmin(admin.ModelAdmin):
     def mark_as_filled(self, request, queryset):
         """Mark jobs as filled (inactive)"""
         updated = queryset.update(is_active=False)
+        facets.invalidate()
         self.message_user(
             request, 
             f'{updated} jobs have been marked as filled.'
@@ -130,4 +145,4 @@ class JobAdmin(admin.ModelAdmin):
         """Optimize queryset with related objects"""
         return super().get_queryset(request).select_related(
             'company', 'posted_by'
-        ).prefetch_related('applications', 'required_skills')
\ No newline at end of file
+        )
\ No newline at end of file
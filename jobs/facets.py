@@ -0,0 +1,98 @@
+"""
+Facet counts for the job list sidebar.
+
+Every value of every filter dimension is counted in a single conditional
+aggregate over the jobs matching the non-facet filters (keyword, location,
+salary), plus one grouped query for skills. Each dimension is counted against
+the *other* selected facets only, so the sidebar shows what switching a value
+would return. Results are cached per normalized query string in the 'jobs'
+cache namespace, which is bumped on every Job write.
+"""
+import hashlib
+
+from django.conf import settings
+from django.db.models import Count, Q
+
+from .models import Job
+from jobplatform.cache import bump_namespace, get_or_compute, namespaced_key
+
+FACET_CHOICES = {
+    'job_type': Job.JOB_TYPE,
+    'location_type': Job.LOCATION_TYPE,
+    'experience_level': Job.EXPERIENCE_LEVEL,
+    'visa_sponsorship': (('yes', 'Yes'), ('no', 'No')),
+}
+
+CACHE_NAMESPACE = 'jobs'
+
+# Parameters that change the page shown but not the matching jobs
+IGNORED_PARAMS = ('page', 'cursor')
+
+
+def facet_condition(dimension, value):
+    """Return the Q object selecting jobs whose ``dimension`` equals ``value``"""
+    if dimension == 'visa_sponsorship':
+        return Q(visa_sponsorship=(value == 'yes'))
+    return Q(**{dimension: value})
+
+
+def normalize_query(params):
+    """Canonical form of a QueryDict: sorted keys and values, no empties or paging"""
+    items = []
+    for key in sorted(params.keys()):
+        if key in IGNORED_PARAMS:
+            continue
+        values = sorted(v for v in params.getlist(key) if v)
+        if values:
+            items.append((key, values))
+    return repr(items)
+
+
+def invalidate():
+    """Drop every cached facet result (called on Job writes)"""
+    bump_namespace(CACHE_NAMESPACE)
+
+
+def compute_facets(base_queryset, conditions):
+    """
+    Count jobs per facet value.
+
+    ``base_queryset`` holds the jobs matching every non-facet filter and
+    ``conditions`` maps each selected facet dimension to its Q object.
+    Returns ``{dimension: {value: count}}`` with skill counts keyed by id.
+    """
+    base = base_queryset.order_by()
+
+    aggregates = {}
+    for dimension, choices in FACET_CHOICES.items():
+        others = Q()
+        for other, condition in conditions.items():
+            if other != dimension:
+                others &= condition
+        for value, _label in choices:
+            aggregates[f'{dimension}:{value}'] = Count('pk', filter=facet_condition(dimension, value) & others)
+
+    facets = {dimension: {} for dimension in FACET_CHOICES}
+    for key, count in base.aggregate(**aggregates).items():
+        dimension, value = key.split(':', 1)
+        facets[dimension][value] = count
+
+    skill_scope = base
+    for dimension, condition in conditions.items():
+        if dimension != 'skills':
+            skill_scope = skill_scope.filter(condition)
+    rows = Job.required_skills.through.objects.filter(
+        job_id__in=skill_scope.values('pk')
+    ).values('skill_id').annotate(count=Count('job_id'))
+    facets['skills'] = {row['skill_id']: row['count'] for row in rows}
+    return facets
+
+
+def get_facets(params, base_queryset, conditions):
+    """Cached compute_facets for the request's query parameters"""
+    digest = hashlib.md5(normalize_query(params).encode()).hexdigest()
+    return get_or_compute(
+        namespaced_key(CACHE_NAMESPACE, 'facets', digest),
+        lambda: compute_facets(base_queryset, conditions),
+        getattr(settings, 'JOB_FACET_CACHE_TIMEOUT', 300),
+    )
@@ -0,0 +1,281 @@
+"""
+Bulk job import and export in CSV or JSON Lines.
+
+Feeds are read one row at a time and written in batches of ``batch_size``,
+so memory stays bounded however long the file is. A whole import is one
+transaction: a file that turns out to be unreadable partway through (bad
+encoding, broken CSV quoting) imports nothing, so it can be fixed and
+uploaded again without creating duplicates. Each row is validated with
+JobImportForm (the JobForm rules), resolving skill names against the skill
+catalog; valid rows are inserted with bulk_create and their skills with one
+bulk INSERT into the through table per batch. Invalid rows are skipped and
+reported with their line number.
+
+Exports stream the same columns back out, so an exported file can be edited
+and imported again. A job's applicants can be exported as CSV too. CSV cells
+that a spreadsheet would run as a formula are prefixed with a quote.
+"""
+import csv
+import io
+import json
+
+from django.conf import settings
+from django.db import transaction
+
+from . import facets
+from .forms import JobForm, JobImportForm
+from .models import Job
+from .search import get_search_backend
+from applications.models import Application
+from notifications.tasks import enqueue_many
+from profiles.catalog import get_catalog
+
+FIELDS = list(JobForm.Meta.fields)
+BOOLEAN_FIELDS = {'visa_sponsorship'}
+DEFAULTED_FIELDS = [
+    field for field in FIELDS
+    if field != 'required_skills' and Job._meta.get_field(field).has_default()
+]
+FORMATS = {
+    'csv': 'text/csv',
+    'jsonl': 'application/x-ndjson',
+}
+
+APPLICANT_FIELDS = ['name', 'email', 'status', 'applied_date', 'headline', 'skills']
+
+# Errors kept for the report; the rest are only counted
+MAX_REPORTED_ERRORS = 100
+
+# Text starting with one of these is run as a formula by spreadsheet apps, so
+# CSV exports prefix it with a quote (and imports drop that quote again)
+FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+
+def detect_format(filename):
+    return 'jsonl' if filename.lower().endswith(('.jsonl', '.ndjson')) else 'csv'
+
+
+def escape_cell(value):
+    """``value`` for a CSV cell, quoted if a spreadsheet would run it as a formula"""
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def unescape_cell(value):
+    if isinstance(value, str) and value.startswith("'") and value[1:].startswith(FORMULA_PREFIXES):
+        return value[1:]
+    return value
+
+
+def read_csv(stream):
+    """Yield ``(line number, row)`` from a text stream with a header row"""
+    reader = csv.DictReader(stream)
+    for row in reader:
+        yield reader.line_num, {field: unescape_cell(value) for field, value in row.items()}
+
+
+def read_jsonl(stream):
+    for line_number, line in enumerate(stream, start=1):
+        if line.strip():
+            try:
+                row = json.loads(line)
+            except ValueError as exc:
+                yield line_number, exc
+                continue
+            if isinstance(row, dict) and isinstance(row.get('required_skills'), list):
+                row['required_skills'] = ';'.join(row['required_skills'])
+            yield line_number, row
+
+
+def read_rows(stream, fmt):
+    """Parse a text stream; binary streams (uploads) are decoded as UTF-8"""
+    if not isinstance(stream, io.TextIOBase):
+        stream = io.TextIOWrapper(stream, encoding='utf-8-sig', newline='')
+    return read_csv(stream) if fmt == 'csv' else read_jsonl(stream)
+
+
+class FeedReadError(Exception):
+    """The feed could not be decoded or parsed; nothing was imported"""
+
+    def __init__(self, line_number, error):
+        self.line_number = line_number
+        self.error = error
+        super().__init__(f'Could not read the file after line {line_number}: {error}')
+
+
+def checked_rows(rows):
+    """``rows``, with decoding and CSV errors raised as FeedReadError"""
+    line_number = 0
+    rows = iter(rows)
+    while True:
+        try:
+            line_number, row = next(rows)
+        except StopIteration:
+            return
+        except (UnicodeDecodeError, csv.Error) as exc:
+            raise FeedReadError(line_number, exc) from exc
+        yield line_number, row
+
+
+class ImportResult:
+    def __init__(self):
+        self.created = 0
+        self.error_count = 0
+        self.errors = []
+
+    def add_error(self, line_number, message):
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append((line_number, message))
+
+
+def skill_lookup():
+    """{lowercase skill name: Skill} for every skill, from the skill catalog"""
+    return get_catalog().by_name
+
+
+def validate_row(row, form):
+    """Return ``(Job, skills)`` for a valid row, or an error message"""
+    if isinstance(row, Exception):
+        return f'Could not parse row: {row}'
+    if not isinstance(row, dict):
+        return 'Expected an object of job fields'
+    data = {field: '' if row.get(field) is None else row[field] for field in FIELDS}
+    # Columns left out of the feed entirely take the model default (e.g. salary_currency)
+    for field in DEFAULTED_FIELDS:
+        if field not in row:
+            data[field] = Job._meta.get_field(field).get_default()
+    if not form.rebind(data).is_valid():
+        return '; '.join(
+            f'{field}: {" ".join(errors)}' if field != '__all__' else ' '.join(errors)
+            for field, errors in form.errors.items()
+        )
+    return form.instance, form.cleaned_data['required_skills']
+
+
+def insert_batch(batch, posted_by, notify):
+    """Insert validated ``(Job, skills)`` pairs; returns the new job ids"""
+    with transaction.atomic():
+        jobs = []
+        for job, skills in batch:
+            job.posted_by = posted_by
+            # What prefetch_related would have loaded, so indexing needs no query
+            job._prefetched_objects_cache = {'required_skills': skills}
+            jobs.append(job)
+        Job.objects.bulk_create(jobs)
+
+        through = Job.required_skills.through
+        through.objects.bulk_create([
+            through(job_id=job.pk, skill_id=skill.pk)
+            for job, skills in batch
+            for skill in skills
+        ])
+
+        # bulk_create skips the signals that index jobs and notify matching seekers
+        get_search_backend().index_jobs(jobs)
+        job_ids = [job.pk for job in jobs]
+        if notify:
+            enqueue_many('new_job_match', [{'job_id': pk} for pk in job_ids])
+    return job_ids
+
+
+def import_jobs(rows, posted_by, batch_size=None, notify=True, dry_run=False):
+    """
+    Validate and insert jobs from ``(line number, row)`` pairs (see read_rows),
+    posted by ``posted_by``. Returns an ImportResult, or raises FeedReadError
+    (having imported nothing) if the feed can't be read to the end.
+    """
+    batch_size = batch_size or getattr(settings, 'JOB_IMPORT_BATCH_SIZE', 1000)
+    form = JobImportForm(skills=skill_lookup())
+    result = ImportResult()
+    batch = []
+
+    def flush():
+        if batch and not dry_run:
+            insert_batch(batch, posted_by, notify)
+        result.created += len(batch)
+        batch.clear()
+
+    with transaction.atomic():
+        for line_number, row in checked_rows(rows):
+            validated = validate_row(row, form)
+            if isinstance(validated, str):
+                result.add_error(line_number, validated)
+                continue
+            batch.append(validated)
+            if len(batch) >= batch_size:
+                flush()
+        flush()
+
+    if result.created and not dry_run:
+        facets.invalidate()
+    return result
+
+
+def export_value(job, field, fmt):
+    if field == 'required_skills':
+        names = [skill.name for skill in job.required_skills.all()]
+        return names if fmt == 'jsonl' else ';'.join(names)
+    value = getattr(job, field)
+    if field == 'application_deadline' and value is not None:
+        return value.isoformat()
+    if fmt == 'csv':
+        if field in BOOLEAN_FIELDS:
+            return 'true' if value else 'false'
+        return '' if value is None else escape_cell(value)
+    return value
+
+
+class Echo:
+    """File-like object whose write() returns the line, for csv.writer in a generator"""
+
+    def write(self, value):
+        return value
+
+
+def export_jobs(queryset, fmt, chunk_size=1000):
+    """Yield ``queryset`` as CSV or JSON Lines, ``chunk_size`` jobs in memory at a time"""
+    jobs = queryset.order_by('pk').prefetch_related('required_skills').iterator(chunk_size=chunk_size)
+    if fmt == 'csv':
+        writer = csv.writer(Echo())
+        yield writer.writerow(FIELDS)
+        for job in jobs:
+            yield writer.writerow([export_value(job, field, fmt) for field in FIELDS])
+    else:
+        for job in jobs:
+            yield json.dumps({field: export_value(job, field, fmt) for field in FIELDS}) + '\n'
+
+
+def applicant_row(application):
+    applicant = application.applicant
+    profile = getattr(applicant, 'profile', None)
+    return [escape_cell(value) for value in [
+        applicant.get_full_name() or applicant.username,
+        applicant.email,
+        application.get_status_display(),
+        application.applied_date.isoformat(),
+        profile.headline if profile else '',
+        ';'.join(skill.name for skill in profile.skills.all()) if profile else '',
+    ]]
+
+
+def export_applicants(job, chunk_size=1000):
+    """
+    Yield ``job``'s applicants as CSV lines. Applications are read
+    ``chunk_size`` at a time, with one query per chunk for profile skills.
+    """
+    applications = (
+        Application.objects.filter(job=job)
+        .select_related('applicant', 'applicant__profile')
+        .only(
+            'status', 'applied_date', 'applicant__username', 'applicant__first_name',
+            'applicant__last_name', 'applicant__email', 'applicant__profile__headline',
+        )
+        .prefetch_related('applicant__profile__skills')
+        .order_by('-applied_date', '-pk')
+    )
+    writer = csv.writer(Echo())
+    yield writer.writerow(APPLICANT_FIELDS)
+    for application in applications.iterator(chunk_size=chunk_size):
+        yield writer.writerow(applicant_row(application))
@@ -1,7 +1,31 @@
 import django_filters
 from django import forms
+from django.db.models import Count, Q
 from .models import Job
-from profiles.models import Skill
+from profiles.forms import SkillMultipleChoiceField
+
+
+def skills_condition(skill_ids, match='any'):
+    """
+    Q object selecting jobs that require any (or, with match='all', every) skill
+    in ``skill_ids``.
+
+    Written as a semi-join (``id IN (SELECT job_id FROM through ...)``) driven by
+    the through table's skill index, so matching jobs are never duplicated and
+    the wide job rows need no DISTINCT. The 'all' mode groups the through rows
+    per job and keeps jobs holding every selected skill.
+    """
+    through = Job.required_skills.through
+    skill_ids = sorted(set(int(pk) for pk in skill_ids))
+    rows = through.objects.filter(skill_id__in=skill_ids)
+    if match == 'all':
+        rows = rows.values('job_id').annotate(matched=Count('skill_id')).filter(matched=len(skill_ids))
+    return Q(pk__in=rows.values('job_id'))
+
+
+class SkillsFilter(django_filters.Filter):
+    field_class = SkillMultipleChoiceField
+
 
 class JobFilter(django_filters.FilterSet):
     title = django_filters.CharFilter(
@@ -24,12 +48,16 @@ class JobFilter(django_filters.FilterSet):
         lookup_expr='gte',
         label='Minimum Salary'
     )
-    required_skills = django_filters.ModelMultipleChoiceFilter(
-        queryset=Skill.objects.all(),
-        widget=forms.CheckboxSelectMultiple,
-        label='Required Skills'
+    required_skills = SkillsFilter(
+        label='Required Skills',
+        method='filter_required_skills'
     )
 
     class Meta:
         model = Job
-        fields = ['job_type', 'location_type', 'experience_level', 'visa_sponsorship']
\ No newline at end of file
+        fields = ['job_type', 'location_type', 'experience_level', 'visa_sponsorship']
+
+    def filter_required_skills(self, queryset, name, value):
+        if not value:
+            return queryset
+        return queryset.filter(skills_condition([skill.pk for skill in value]))
\ No newline at end of file
@@ -1,13 +1,12 @@
 from django import forms
 from django.utils import timezone
 from .models import Job
-from profiles.models import Skill
+from profiles.forms import SkillMultipleChoiceField, SkillPickerWidget
 
 
 class JobForm(forms.ModelForm):
-    required_skills = forms.ModelMultipleChoiceField(
-        queryset=Skill.objects.all().order_by('name'),
-        widget=forms.CheckboxSelectMultiple(),
+    required_skills = SkillMultipleChoiceField(
+        widget=SkillPickerWidget(attrs={'class': 'form-control'}),
         required=False,
         help_text="Select skills required for this position"
     )
@@ -116,6 +115,57 @@ class JobForm(forms.ModelForm):
         return cleaned
 
 
+class JobImportForm(JobForm):
+    """
+    JobForm for one row of an import feed (see jobs.feeds). Skills are given by
+    name, separated by semicolons, and resolved against ``skills``
+    ({lowercase name: Skill}) instead of a query per row.
+    """
+    required_skills = forms.CharField(required=False)
+
+    def __init__(self, *args, skills=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.skills = skills or {}
+
+    def rebind(self, data):
+        """
+        Validate another row with this form. Building a form deep-copies every
+        field and widget, which costs more than the validation itself, so an
+        import binds one form per feed instead of one per row.
+        """
+        self.data = data
+        self.is_bound = True
+        self.instance = self._meta.model()
+        self._errors = None
+        self._bound_fields_cache = {}
+        return self
+
+    def clean_required_skills(self):
+        names = [name.strip() for name in self.cleaned_data['required_skills'].split(';') if name.strip()]
+        unknown = [name for name in names if name.lower() not in self.skills]
+        if unknown:
+            raise forms.ValidationError(f"Unknown skills: {', '.join(unknown)}")
+        return sorted({self.skills[name.lower()] for name in names}, key=lambda skill: skill.name)
+
+
+class JobFeedUploadForm(forms.Form):
+    FORMAT_CHOICES = (
+        ('', 'Detect from file name'),
+        ('csv', 'CSV'),
+        ('jsonl', 'JSON Lines'),
+    )
+
+    file = forms.FileField(
+        widget=forms.ClearableFileInput(attrs={'class': 'form-control', 'accept': '.csv,.jsonl,.ndjson'}),
+        help_text='One job per row; the columns are the same as in an export'
+    )
+    format = forms.ChoiceField(
+        required=False,
+        choices=FORMAT_CHOICES,
+        widget=forms.Select(attrs={'class': 'form-select'})
+    )
+
+
 class JobFilterForm(forms.Form):
     q = forms.CharField(
         required=False,
@@ -158,15 +208,33 @@ class JobFilterForm(forms.Form):
         widget=forms.Select(attrs={'class': 'form-select'}),
         label='Visa Sponsorship'
     )
-    skills = forms.ModelMultipleChoiceField(
+    skills = SkillMultipleChoiceField(
         required=False,
-        queryset=Skill.objects.all().order_by('name'),
-        widget=forms.SelectMultiple(attrs={'class': 'form-select', 'size': '6'})
+        widget=SkillPickerWidget(attrs={'class': 'form-control', 'placeholder': 'Add a skill...'})
+    )
+    skills_match = forms.ChoiceField(
+        required=False,
+        choices=[('any', 'Any selected skill'), ('all', 'All selected skills')],
+        widget=forms.Select(attrs={'class': 'form-select'}),
+        label='Match'
     )
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, facets=None, **kwargs):
         super().__init__(*args, **kwargs)
         # Bind choices from model constants
         self.fields['job_type'].choices = [('', 'Any')] + list(getattr(Job, 'JOB_TYPE', []))
         self.fields['location_type'].choices = [('', 'Any')] + list(getattr(Job, 'LOCATION_TYPE', []))
-        self.fields['experience_level'].choices = [('', 'Any')] + list(getattr(Job, 'EXPERIENCE_LEVEL', []))
\ No newline at end of file
+        self.fields['experience_level'].choices = [('', 'Any')] + list(getattr(Job, 'EXPERIENCE_LEVEL', []))
+        if facets:
+            self.apply_facet_counts(facets)
+
+    def apply_facet_counts(self, facets):
+        """Append result counts from jobs.facets to each choice label"""
+        for name in ('job_type', 'location_type', 'experience_level', 'visa_sponsorship'):
+            counts = facets.get(name, {})
+            self.fields[name].choices = [
+                (value, f'{label} ({counts.get(value, 0)})' if value else label)
+                for value, label in self.fields[name].choices
+            ]
+        skill_counts = facets.get('skills', {})
+        self.fields['skills'].label_from_instance = lambda skill: f'{skill.name} ({skill_counts.get(skill.pk, 0)})'
\ No newline at end of file
@@ -0,0 +1,57 @@
+"""
+Cached HTML fragments for job postings.
+
+Job cards and the job detail body are rendered once and stored under
+``jobs:fragment:{name}:{FRAGMENT_VERSION}:{pk}:{updated_at}``. Saving a job
+moves updated_at (auto_now), and skill changes touch updated_at through the
+signal handlers, so an edited job is simply looked up under a new key and the
+old entry expires on its own. Bump FRAGMENT_VERSION when the templates change.
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import prefetch_related_objects
+from django.template.loader import render_to_string
+from django.utils import timezone
+from django.utils.safestring import mark_safe
+
+from .models import Job
+
+FRAGMENT_VERSION = 1
+
+FRAGMENTS = {
+    'card': 'jobs/job_card.html',
+    'detail': 'jobs/job_detail_body.html',
+}
+
+
+def fragment_key(name, job):
+    return f'jobs:fragment:{name}:{FRAGMENT_VERSION}:{job.pk}:{job.updated_at.timestamp():.6f}'
+
+
+def render_fragments(name, jobs):
+    """
+    Return the rendered ``name`` fragment for each job, reading all of them
+    with one cache round trip. Skills are only loaded for the jobs that miss.
+    """
+    jobs = list(jobs)
+    keys = [fragment_key(name, job) for job in jobs]
+    rendered = cache.get_many(keys)
+
+    missing = [(key, job) for key, job in zip(keys, jobs) if key not in rendered]
+    if missing:
+        prefetch_related_objects([job for _, job in missing], 'required_skills')
+        fresh = {key: render_to_string(FRAGMENTS[name], {'job': job}) for key, job in missing}
+        cache.set_many(fresh, getattr(settings, 'JOB_FRAGMENT_CACHE_TIMEOUT', 3600))
+        rendered.update(fresh)
+
+    return [mark_safe(rendered[key]) for key in keys]
+
+
+def render_fragment(name, job):
+    return render_fragments(name, [job])[0]
+
+
+def touch_jobs(job_ids):
+    """Move updated_at forward so cached fragments of these jobs are re-rendered"""
+    if job_ids:
+        Job.objects.filter(pk__in=job_ids).update(updated_at=timezone.now())
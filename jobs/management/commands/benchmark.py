@@ -0,0 +1,148 @@
+import json
+import math
+import platform
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Count
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from applications.models import Application
+from jobplatform.cache import cache_stats
+from jobs.models import Job
+from users.models import CustomUser
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers"""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class Command(BaseCommand):
+    help = (
+        "Time the hot endpoints against the current database and report p50/p95 latency "
+        "and query counts as JSON. Run seed_data first for meaningful numbers."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=20)
+        parser.add_argument('--warmup', type=int, default=2)
+        parser.add_argument('--output', help='Write the JSON report to this file instead of stdout')
+        parser.add_argument('--only', nargs='*', help='Only run scenarios whose name contains one of these')
+
+    def handle(self, *args, **options):
+        # Everything (logins, sessions, the temporary admin) is rolled back afterwards
+        with transaction.atomic():
+            scenarios = self.build_scenarios()
+            if options['only']:
+                scenarios = [s for s in scenarios if any(part in s[0] for part in options['only'])]
+            results = {
+                name: self.run_scenario(client, url, options['iterations'], options['warmup'])
+                for name, client, url in scenarios
+            }
+            transaction.set_rollback(True)
+
+        report = {
+            'timestamp': timezone.now().isoformat(),
+            'python': platform.python_version(),
+            'database': connection.vendor,
+            'iterations': options['iterations'],
+            'dataset': {
+                'jobs': Job.objects.count(),
+                'applications': Application.objects.count(),
+                'users': CustomUser.objects.count(),
+            },
+            'results': results,
+        }
+        output = json.dumps(report, indent=2)
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                f.write(output + '\n')
+            self.stderr.write(self.style.SUCCESS(f"Wrote {len(results)} results to {options['output']}"))
+        else:
+            self.stdout.write(output)
+
+    def client_for(self, user):
+        client = Client(HTTP_HOST='localhost')
+        if user is not None:
+            client.force_login(user, backend='django.contrib.auth.backends.ModelBackend')
+        return client
+
+    def build_scenarios(self):
+        recruiter = CustomUser.objects.filter(user_type='recruiter').annotate(
+            n=Count('job')
+        ).order_by('-n').first()
+        seeker = CustomUser.objects.filter(user_type='job_seeker').annotate(
+            n=Count('applications')
+        ).order_by('-n').first()
+        if recruiter is None or seeker is None:
+            raise CommandError('Need at least one recruiter and one job seeker; run seed_data first.')
+        job = Job.objects.filter(posted_by=recruiter).annotate(n=Count('applications')).order_by('-n').first()
+        if job is None:
+            raise CommandError('The busiest recruiter has no jobs; run seed_data first.')
+        admin = CustomUser.objects.create_superuser('benchmark-admin', 'benchmark-admin@example.com', None)
+
+        anonymous = self.client_for(None)
+        recruiter_client = self.client_for(recruiter)
+        seeker_client = self.client_for(seeker)
+        admin_client = self.client_for(admin)
+
+        skill_ids = list(job.required_skills.values_list('pk', flat=True)[:2])
+        skills = '&'.join(f'skills={pk}' for pk in skill_ids)
+        job_list = reverse('jobs:job_list')
+        last_page = max(1, math.ceil(Job.objects.filter(is_active=True).count() / 12))
+        return [
+            ('job_list', anonymous, job_list),
+            ('job_list:keyword', anonymous, f'{job_list}?q=engineer'),
+            ('job_list:filters', anonymous, f'{job_list}?job_type=full_time&location_type=remote&visa_sponsorship=yes'),
+            ('job_list:salary', anonymous, f'{job_list}?salary_min=80000&salary_max=150000'),
+            ('job_list:skills_any', anonymous, f'{job_list}?{skills}'),
+            ('job_list:skills_all', anonymous, f'{job_list}?{skills}&skills_match=all'),
+            ('job_list:last_page', anonymous, f'{job_list}?page={last_page}'),
+            ('job_detail', seeker_client, reverse('jobs:job_detail', args=[job.pk])),
+            ('my_jobs', recruiter_client, reverse('jobs:my_jobs')),
+            ('job_applications', recruiter_client, reverse('jobs:job_applications', args=[job.pk])),
+            ('my_applications', seeker_client, reverse('applications:my_applications')),
+            ('admin:jobs', admin_client, reverse('admin:jobs_job_changelist')),
+            ('admin:applications', admin_client, reverse('admin:applications_application_changelist')),
+            ('admin:profiles', admin_client, reverse('admin:profiles_profile_changelist')),
+            ('admin:notifications', admin_client, reverse('admin:notifications_notification_changelist')),
+        ]
+
+    def run_scenario(self, client, url, iterations, warmup):
+        for _ in range(warmup):
+            client.get(url)
+
+        timings, query_counts, db_times = [], [], []
+        status = None
+        stats_before = cache_stats()
+        for _ in range(iterations):
+            with CaptureQueriesContext(connection) as queries:
+                start = time.perf_counter()
+                response = client.get(url)
+                timings.append((time.perf_counter() - start) * 1000)
+            status = response.status_code
+            query_counts.append(len(queries.captured_queries))
+            db_times.append(sum(float(q['time']) for q in queries.captured_queries) * 1000)
+
+        stats = cache_stats()
+        hits = sum(stats.get(k, 0) - stats_before.get(k, 0) for k in ('local_hits', 'shared_hits'))
+        misses = stats.get('misses', 0) - stats_before.get('misses', 0)
+
+        return {
+            'url': url,
+            'status': status,
+            'p50_ms': round(percentile(timings, 50), 2),
+            'p95_ms': round(percentile(timings, 95), 2),
+            'mean_ms': round(statistics.mean(timings), 2),
+            'queries': max(query_counts),
+            'db_ms_p50': round(percentile(db_times, 50), 2),
+            'cache_hit_rate': round(hits / (hits + misses), 3) if hits + misses else None,
+        }
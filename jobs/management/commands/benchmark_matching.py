@@ -0,0 +1,54 @@
+import statistics
+import time
+
+import numpy as np
+from django.core.management.base import BaseCommand
+
+from jobs.matching import CandidateIndex, LocationCodes, SkillEncoder
+from jobs.seeding import CITIES
+
+
+class Command(BaseCommand):
+    help = (
+        "Time ranking a synthetic candidate pool against one job. The pool is "
+        "generated in memory, so no database rows are needed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--profiles', type=int, default=100000)
+        parser.add_argument('--skills', type=int, default=500, help='Size of the skill catalog')
+        parser.add_argument('--skills-per-profile', type=int, default=8)
+        parser.add_argument('--job-skills', type=int, default=6)
+        parser.add_argument('--repeat', type=int, default=10)
+        parser.add_argument('--seed', type=int, default=1)
+
+    def handle(self, *args, **options):
+        rng = np.random.default_rng(options['seed'])
+        n, per_profile = options['profiles'], options['skills_per_profile']
+        skill_ids = np.arange(1, options['skills'] + 1)
+
+        start = time.perf_counter()
+        encoder = SkillEncoder(skill_ids)
+        rows = np.repeat(np.arange(n), per_profile)
+        skills = encoder.encode_rows(n, rows, rng.choice(skill_ids, size=n * per_profile))
+        salary_min = rng.integers(40, 120, size=n) * 1000.0
+        salary_min[rng.random(n) < 0.2] = np.nan
+        locations = LocationCodes()
+        codes = np.array([locations.code(city) for city in CITIES])[rng.integers(0, len(CITIES), size=n)]
+        index = CandidateIndex(
+            encoder, np.arange(1, n + 1), skills, salary_min, salary_min + 40000,
+            locations, codes, rng.random(n) < 0.7,
+        )
+        build_ms = (time.perf_counter() - start) * 1000
+
+        job_skills = rng.choice(skill_ids, size=options['job_skills'], replace=False)
+        timings = []
+        for _ in range(options['repeat']):
+            start = time.perf_counter()
+            matches = index.rank(job_skills, 80000, 120000, 'Atlanta, GA', 'hybrid', limit=50)
+            timings.append((time.perf_counter() - start) * 1000)
+
+        self.stdout.write(f'Built index of {n} profiles x {len(skill_ids)} skills in {build_ms:.0f} ms')
+        self.stdout.write(f'Ranked top {len(matches)}: {statistics.median(timings):.2f} ms median, '
+                          f'{max(timings):.2f} ms max')
+        self.stdout.write(f'Best match: {matches[0]}')
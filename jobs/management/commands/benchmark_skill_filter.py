@@ -0,0 +1,76 @@
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from jobs import seeding
+from jobs.filters import skills_condition
+from jobs.models import Job
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the old DISTINCT-join skills filter with the semi-join on a "
+        "seeded dataset. All seeded rows are rolled back afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--skills', type=int, default=500, help='Number of skills to seed')
+        parser.add_argument('--jobs', type=int, default=5000, help='Number of jobs to seed')
+        parser.add_argument('--skills-per-job', type=int, default=10)
+        parser.add_argument('--filter-skills', type=int, default=5, help='Skills selected in the filter')
+        parser.add_argument('--repeat', type=int, default=20)
+        parser.add_argument('--seed', type=int, default=1)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        with transaction.atomic():
+            skill_ids = self.seed(rng, options)
+            selected = rng.sample(skill_ids, options['filter_skills'])
+
+            def distinct_join():
+                qs = Job.objects.filter(is_active=True, required_skills__in=selected).distinct()
+                return qs.count(), list(qs.order_by('-created_at', '-id')[:12])
+
+            def semi_join():
+                qs = Job.objects.filter(is_active=True).filter(skills_condition(selected))
+                return qs.count(), list(qs.order_by('-created_at', '-id')[:12])
+
+            def semi_join_all():
+                qs = Job.objects.filter(is_active=True).filter(skills_condition(selected[:2], 'all'))
+                return qs.count(), list(qs.order_by('-created_at', '-id')[:12])
+
+            old_count, old_page = distinct_join()
+            new_count, new_page = semi_join()
+            if (old_count, old_page) != (new_count, new_page):
+                self.stderr.write(self.style.ERROR('Semi-join results differ from the DISTINCT join.'))
+
+            old_ms = self.time(distinct_join, options['repeat'])
+            new_ms = self.time(semi_join, options['repeat'])
+            all_ms = self.time(semi_join_all, options['repeat'])
+            transaction.set_rollback(True)
+
+        self.stdout.write(f"Seeded {options['jobs']} jobs, {options['skills']} skills; {old_count} jobs match.")
+        self.stdout.write(f'DISTINCT join (any):  {old_ms:8.2f} ms median')
+        self.stdout.write(f'Semi-join (any):      {new_ms:8.2f} ms median')
+        self.stdout.write(f'Semi-join (all of 2): {all_ms:8.2f} ms median')
+        self.stdout.write(self.style.SUCCESS(f'Speedup: {old_ms / new_ms:.1f}x'))
+
+    def seed(self, rng, options):
+        skill_ids = seeding.seed_skills(options['skills'], rng)
+        recruiter_ids, _ = seeding.seed_users('benchmark', 1, 0)
+        seeding.seed_jobs(
+            recruiter_ids, {}, skill_ids, options['jobs'], rng,
+            skills_per_job=options['skills_per_job'], description='Long job description. ' * 200,
+        )
+        return skill_ids
+
+    def time(self, fn, repeat):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            timings.append((time.perf_counter() - start) * 1000)
+        return statistics.median(timings)
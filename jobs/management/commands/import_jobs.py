@@ -0,0 +1,56 @@
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from jobs import feeds
+from users.models import CustomUser
+
+
+class Command(BaseCommand):
+    help = "Import jobs from a CSV or JSON Lines feed, posted by a recruiter"
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='Feed file (use - for stdin)')
+        parser.add_argument('--user', required=True, help='Username of the recruiter posting the jobs')
+        parser.add_argument('--format', choices=sorted(feeds.FORMATS), help='Defaults to the file extension')
+        parser.add_argument('--batch-size', type=int, default=None)
+        parser.add_argument('--no-notify', action='store_true', help="Don't notify matching job seekers")
+        parser.add_argument('--dry-run', action='store_true', help='Validate only')
+
+    def handle(self, *args, **options):
+        try:
+            recruiter = CustomUser.objects.get(username=options['user'], user_type='recruiter')
+        except CustomUser.DoesNotExist:
+            raise CommandError(f'No recruiter named "{options["user"]}".')
+
+        path = options['path']
+        fmt = options['format'] or feeds.detect_format(path)
+        start = time.perf_counter()
+        if path == '-':
+            result = self.run(sys.stdin, fmt, recruiter, options)
+        else:
+            try:
+                with open(path, encoding='utf-8-sig', newline='') as stream:
+                    result = self.run(stream, fmt, recruiter, options)
+            except OSError as exc:
+                raise CommandError(exc)
+        elapsed = time.perf_counter() - start
+
+        for line_number, message in result.errors:
+            self.stderr.write(f'line {line_number}: {message}')
+        if result.error_count > len(result.errors):
+            self.stderr.write(f'... and {result.error_count - len(result.errors)} more')
+        verb = 'Validated' if options['dry_run'] else 'Imported'
+        self.stdout.write(self.style.SUCCESS(
+            f'{verb} {result.created} jobs in {elapsed:.1f}s; {result.error_count} rows rejected.'
+        ))
+
+    def run(self, stream, fmt, recruiter, options):
+        try:
+            return feeds.import_jobs(
+                feeds.read_rows(stream, fmt), recruiter, batch_size=options['batch_size'],
+                notify=not options['no_notify'], dry_run=options['dry_run'],
+            )
+        except feeds.FeedReadError as exc:
+            raise CommandError(f'{exc}. No jobs were imported.')
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from jobs.models import Job
+from jobs.search import get_search_backend
+
+
+class Command(BaseCommand):
+    help = "Rebuild the job search index from scratch"
+
+    def handle(self, *args, **options):
+        backend = get_search_backend()
+        jobs = Job.objects.select_related('company').prefetch_related('required_skills')
+        count = backend.rebuild(jobs.iterator(chunk_size=500))
+        self.stdout.write(self.style.SUCCESS(f'Indexed {count} jobs with {type(backend).__name__}.'))
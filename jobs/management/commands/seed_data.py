@@ -0,0 +1,46 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from jobs import seeding
+from users.models import CustomUser
+
+
+class Command(BaseCommand):
+    help = "Generate synthetic users, profiles, companies, jobs, applications and notifications"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scale', type=float, default=1.0, help='Multiplier applied to every count')
+        parser.add_argument('--recruiters', type=int, default=20)
+        parser.add_argument('--seekers', type=int, default=500)
+        parser.add_argument('--skills', type=int, default=200)
+        parser.add_argument('--jobs', type=int, default=2000)
+        parser.add_argument('--applications-per-seeker', type=int, default=5)
+        parser.add_argument('--notifications-per-user', type=int, default=10)
+        parser.add_argument('--prefix', default='seed', help='Username prefix for generated accounts')
+        parser.add_argument('--seed', type=int, default=None, help='Random seed for reproducible data')
+
+    def handle(self, *args, **options):
+        prefix = options['prefix']
+        if CustomUser.objects.filter(username__startswith=f'{prefix}-').exists():
+            raise CommandError(f'Users with prefix "{prefix}" already exist; pick another --prefix.')
+
+        scale = options['scale']
+        start = time.perf_counter()
+        with transaction.atomic():
+            created = seeding.seed_all(
+                prefix=prefix,
+                recruiters=max(1, int(options['recruiters'] * scale)),
+                seekers=max(1, int(options['seekers'] * scale)),
+                skills=max(1, int(options['skills'] * scale)),
+                jobs=max(1, int(options['jobs'] * scale)),
+                applications_per_seeker=options['applications_per_seeker'],
+                notifications_per_user=options['notifications_per_user'],
+                seed=options['seed'],
+            )
+        elapsed = time.perf_counter() - start
+
+        for model, count in created.items():
+            self.stdout.write(f'{model:>14}: {count}')
+        self.stdout.write(self.style.SUCCESS(f'Seeded in {elapsed:.1f}s. Password for all accounts: benchmark123'))
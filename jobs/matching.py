@@ -0,0 +1,310 @@
+"""
+Job-to-candidate matching.
+
+Every skill gets a bit position, so a profile's (or job's) skills are a row of
+uint64 words in a NumPy matrix. The overlap between a job and all candidates
+is then one AND plus a popcount over the matrix, and salary fit, location and
+open_to_work are scored on parallel arrays. Candidates are scored in batches
+of BATCH_SIZE rows, keeping only the best ``limit`` of each batch.
+
+Indexes are loaded with a few flat queries and kept per process until the
+'profiles' (candidates) or 'jobs' cache namespace is bumped by a write.
+"""
+import threading
+from collections import namedtuple
+
+import numpy as np
+
+from .models import Job
+from jobplatform.cache import namespace_version
+from profiles.models import Profile, Skill
+
+# Weights of the component scores (each in 0..1) in the overall score
+WEIGHTS = {'skills': 0.6, 'salary': 0.25, 'location': 0.15}
+
+# Component score used when one side hasn't given the information
+NEUTRAL = 0.5
+
+# Partial score for a hybrid job in another city
+HYBRID_ELSEWHERE = 0.25
+
+BATCH_SIZE = 65536
+
+Match = namedtuple('Match', 'pk score skills salary location')
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+if hasattr(np, 'bitwise_count'):
+    def popcount(words):
+        """Number of set bits in each row of a uint64 matrix"""
+        return np.bitwise_count(words).sum(axis=-1, dtype=np.int64)
+else:  # NumPy < 2.0
+    def popcount(words):
+        """Number of set bits in each row of a uint64 matrix"""
+        bits = np.unpackbits(np.ascontiguousarray(words).view(np.uint8), axis=-1)
+        return bits.sum(axis=-1, dtype=np.int64)
+
+
+def location_key(location):
+    """Compare locations by city: 'Atlanta, GA' and 'atlanta' are the same place"""
+    return (location or '').split(',')[0].strip().lower()
+
+
+class SkillEncoder:
+    """Maps skill ids to bit positions in rows of uint64 words"""
+
+    def __init__(self, skill_ids):
+        self.skill_ids = np.unique(np.asarray(list(skill_ids), dtype=np.int64))
+        self.words = max(1, -(-len(self.skill_ids) // 64))
+
+    def positions(self, skill_ids):
+        """Bit positions of the known ids, and a mask of which ids were known"""
+        skill_ids = np.asarray(skill_ids, dtype=np.int64)
+        if not len(self.skill_ids):
+            return np.zeros(0, dtype=np.int64), np.zeros(len(skill_ids), dtype=bool)
+        positions = np.minimum(np.searchsorted(self.skill_ids, skill_ids), len(self.skill_ids) - 1)
+        known = self.skill_ids[positions] == skill_ids
+        return positions[known], known
+
+    def encode_rows(self, n_rows, rows, skill_ids):
+        """Matrix with bit ``skill_ids[i]`` set in row ``rows[i]``"""
+        matrix = np.zeros((n_rows, self.words), dtype=np.uint64)
+        positions, known = self.positions(skill_ids)
+        bits = np.left_shift(np.uint64(1), (positions & 63).astype(np.uint64))
+        np.bitwise_or.at(matrix, (np.asarray(rows, dtype=np.int64)[known], positions >> 6), bits)
+        return matrix
+
+    def encode(self, skill_ids):
+        skill_ids = list(skill_ids)
+        return self.encode_rows(1, np.zeros(len(skill_ids), dtype=np.int64), skill_ids)[0]
+
+
+def salary_score(job_min, job_max, pref_min, pref_max):
+    """
+    1 when the job's range meets the candidate's preferred range, falling off
+    linearly with the relative gap. Arguments broadcast; NaN means not given.
+    """
+    job_min, job_max, pref_min, pref_max = np.broadcast_arrays(
+        *(np.asarray(a, dtype=np.float64) for a in (job_min, job_max, pref_min, pref_max))
+    )
+    job_lo = np.where(np.isnan(job_min), job_max, job_min)
+    job_hi = np.where(np.isnan(job_max), job_min, job_max)
+    pref_lo = np.where(np.isnan(pref_min), 0.0, pref_min)
+    pref_hi = np.where(np.isnan(pref_max), np.inf, pref_max)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # The job pays less than the candidate's floor, or starts above their range
+        too_low = np.where(pref_lo > 0, (pref_lo - job_hi) / pref_lo, 0.0)
+        too_high = np.where(np.isfinite(pref_hi) & (job_lo > 0), (job_lo - pref_hi) / job_lo, 0.0)
+    score = 1.0 - np.clip(np.maximum(too_low, too_high), 0.0, 1.0)
+
+    unknown = np.isnan(job_lo) | (np.isnan(pref_min) & np.isnan(pref_max))
+    return np.where(unknown, NEUTRAL, score)
+
+
+def location_score(job_codes, remote, hybrid, candidate_codes):
+    """Remote jobs suit everyone; otherwise the cities must match. Code -1 means not given."""
+    job_codes, remote, hybrid, candidate_codes = np.broadcast_arrays(job_codes, remote, hybrid, candidate_codes)
+    score = np.where(job_codes == candidate_codes, 1.0, np.where(hybrid, HYBRID_ELSEWHERE, 0.0))
+    score = np.where(candidate_codes < 0, NEUTRAL, score)
+    return np.where(remote, 1.0, score)
+
+
+def combine(skills, salary, location):
+    return WEIGHTS['skills'] * skills + WEIGHTS['salary'] * salary + WEIGHTS['location'] * location
+
+
+def top_matches(pks, scores, components, limit):
+    """Best ``limit`` rows as Match tuples, highest score first (ties by pk)"""
+    order = np.lexsort((pks, -scores))[:limit]
+    return [
+        Match(int(pks[i]), round(float(scores[i]), 4), *(round(float(c[i]), 4) for c in components))
+        for i in order
+    ]
+
+
+class LocationCodes(dict):
+    """Interns location keys to small integers so they compare as arrays"""
+
+    def code(self, location):
+        key = location_key(location)
+        if not key:
+            return -1
+        return self.setdefault(key, len(self))
+
+    def lookup(self, location):
+        return self.get(location_key(location), -2)
+
+
+def nullable(values):
+    return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+
+
+class CandidateIndex:
+    """Job seeker profiles as a skill bit matrix plus salary/location arrays"""
+
+    def __init__(self, encoder, pks, skills, salary_min, salary_max, locations, location_codes, open_to_work):
+        self.encoder = encoder
+        self.pks = pks
+        self.skills = skills
+        self.salary_min = salary_min
+        self.salary_max = salary_max
+        self.locations = locations
+        self.location_codes = location_codes
+        self.open_to_work = open_to_work
+
+    def __len__(self):
+        return len(self.pks)
+
+    @classmethod
+    def from_database(cls):
+        encoder = SkillEncoder(Skill.objects.values_list('pk', flat=True))
+        rows = list(
+            Profile.objects.filter(user__user_type='job_seeker').order_by('pk').values_list(
+                'pk', 'preferred_salary_min', 'preferred_salary_max', 'location', 'open_to_work',
+            )
+        )
+        pks, salary_min, salary_max, location_names, open_to_work = zip(*rows) if rows else ([],) * 5
+        pks = np.array(pks, dtype=np.int64)
+        locations = LocationCodes()
+
+        pairs = np.array(
+            Profile.skills.through.objects.filter(profile_id__in=Profile.objects.filter(user__user_type='job_seeker'))
+            .values_list('profile_id', 'skill_id'),
+            dtype=np.int64,
+        ).reshape(-1, 2)
+        return cls(
+            encoder, pks,
+            encoder.encode_rows(len(pks), np.searchsorted(pks, pairs[:, 0]), pairs[:, 1]),
+            nullable(salary_min), nullable(salary_max), locations,
+            np.array([locations.code(name) for name in location_names], dtype=np.int64),
+            np.array(open_to_work, dtype=bool),
+        )
+
+    def rank(self, job_skill_ids, salary_min=None, salary_max=None, location='', location_type='onsite',
+             limit=50, include_closed=False):
+        """Best candidates for a job described by its skill ids, salary range and location"""
+        job_bits = self.encoder.encode(job_skill_ids)
+        required = int(popcount(job_bits[np.newaxis])[0])
+        job_code = self.locations.lookup(location)
+        remote, hybrid = location_type == 'remote', location_type == 'hybrid'
+        job_min, job_max = nullable([salary_min, salary_max])
+
+        best_pks, best_scores, best_components = [], [], []
+        for start in range(0, len(self), BATCH_SIZE):
+            batch = slice(start, start + BATCH_SIZE)
+            skills = popcount(self.skills[batch] & job_bits) / required if required else np.full(
+                len(self.pks[batch]), NEUTRAL)
+            salary = salary_score(job_min, job_max, self.salary_min[batch], self.salary_max[batch])
+            place = location_score(job_code, remote, hybrid, self.location_codes[batch])
+            scores = combine(skills, salary, place)
+            if not include_closed:
+                scores = np.where(self.open_to_work[batch], scores, -np.inf)
+
+            keep = np.argpartition(-scores, limit - 1)[:limit] if len(scores) > limit else np.arange(len(scores))
+            keep = keep[np.isfinite(scores[keep])]
+            best_pks.append(self.pks[batch][keep])
+            best_scores.append(scores[keep])
+            best_components.append([skills[keep], salary[keep], place[keep]])
+
+        if not best_pks:
+            return []
+        components = [np.concatenate([c[i] for c in best_components]) for i in range(3)]
+        return top_matches(np.concatenate(best_pks), np.concatenate(best_scores), components, limit)
+
+    def rank_for_job(self, job, limit=50, include_closed=False):
+        return self.rank(
+            list(job.required_skills.values_list('pk', flat=True)), job.salary_min, job.salary_max,
+            job.location, job.location_type, limit=limit, include_closed=include_closed,
+        )
+
+
+class JobIndex:
+    """Active jobs as a skill bit matrix plus salary/location arrays"""
+
+    def __init__(self, encoder, pks, skills, required, salary_min, salary_max, locations, location_codes,
+                 remote, hybrid):
+        self.encoder = encoder
+        self.pks = pks
+        self.skills = skills
+        self.required = required
+        self.salary_min = salary_min
+        self.salary_max = salary_max
+        self.locations = locations
+        self.location_codes = location_codes
+        self.remote = remote
+        self.hybrid = hybrid
+
+    def __len__(self):
+        return len(self.pks)
+
+    @classmethod
+    def from_database(cls):
+        encoder = SkillEncoder(Skill.objects.values_list('pk', flat=True))
+        active = Job.objects.filter(is_active=True)
+        rows = list(active.order_by('pk').values_list('pk', 'salary_min', 'salary_max', 'location', 'location_type'))
+        pks, salary_min, salary_max, location_names, location_types = zip(*rows) if rows else ([],) * 5
+        pks = np.array(pks, dtype=np.int64)
+        location_types = np.array(location_types, dtype=object)
+        locations = LocationCodes()
+
+        pairs = np.array(
+            Job.required_skills.through.objects.filter(job_id__in=active).values_list('job_id', 'skill_id'),
+            dtype=np.int64,
+        ).reshape(-1, 2)
+        skills = encoder.encode_rows(len(pks), np.searchsorted(pks, pairs[:, 0]), pairs[:, 1])
+        return cls(
+            encoder, pks, skills, popcount(skills),
+            nullable(salary_min), nullable(salary_max), locations,
+            np.array([locations.code(name) for name in location_names], dtype=np.int64),
+            location_types == 'remote', location_types == 'hybrid',
+        )
+
+    def rank(self, skill_ids, salary_min=None, salary_max=None, location='', limit=20):
+        """Best active jobs for a candidate's skills, preferred salary and location"""
+        candidate_bits = self.encoder.encode(skill_ids)
+        candidate_code = self.locations.lookup(location) if location_key(location) else -1
+        pref_min, pref_max = nullable([salary_min, salary_max])
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            skills = np.where(self.required > 0, popcount(self.skills & candidate_bits) / self.required, NEUTRAL)
+        salary = salary_score(self.salary_min, self.salary_max, pref_min, pref_max)
+        place = location_score(self.location_codes, self.remote, self.hybrid, candidate_code)
+        return top_matches(self.pks, combine(skills, salary, place), [skills, salary, place], limit)
+
+    def rank_for_profile(self, profile, limit=20):
+        return self.rank(
+            list(profile.skills.values_list('pk', flat=True)), profile.preferred_salary_min,
+            profile.preferred_salary_max, profile.location, limit=limit,
+        )
+
+
+def cached_index(name, namespace, build):
+    """Build an index once per process, rebuilding after ``namespace`` is bumped"""
+    version = namespace_version(namespace)
+    with _indexes_lock:
+        cached = _indexes.get(name)
+        if cached is None or cached[0] != version:
+            cached = _indexes[name] = (version, build())
+        return cached[1]
+
+
+def get_candidate_index():
+    # Skill renames and deletes bump 'profiles' too, so the skill bits stay valid
+    return cached_index('candidates', 'profiles', CandidateIndex.from_database)
+
+
+def get_job_index():
+    return cached_index('jobs', 'jobs', JobIndex.from_database)
+
+
+def rank_candidates(job, limit=50, include_closed=False):
+    """Best job seeker profiles for ``job`` as Match tuples (pk is the Profile id)"""
+    return get_candidate_index().rank_for_job(job, limit=limit, include_closed=include_closed)
+
+
+def rank_jobs(profile, limit=20):
+    """Best active jobs for ``profile`` as Match tuples (pk is the Job id)"""
+    return get_job_index().rank_for_profile(profile, limit=limit)
@@ -0,0 +1,48 @@
+from django.db import migrations
+
+FTS_TABLE = "jobs_job_fts"
+FIELDS = ("title", "description", "requirements", "company", "skills")
+
+
+def create_search_index(apps, schema_editor):
+    """Create and fill the FTS5 table used by jobs.search.SQLiteFTSBackend"""
+    if schema_editor.connection.vendor != "sqlite":
+        return
+
+    Job = apps.get_model("jobs", "Job")
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+            f"{', '.join(FIELDS)}, tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+        )
+        jobs = Job.objects.select_related("company").prefetch_related("required_skills")
+        for job in jobs.iterator(chunk_size=500):
+            cursor.execute(
+                f"INSERT INTO {FTS_TABLE} (rowid, {', '.join(FIELDS)}) VALUES (%s, %s, %s, %s, %s, %s)",
+                [
+                    job.pk,
+                    job.title,
+                    job.description,
+                    job.requirements,
+                    job.company.name if job.company else job.company_name,
+                    " ".join(skill.name for skill in job.required_skills.all()),
+                ],
+            )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jobs", "0003_alter_job_salary_currency"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
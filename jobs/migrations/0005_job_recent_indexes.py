@@ -0,0 +1,29 @@
+# Generated by Django 5.2.6 on 2026-10-18 12:37
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("companies", "0002_initial"),
+        ("jobs", "0004_job_search_index"),
+        ("profiles", "0002_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="job",
+            options={"ordering": ["-created_at", "-id"]},
+        ),
+        migrations.AddIndex(
+            model_name="job",
+            index=models.Index(fields=["is_active", "-created_at", "-id"], name="job_active_recent_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="job",
+            index=models.Index(fields=["posted_by", "-created_at", "-id"], name="job_poster_recent_idx"),
+        ),
+    ]
@@ -0,0 +1,77 @@
+# Generated by Django 5.2.6 on 2026-10-18 12:46
+
+from django.db import migrations, models
+from django.db.models import Count
+
+STATUS_COUNTERS = {
+    "applied": "applied_count",
+    "review": "review_count",
+    "interview_scheduled": "interview_count",
+    "interview_completed": "interview_count",
+    "offer": "offer_count",
+    "accepted": "offer_count",
+    "rejected": "rejected_count",
+    "withdrawn": "withdrawn_count",
+}
+
+
+def backfill_counters(apps, schema_editor):
+    Job = apps.get_model("jobs", "Job")
+    Application = apps.get_model("applications", "Application")
+
+    counts = {}
+    for row in Application.objects.values("job_id", "status").annotate(n=Count("pk")).order_by():
+        job_counts = counts.setdefault(row["job_id"], {"application_count": 0})
+        job_counts["application_count"] += row["n"]
+        field = STATUS_COUNTERS.get(row["status"])
+        if field:
+            job_counts[field] = job_counts.get(field, 0) + row["n"]
+    for job_id, job_counts in counts.items():
+        Job.objects.filter(pk=job_id).update(**job_counts)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("applications", "0002_initial"),
+        ("jobs", "0005_job_recent_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="job",
+            name="application_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="job",
+            name="applied_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="job",
+            name="interview_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="job",
+            name="offer_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="job",
+            name="rejected_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="job",
+            name="review_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="job",
+            name="withdrawn_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,51 @@
+from django.db import migrations
+
+# Must match jobs.search.pg_document() exactly for the planner to use the index
+DOCUMENT = " || ".join(
+    f"setweight(to_tsvector('english'::regconfig, coalesce({column}, '')), '{weight}')"
+    for column, weight in (("title", "A"), ("company_name", "B"), ("requirements", "C"), ("description", "D"))
+)
+
+INDEXES = {
+    # Full-text search (jobs.search.PostgresSearchBackend)
+    "job_search_document_idx": f"USING gin (({DOCUMENT}))",
+    # Typo-tolerant title matches (the <% operator)
+    "job_title_trgm_idx": "USING gin (title gin_trgm_ops)",
+    # icontains filters, which Django compiles to UPPER(column::text) LIKE UPPER(...)
+    "job_title_upper_trgm_idx": "USING gin ((UPPER(title::text)) gin_trgm_ops)",
+    "job_company_name_upper_trgm_idx": "USING gin ((UPPER(company_name::text)) gin_trgm_ops)",
+    "job_location_upper_trgm_idx": "USING gin ((UPPER(location::text)) gin_trgm_ops)",
+}
+
+
+def create_search_indexes(apps, schema_editor):
+    """Create the GIN indexes used by job search on PostgreSQL"""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for name, definition in INDEXES.items():
+            # CONCURRENTLY keeps the job table writable while an index builds
+            cursor.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON jobs_job {definition}")
+
+
+def drop_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        for name in INDEXES:
+            cursor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("jobs", "0006_job_application_counters"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
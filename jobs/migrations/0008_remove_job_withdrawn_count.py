@@ -0,0 +1,17 @@
+# Generated by Django 5.2.6 on 2026-10-18 14:02
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jobs", "0007_postgres_search_indexes"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="job",
+            name="withdrawn_count",
+        ),
+    ]
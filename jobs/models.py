@@ -59,10 +59,35 @@ class Job(models.Model):
     is_active = models.BooleanField(default=True)
     posted_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
     application_deadline = models.DateField(blank=True, null=True)
+
+    # Application counters, kept current by applications.counters (never edit by hand).
+    # They change through F() updates only; save() leaves them out (see below).
+    COUNTER_FIELDS = (
+        'application_count', 'applied_count', 'review_count', 'interview_count',
+        'offer_count', 'rejected_count',
+    )
+    application_count = models.IntegerField(default=0)
+    applied_count = models.IntegerField(default=0)
+    review_count = models.IntegerField(default=0)
+    interview_count = models.IntegerField(default=0)
+    offer_count = models.IntegerField(default=0)
+    rejected_count = models.IntegerField(default=0)
     
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    def save(self, *args, **kwargs):
+        # A full save of a loaded job would write back the counter values read
+        # with it, undoing concurrent F() increments. Because the save is then an
+        # UPDATE only, saving a job whose row was deleted raises DatabaseError
+        # instead of silently re-inserting it; pass force_insert=True to do that.
+        if not self._state.adding and kwargs.get('update_fields') is None and not kwargs.get('force_insert'):
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.COUNTER_FIELDS
+            ]
+        super().save(*args, **kwargs)
+
     def get_company_name(self):
         """Return company name whether from Company object or string field"""
         return self.company.name if self.company else self.company_name
@@ -74,7 +99,12 @@ class Job(models.Model):
         return f"{self.title} at {self.get_company_name()}"
 
     class Meta:
-        ordering = ['-created_at']
+        ordering = ['-created_at', '-id']
+        indexes = [
+            # Keyset pagination for public browsing and recruiters' own postings
+            models.Index(fields=['is_active', '-created_at', '-id'], name='job_active_recent_idx'),
+            models.Index(fields=['posted_by', '-created_at', '-id'], name='job_poster_recent_idx'),
+        ]
 
     def get_job_type_display(self):
         """Return human-readable job type"""
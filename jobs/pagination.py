@@ -0,0 +1,214 @@
+from datetime import datetime
+
+from django.conf import settings
+from django.core import signing
+from django.core.paginator import EmptyPage, Page, Paginator
+from django.db.models import Q
+from django.http import Http404
+from django.utils.functional import cached_property
+
+
+def capped_count(queryset, limit):
+    """
+    Count at most ``limit`` rows of ``queryset``.
+
+    Returns ``(count, is_approximate)``; past the limit the count is reported as
+    ``limit`` and flagged approximate instead of scanning the whole result set.
+    """
+    count = queryset[:limit + 1].count()
+    if count > limit:
+        return limit, True
+    return count, False
+
+
+class OpenEndedPage(Page):
+    """A page past (or at the edge of) a capped count: has_next comes from a look-ahead row"""
+
+    def __init__(self, object_list, number, paginator, has_more):
+        super().__init__(object_list, number, paginator)
+        self.has_more = has_more
+
+    def has_next(self):
+        return self.has_more
+
+    def end_index(self):
+        return self.start_index() + len(self.object_list) - 1
+
+
+class CappedCountPaginator(Paginator):
+    """
+    Paginator whose count stops at ``count_limit`` rows (see capped_count).
+    Only the displayed count is capped: when it is approximate, pages past
+    it are still served, each checking for a next page with one extra row.
+    """
+
+    def __init__(self, object_list, per_page, count_limit=None, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.count_limit = count_limit
+        self.count_is_approximate = False
+
+    @cached_property
+    def count(self):
+        if not self.count_limit or not hasattr(self.object_list, 'count'):
+            return super().count
+        count, self.count_is_approximate = capped_count(self.object_list, self.count_limit)
+        return count
+
+    def validate_number(self, number):
+        try:
+            return super().validate_number(number)
+        except EmptyPage:
+            # More rows may follow the capped count; page() finds out
+            if self.count_is_approximate and int(number) > 1:
+                return int(number)
+            raise
+
+    def page(self, number):
+        number = self.validate_number(number)
+        if not self.count_is_approximate:
+            return super().page(number)
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom:bottom + self.per_page + 1])
+        if not rows:
+            raise EmptyPage('That page contains no results')
+        return OpenEndedPage(rows[:self.per_page], number, self, has_more=len(rows) > self.per_page)
+
+
+class InvalidCursor(Exception):
+    pass
+
+
+class CursorPage:
+    """One page of a CursorPaginator, shaped like django.core.paginator.Page for templates"""
+
+    def __init__(self, object_list, paginator, next_cursor=None, previous_cursor=None):
+        self.object_list = object_list
+        self.paginator = paginator
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+class CursorPaginator:
+    """
+    Keyset paginator ordered by (created_at, id) descending.
+
+    Each page is fetched with a WHERE clause on the last row of the previous
+    page rather than an OFFSET, so page 5000 costs the same as page 1 given an
+    index on (..., created_at, id). Cursors are signed, opaque tokens.
+    """
+
+    salt = 'jobs.pagination.cursor'
+
+    def __init__(self, queryset, per_page, count_limit=None):
+        self.queryset = queryset
+        self.per_page = int(per_page)
+        self.count_limit = count_limit
+        self.count_is_approximate = False
+
+    @cached_property
+    def count(self):
+        if not self.count_limit:
+            return self.queryset.count()
+        count, self.count_is_approximate = capped_count(self.queryset.order_by(), self.count_limit)
+        return count
+
+    def encode_cursor(self, obj, direction):
+        return signing.dumps(
+            {'t': obj.created_at.isoformat(), 'i': obj.pk, 'd': direction}, salt=self.salt, compress=True
+        )
+
+    def decode_cursor(self, token):
+        try:
+            data = signing.loads(token, salt=self.salt)
+            created_at = datetime.fromisoformat(data['t'])
+            return created_at, int(data['i']), data['d']
+        except (signing.BadSignature, KeyError, TypeError, ValueError):
+            raise InvalidCursor('Invalid cursor.')
+
+    def page(self, token=None):
+        if not token:
+            rows = list(self.queryset.order_by('-created_at', '-id')[:self.per_page + 1])
+            has_more = len(rows) > self.per_page
+            rows = rows[:self.per_page]
+            return self._make_page(rows, has_next=has_more, has_previous=False)
+
+        created_at, pk, direction = self.decode_cursor(token)
+        if direction == 'n':
+            qs = self.queryset.filter(
+                Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk)
+            ).order_by('-created_at', '-id')
+        elif direction == 'p':
+            qs = self.queryset.filter(
+                Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=pk)
+            ).order_by('created_at', 'id')
+        else:
+            raise InvalidCursor('Invalid cursor.')
+
+        rows = list(qs[:self.per_page + 1])
+        has_more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+        if direction == 'p':
+            rows.reverse()
+            return self._make_page(rows, has_next=True, has_previous=has_more)
+        return self._make_page(rows, has_next=has_more, has_previous=True)
+
+    def _make_page(self, rows, has_next, has_previous):
+        next_cursor = self.encode_cursor(rows[-1], 'n') if rows and has_next else None
+        previous_cursor = self.encode_cursor(rows[0], 'p') if rows and has_previous else None
+        return CursorPage(rows, self, next_cursor=next_cursor, previous_cursor=previous_cursor)
+
+
+class CursorPaginationMixin:
+    """
+    Opt-in keyset pagination for ListViews ordered by recency.
+
+    Cursor mode is used when the JOB_PAGINATION_MODE setting is 'cursor' or the
+    request already carries a ``cursor`` parameter; otherwise the regular
+    page-number pagination applies.
+    """
+
+    cursor_param = 'cursor'
+
+    def use_cursor_pagination(self):
+        return (
+            getattr(settings, 'JOB_PAGINATION_MODE', 'offset') == 'cursor'
+            or self.cursor_param in self.request.GET
+        )
+
+    def paginate_queryset(self, queryset, page_size):
+        if not self.use_cursor_pagination():
+            return super().paginate_queryset(queryset, page_size)
+        paginator = CursorPaginator(
+            queryset, page_size, count_limit=getattr(settings, 'JOB_LIST_COUNT_LIMIT', None)
+        )
+        try:
+            page = paginator.page(self.request.GET.get(self.cursor_param))
+        except InvalidCursor:
+            raise Http404('Invalid cursor.')
+        return (paginator, page, page.object_list, page.has_other_pages())
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['cursor_mode'] = isinstance(context.get('paginator'), CursorPaginator)
+
+        # Preserve filters in pagination links
+        qd = self.request.GET.copy()
+        qd.pop('page', None)
+        qd.pop(self.cursor_param, None)
+        context['current_query'] = qd.urlencode()
+        return context
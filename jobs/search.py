@@ -0,0 +1,238 @@
+"""
+Pluggable full-text search for job postings.
+
+The active backend is chosen with the ``JOB_SEARCH_BACKEND`` setting (a dotted
+path): SQLite FTS5 by default, PostgreSQL full-text and trigram search with
+DATABASE_ENGINE=postgresql. Backends filter a Job queryset for a keyword query
+and keep their index up to date through the signal handlers in ``jobs.signals``.
+"""
+import re
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+from django.utils.module_loading import import_string
+
+TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+# Searchable columns and their BM25 weights (title matches rank highest)
+SEARCH_FIELDS = ('title', 'description', 'requirements', 'company', 'skills')
+SEARCH_WEIGHTS = (10.0, 1.0, 2.0, 5.0, 3.0)
+
+FTS_TABLE = 'jobs_job_fts'
+
+_backend = None
+
+
+def tokenize(text):
+    """Split text into lowercase word tokens"""
+    return [token.lower() for token in TOKEN_RE.findall(text or '')]
+
+
+def job_document(job):
+    """Return the searchable text of a job keyed by SEARCH_FIELDS"""
+    return {
+        'title': job.title,
+        'description': job.description,
+        'requirements': job.requirements,
+        'company': job.get_company_name() or '',
+        'skills': ' '.join(skill.name for skill in job.required_skills.all()),
+    }
+
+
+class BaseSearchBackend:
+    """Interface every search backend implements"""
+
+    # True when rank() annotates results with a ``search_rank`` (lower is better)
+    ranked = False
+
+    def search(self, queryset, query):
+        """Return ``queryset`` restricted to jobs matching ``query``"""
+        raise NotImplementedError
+
+    def rank(self, queryset, query):
+        """Annotate ``search_rank`` on an already searched queryset (no-op unless ranked)"""
+        return queryset
+
+    def index_job(self, job):
+        """Add or refresh a single job in the index"""
+
+    def index_jobs(self, jobs):
+        """Add or refresh many jobs (override when the backend can batch writes)"""
+        for job in jobs:
+            self.index_job(job)
+
+    def remove_job(self, job_id):
+        """Drop a job from the index"""
+
+    def rebuild(self, queryset):
+        """Re-index every job in ``queryset``, returning the number indexed"""
+        count = 0
+        for job in queryset:
+            self.index_job(job)
+            count += 1
+        return count
+
+
+class DatabaseSearchBackend(BaseSearchBackend):
+    """Unindexed fallback using icontains lookups"""
+
+    def search(self, queryset, query):
+        return queryset.filter(
+            Q(title__icontains=query) |
+            Q(description__icontains=query) |
+            Q(company_name__icontains=query)
+        )
+
+
+class SQLiteFTSBackend(BaseSearchBackend):
+    """Inverted index stored in an SQLite FTS5 table next to jobs_job, ranked with BM25"""
+
+    ranked = True
+
+    def match_expression(self, query):
+        """
+        Build an FTS5 MATCH expression requiring every token. The last token is
+        a prefix match so results stay useful while the user is still typing.
+        """
+        tokens = tokenize(query)
+        if not tokens:
+            return None
+        terms = ['"%s"' % token for token in tokens]
+        terms[-1] += '*'
+        return ' AND '.join(terms)
+
+    def search(self, queryset, query):
+        match = self.match_expression(query)
+        if match is None:
+            return queryset
+        # A plain semi-join, so the result can be nested in other queries (facets, counts)
+        return queryset.filter(
+            pk__in=RawSQL(f'SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s', (match,))
+        )
+
+    def rank(self, queryset, query):
+        """
+        Join the index to compute bm25() once per matching row. The join names
+        the job table directly, so only use this on the outermost query.
+        """
+        match = self.match_expression(query)
+        if match is None:
+            return queryset
+        weights = ', '.join(str(w) for w in SEARCH_WEIGHTS)
+        job_table = queryset.model._meta.db_table
+        return queryset.extra(
+            select={'search_rank': f'bm25({FTS_TABLE}, {weights})'},
+            tables=[FTS_TABLE],
+            where=[f'{FTS_TABLE} MATCH %s', f'{FTS_TABLE}.rowid = {job_table}.id'],
+            params=[match],
+        )
+
+    def index_job(self, job):
+        document = job_document(job)
+        columns = ', '.join(SEARCH_FIELDS)
+        placeholders = ', '.join(['%s'] * len(SEARCH_FIELDS))
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {FTS_TABLE} WHERE rowid = %s', [job.pk])
+            cursor.execute(
+                f'INSERT INTO {FTS_TABLE} (rowid, {columns}) VALUES (%s, {placeholders})',
+                [job.pk] + [document[field] for field in SEARCH_FIELDS],
+            )
+
+    def index_jobs(self, jobs):
+        rows = []
+        for job in jobs:
+            document = job_document(job)
+            rows.append([job.pk] + [document[field] for field in SEARCH_FIELDS])
+        if not rows:
+            return
+        columns = ', '.join(SEARCH_FIELDS)
+        placeholders = ', '.join(['%s'] * len(SEARCH_FIELDS))
+        with connection.cursor() as cursor:
+            cursor.executemany(f'DELETE FROM {FTS_TABLE} WHERE rowid = %s', [[row[0]] for row in rows])
+            cursor.executemany(f'INSERT INTO {FTS_TABLE} (rowid, {columns}) VALUES (%s, {placeholders})', rows)
+
+    def remove_job(self, job_id):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {FTS_TABLE} WHERE rowid = %s', [job_id])
+
+    def rebuild(self, queryset):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {FTS_TABLE}')
+        return super().rebuild(queryset)
+
+
+# PostgreSQL text search configuration and the weighted columns of a job's
+# searchable document. The document expression must match the one indexed by
+# migration 0007 exactly, or the planner can't use the index.
+PG_SEARCH_CONFIG = 'english'
+PG_DOCUMENT_COLUMNS = (('title', 'A'), ('company_name', 'B'), ('requirements', 'C'), ('description', 'D'))
+
+
+def pg_document(table=None):
+    """tsvector SQL for a job row; pass the table to qualify columns in joined queries"""
+    prefix = f'{table}.' if table else ''
+    return ' || '.join(
+        f"setweight(to_tsvector('{PG_SEARCH_CONFIG}'::regconfig, coalesce({prefix}{column}, '')), '{weight}')"
+        for column, weight in PG_DOCUMENT_COLUMNS
+    )
+
+
+class PostgresSearchBackend(BaseSearchBackend):
+    """
+    PostgreSQL full-text search over an expression GIN index on jobs_job, plus
+    trigram word similarity on titles (pg_trgm, also GIN indexed) so small
+    typos still find jobs. Postgres keeps both indexes current by itself.
+    """
+
+    ranked = True
+
+    def tsquery(self, query):
+        """Every token required, the last one as a prefix (as in SQLiteFTSBackend)"""
+        tokens = [part for token in tokenize(query) for part in token.split('_') if part]
+        if not tokens:
+            return None
+        return ' & '.join(tokens) + ':*'
+
+    def search(self, queryset, query):
+        tsquery = self.tsquery(query)
+        if tsquery is None:
+            return queryset
+        # A semi-join, like SQLiteFTSBackend, so the result nests in facet and count queries.
+        # Required skill names match too, as they do in the FTS5 index.
+        return queryset.filter(pk__in=RawSQL(
+            f"SELECT id FROM jobs_job WHERE {pg_document()} @@ to_tsquery('{PG_SEARCH_CONFIG}', %s) "
+            f"OR %s <%% title "
+            f"UNION SELECT js.job_id FROM jobs_job_required_skills js "
+            f"JOIN profiles_skill s ON s.id = js.skill_id "
+            f"WHERE to_tsvector('{PG_SEARCH_CONFIG}', s.name) @@ to_tsquery('{PG_SEARCH_CONFIG}', %s)",
+            (tsquery, query, tsquery),
+        ))
+
+    def rank(self, queryset, query):
+        """Text rank plus title similarity, negated so that lower is better"""
+        tsquery = self.tsquery(query)
+        if tsquery is None:
+            return queryset
+        job_table = queryset.model._meta.db_table
+        return queryset.extra(
+            select={'search_rank': (
+                f"-(ts_rank({pg_document(job_table)}, to_tsquery('{PG_SEARCH_CONFIG}', %s)) "
+                f"+ word_similarity(%s, {job_table}.title))"
+            )},
+            select_params=(tsquery, query),
+        )
+
+    def rebuild(self, queryset):
+        # Postgres maintains the indexes itself; there is nothing to re-index
+        return 0
+
+
+def get_search_backend():
+    """Return the configured search backend instance (created once per process)"""
+    global _backend
+    if _backend is None:
+        path = getattr(settings, 'JOB_SEARCH_BACKEND', 'jobs.search.SQLiteFTSBackend')
+        _backend = import_string(path)()
+    return _backend
@@ -0,0 +1,242 @@
+"""
+Synthetic data generation for load testing and benchmarks.
+
+Everything is inserted with bulk_create, so model signals do not run. Call
+finalize() afterwards to rebuild derived data (search index, counters, caches).
+"""
+import random
+from datetime import timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.utils import timezone
+
+from . import facets
+from .models import Job
+from .search import get_search_backend
+from analytics import rollups
+from applications import counters
+from applications.models import Application
+from companies.models import Company
+from jobplatform.cache import bump_namespace
+from notifications.models import Notification
+from profiles.models import Profile, Skill
+from users.models import CustomUser
+
+SKILL_CATALOG = {
+    'Programming': ['Python', 'Java', 'JavaScript', 'TypeScript', 'Go', 'Rust', 'C++', 'C#', 'Ruby', 'Kotlin', 'Swift', 'PHP', 'Scala'],
+    'Web': ['Django', 'Flask', 'React', 'Vue', 'Angular', 'Node.js', 'Spring', 'Rails', 'GraphQL', 'REST APIs'],
+    'Data': ['SQL', 'PostgreSQL', 'MySQL', 'MongoDB', 'Redis', 'Pandas', 'Spark', 'Airflow', 'Tableau', 'Excel'],
+    'Cloud': ['AWS', 'Azure', 'GCP', 'Docker', 'Kubernetes', 'Terraform', 'Linux', 'CI/CD'],
+    'ML': ['Machine Learning', 'PyTorch', 'TensorFlow', 'NLP', 'Computer Vision', 'Statistics'],
+    'Business': ['Project Management', 'Agile', 'Scrum', 'Product Management', 'Marketing', 'Sales', 'Communication'],
+}
+
+TITLES = [
+    'Software Engineer', 'Backend Developer', 'Frontend Developer', 'Full Stack Developer', 'Data Analyst',
+    'Data Scientist', 'DevOps Engineer', 'Site Reliability Engineer', 'Product Manager', 'QA Engineer',
+    'Machine Learning Engineer', 'Mobile Developer', 'Security Engineer', 'Solutions Architect', 'Technical Writer',
+]
+SENIORITY = ['Junior', '', 'Senior', 'Staff', 'Lead']
+CITIES = [
+    'Atlanta, GA', 'New York, NY', 'San Francisco, CA', 'Austin, TX', 'Seattle, WA', 'Boston, MA',
+    'Chicago, IL', 'Denver, CO', 'Raleigh, NC', 'Remote',
+]
+COMPANY_WORDS = ['Tech', 'Data', 'Cloud', 'Labs', 'Systems', 'Works', 'Digital', 'Networks', 'Analytics', 'Soft']
+WORDS = (
+    'build maintain scale design ship reliable services customers data platform team product quality '
+    'mentor collaborate performance security infrastructure analytics features roadmap testing'
+).split()
+
+STATUSES = [choice for choice, _ in Application.STATUS_CHOICES]
+STATUS_WEIGHTS = [40, 20, 8, 6, 3, 2, 18, 3]
+
+
+def paragraph(rng, sentences=6):
+    return ' '.join(
+        ' '.join(rng.choice(WORDS) for _ in range(rng.randint(8, 16))).capitalize() + '.'
+        for _ in range(sentences)
+    )
+
+
+def seed_skills(count, rng):
+    """Create up to ``count`` skills (real names first, then numbered variants); return their ids"""
+    names = [(name, category) for category, skills in SKILL_CATALOG.items() for name in skills]
+    i = 0
+    while len(names) < count:
+        category = rng.choice(list(SKILL_CATALOG))
+        names.append((f'{rng.choice(SKILL_CATALOG[category])} {i}', category))
+        i += 1
+    names = names[:count]
+    Skill.objects.bulk_create([Skill(name=n, category=c) for n, c in names], ignore_conflicts=True)
+    # bulk_create skips the signal that refreshes the skill catalog
+    bump_namespace('skills')
+    return list(Skill.objects.filter(name__in=[n for n, _ in names]).values_list('pk', flat=True))
+
+
+def seed_users(prefix, recruiters, seekers, password='benchmark123'):
+    """Create recruiter and job seeker accounts; return (recruiter_ids, seeker_ids)"""
+    hashed = make_password(password)
+    users = [
+        CustomUser(
+            username=f'{prefix}-recruiter-{i}', email=f'{prefix}-recruiter-{i}@example.com',
+            first_name='Recruiter', last_name=str(i), password=hashed,
+            user_type='recruiter', profile_completed=True,
+        )
+        for i in range(recruiters)
+    ] + [
+        CustomUser(
+            username=f'{prefix}-seeker-{i}', email=f'{prefix}-seeker-{i}@example.com',
+            first_name='Seeker', last_name=str(i), password=hashed,
+            user_type='job_seeker', profile_completed=True,
+        )
+        for i in range(seekers)
+    ]
+    CustomUser.objects.bulk_create(users, batch_size=1000)
+    qs = CustomUser.objects.filter(username__startswith=f'{prefix}-')
+    return (
+        list(qs.filter(user_type='recruiter').values_list('pk', flat=True)),
+        list(qs.filter(user_type='job_seeker').values_list('pk', flat=True)),
+    )
+
+
+def seed_companies(prefix, recruiter_ids, rng):
+    """One company per recruiter; return {recruiter_id: (company_id, name)}"""
+    companies = [
+        Company(
+            name=f'{rng.choice(COMPANY_WORDS)}{rng.choice(COMPANY_WORDS)} {prefix} {i}',
+            description=paragraph(rng, 3), location=rng.choice(CITIES),
+            employees_count=rng.choice(['1-10', '11-50', '51-200', '201-1000', '1000+']),
+            created_by_id=recruiter_id,
+        )
+        for i, recruiter_id in enumerate(recruiter_ids)
+    ]
+    Company.objects.bulk_create(companies, batch_size=1000)
+    return {
+        c.created_by_id: (c.pk, c.name)
+        for c in Company.objects.filter(created_by_id__in=recruiter_ids)
+    }
+
+
+def seed_profiles(seeker_ids, skill_ids, rng, skills_per_profile=6):
+    Profile.objects.bulk_create(
+        [
+            Profile(
+                user_id=user_id, headline=f'{rng.choice(SENIORITY)} {rng.choice(TITLES)}'.strip(),
+                bio=paragraph(rng, 3), location=rng.choice(CITIES), open_to_work=rng.random() < 0.7,
+                years_experience=rng.randint(0, 20),
+                preferred_salary_min=rng.randrange(40000, 120000, 5000),
+                preferred_salary_max=rng.randrange(120000, 220000, 5000),
+            )
+            for user_id in seeker_ids
+        ],
+        batch_size=1000,
+    )
+    through = Profile.skills.through
+    profile_ids = Profile.objects.filter(user_id__in=seeker_ids).values_list('pk', flat=True)
+    through.objects.bulk_create(
+        (
+            through(profile_id=profile_id, skill_id=skill_id)
+            for profile_id in profile_ids
+            for skill_id in rng.sample(skill_ids, min(skills_per_profile, len(skill_ids)))
+        ),
+        batch_size=5000,
+    )
+
+
+def seed_jobs(recruiter_ids, companies, skill_ids, count, rng, skills_per_job=5, days=365, description=None):
+    """Create ``count`` jobs spread over the last ``days`` days; return their ids"""
+    now = timezone.now()
+    jobs = []
+    for _ in range(count):
+        recruiter_id = rng.choice(recruiter_ids)
+        company_id, company_name = companies.get(recruiter_id, (None, 'Independent'))
+        salary_min = rng.randrange(40000, 160000, 5000)
+        jobs.append(Job(
+            title=f'{rng.choice(SENIORITY)} {rng.choice(TITLES)}'.strip(),
+            description=description or paragraph(rng, 10), requirements=description or paragraph(rng, 4),
+            benefits=paragraph(rng, 2), company_id=company_id, company_name=company_name,
+            location=rng.choice(CITIES), location_type=rng.choice(Job.LOCATION_TYPE)[0],
+            job_type=rng.choice(Job.JOB_TYPE)[0], experience_level=rng.choice(Job.EXPERIENCE_LEVEL)[0],
+            salary_min=salary_min, salary_max=salary_min + rng.randrange(10000, 60000, 5000),
+            visa_sponsorship=rng.random() < 0.3, is_active=rng.random() < 0.9, posted_by_id=recruiter_id,
+        ))
+    jobs = Job.objects.bulk_create(jobs, batch_size=1000)
+
+    # auto_now_add ignores explicit values on insert, so spread the dates afterwards
+    for job in jobs:
+        job.created_at = now - timedelta(seconds=rng.randint(0, days * 86400))
+    Job.objects.bulk_update(jobs, ['created_at'], batch_size=1000)
+
+    through = Job.required_skills.through
+    through.objects.bulk_create(
+        (
+            through(job_id=job.pk, skill_id=skill_id)
+            for job in jobs
+            for skill_id in rng.sample(skill_ids, min(skills_per_job, len(skill_ids)))
+        ),
+        batch_size=5000,
+    )
+    return [job.pk for job in jobs]
+
+
+def seed_applications(job_ids, seeker_ids, per_seeker, rng):
+    now = timezone.now()
+    applications = []
+    for seeker_id in seeker_ids:
+        for job_id in rng.sample(job_ids, min(per_seeker, len(job_ids))):
+            applications.append(Application(
+                job_id=job_id, applicant_id=seeker_id, cover_letter=paragraph(rng, 2),
+                status=rng.choices(STATUSES, STATUS_WEIGHTS)[0],
+            ))
+    applications = Application.objects.bulk_create(applications, batch_size=1000)
+    for application in applications:
+        application.applied_date = now - timedelta(seconds=rng.randint(0, 180 * 86400))
+    Application.objects.bulk_update(applications, ['applied_date'], batch_size=1000)
+    return len(applications)
+
+
+def seed_notifications(user_ids, per_user, rng):
+    types = [choice for choice, _ in Notification.NOTIFICATION_TYPES]
+    notifications = [
+        Notification(
+            recipient_id=user_id, notification_type=rng.choice(types),
+            title=' '.join(rng.choice(WORDS) for _ in range(5)).capitalize(),
+            message=paragraph(rng, 2), is_read=rng.random() < 0.6,
+        )
+        for user_id in user_ids
+        for _ in range(per_user)
+    ]
+    Notification.objects.bulk_create(notifications, batch_size=1000)
+    return len(notifications)
+
+
+def finalize():
+    """Rebuild data normally maintained by signals, which bulk_create skips"""
+    counters.reconcile()
+    rollups.rebuild()
+    jobs = Job.objects.select_related('company').prefetch_related('required_skills')
+    get_search_backend().rebuild(jobs.iterator(chunk_size=500))
+    facets.invalidate()
+
+
+def seed_all(prefix='seed', recruiters=20, seekers=500, skills=200, jobs=2000,
+             applications_per_seeker=5, notifications_per_user=10, seed=None):
+    """Generate a complete dataset and return the number of rows created per model"""
+    rng = random.Random(seed)
+    skill_ids = seed_skills(skills, rng)
+    recruiter_ids, seeker_ids = seed_users(prefix, recruiters, seekers)
+    companies = seed_companies(prefix, recruiter_ids, rng)
+    seed_profiles(seeker_ids, skill_ids, rng)
+    job_ids = seed_jobs(recruiter_ids, companies, skill_ids, jobs, rng)
+    application_count = seed_applications(job_ids, seeker_ids, applications_per_seeker, rng)
+    notification_count = seed_notifications(recruiter_ids + seeker_ids, notifications_per_user, rng)
+    finalize()
+    return {
+        'skills': len(skill_ids),
+        'users': len(recruiter_ids) + len(seeker_ids),
+        'companies': len(companies),
+        'profiles': len(seeker_ids),
+        'jobs': len(job_ids),
+        'applications': application_count,
+        'notifications': notification_count,
+    }
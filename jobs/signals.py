@@ -0,0 +1,72 @@
+from django.db.models.signals import post_save, post_delete, pre_delete, m2m_changed
+from django.dispatch import receiver
+
+from . import facets
+from .fragments import touch_jobs
+from .models import Job
+from .search import get_search_backend
+from profiles.models import Skill
+
+
+def reindex_jobs(job_ids):
+    """Refresh the search index and cached fragments for the given job ids"""
+    if not job_ids:
+        return
+    touch_jobs(job_ids)
+    backend = get_search_backend()
+    jobs = Job.objects.filter(pk__in=job_ids).select_related('company').prefetch_related('required_skills')
+    for job in jobs:
+        backend.index_job(job)
+
+
+@receiver(post_save, sender=Job)
+def index_job_on_save(sender, instance, raw=False, **kwargs):
+    """Keep the search index and facet counts in sync with job edits"""
+    if raw:
+        return
+    get_search_backend().index_job(instance)
+    facets.invalidate()
+
+
+@receiver(post_delete, sender=Job)
+def remove_job_from_index(sender, instance, **kwargs):
+    get_search_backend().remove_job(instance.pk)
+    facets.invalidate()
+
+
+@receiver(m2m_changed, sender=Job.required_skills.through)
+def index_job_skills(sender, instance, action, reverse, pk_set, **kwargs):
+    """Re-index jobs whose skill list changed (from either side of the relation)"""
+    if action.startswith('post_'):
+        facets.invalidate()
+
+    if not reverse:
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            reindex_jobs([instance.pk])
+        return
+
+    # Reverse side: ``instance`` is a Skill and pk_set holds job ids
+    if action == 'pre_clear':
+        instance._cleared_job_ids = list(instance.jobs_requiring_skill.values_list('pk', flat=True))
+    elif action in ('post_add', 'post_remove'):
+        reindex_jobs(pk_set)
+    elif action == 'post_clear':
+        reindex_jobs(getattr(instance, '_cleared_job_ids', []))
+
+
+@receiver(post_save, sender=Skill)
+def reindex_jobs_for_skill(sender, instance, created, raw=False, **kwargs):
+    """A renamed skill changes the indexed text of every job requiring it"""
+    if created or raw:
+        return
+    reindex_jobs(list(instance.jobs_requiring_skill.values_list('pk', flat=True)))
+
+
+@receiver(pre_delete, sender=Skill)
+def remember_jobs_for_skill(sender, instance, **kwargs):
+    instance._affected_job_ids = list(instance.jobs_requiring_skill.values_list('pk', flat=True))
+
+
+@receiver(post_delete, sender=Skill)
+def reindex_jobs_after_skill_delete(sender, instance, **kwargs):
+    reindex_jobs(getattr(instance, '_affected_job_ids', []))
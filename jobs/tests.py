@@ -1,3 +1,751 @@
-from django.test import TestCase
+import csv
+import io
+import json
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+from importlib import import_module
 
-# Create your tests here.
+from django.core.cache import cache, caches
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.templatetags.static import static
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from . import feeds
+from .facets import compute_facets
+from .matching import rank_candidates, rank_jobs, salary_score
+from applications.models import Application
+from jobplatform.cache import bump_namespace, get_or_compute, namespaced_key
+from jobplatform.middleware import QueryBudgetExceeded, QueryRecorder, fingerprint
+from jobplatform.pools import WorkerPool
+from .models import Job
+from .search import PostgresSearchBackend, get_search_backend, pg_document, tokenize
+from profiles.models import Profile, ResumeDocument, Skill
+from users.models import CustomUser
+
+
+def make_job(recruiter, **kwargs):
+    defaults = {
+        'title': 'Software Engineer',
+        'description': 'Build things.',
+        'requirements': 'Experience building things.',
+        'company_name': 'Acme',
+        'location': 'Atlanta, GA',
+        'location_type': 'onsite',
+        'job_type': 'full_time',
+        'experience_level': 'mid',
+        'posted_by': recruiter,
+    }
+    defaults.update(kwargs)
+    return Job.objects.create(**defaults)
+
+
+class JobSearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.recruiter = CustomUser.objects.create_user(
+            username='recruiter', email='recruiter@example.com', password='pass12345',
+            user_type='recruiter', profile_completed=True,
+        )
+        cls.python = Skill.objects.create(name='Python')
+        cls.backend_job = make_job(cls.recruiter, title='Backend Developer', description='Django APIs')
+        cls.data_job = make_job(cls.recruiter, title='Data Analyst', description='Reports with Python and SQL')
+        make_job(cls.recruiter, title='Store Manager', description='Retail operations', company_name='Shop')
+
+    def search(self, query):
+        return list(get_search_backend().search(Job.objects.all(), query))
+
+    def test_tokenize(self):
+        self.assertEqual(tokenize('Senior C++/Go-lang dev!'), ['senior', 'c', 'go', 'lang', 'dev'])
+
+    def test_title_match_ranks_above_description_match(self):
+        make_job(self.recruiter, title='Python Engineer', description='Services')
+        results = self.search('python')
+        self.assertEqual([job.title for job in results], ['Python Engineer', 'Data Analyst'])
+
+    def test_prefix_match_on_last_token(self):
+        self.assertEqual([job.title for job in self.search('backend dev')], ['Backend Developer'])
+
+    def test_skill_names_are_indexed_incrementally(self):
+        self.assertEqual(self.search('python'), [self.data_job])
+        self.backend_job.required_skills.add(self.python)
+        self.assertCountEqual(self.search('python'), [self.data_job, self.backend_job])
+
+        self.python.name = 'Golang'
+        self.python.save()
+        self.assertEqual(self.search('golang'), [self.backend_job])
+
+    def test_edits_and_deletes_update_index(self):
+        self.data_job.title = 'Machine Learning Scientist'
+        self.data_job.save()
+        self.assertEqual(self.search('machine learning'), [self.data_job])
+        self.data_job.delete()
+        self.assertEqual(self.search('machine'), [])
+
+    def test_job_list_uses_search_backend(self):
+        response = self.client.get(reverse('jobs:job_list'), {'q': 'retail'})
+        self.assertEqual([job.title for job in response.context['jobs']], ['Store Manager'])
+
+
+class PostgresSearchBackendTests(SimpleTestCase):
+    def test_tsquery_requires_every_token_and_prefixes_the_last(self):
+        backend = PostgresSearchBackend()
+        self.assertEqual(backend.tsquery('Senior C++ dev'), 'senior & c & dev:*')
+        self.assertEqual(backend.tsquery('snake_case'), 'snake & case:*')
+        self.assertIsNone(backend.tsquery('!!'))
+
+    def test_document_matches_the_indexed_expression(self):
+        migration = import_module('jobs.migrations.0007_postgres_search_indexes')
+        self.assertEqual(pg_document(), migration.DOCUMENT)
+        self.assertIn('coalesce(jobs_job.title', pg_document('jobs_job'))
+
+
+class JobListQueryTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.recruiter = CustomUser.objects.create_user(
+            username='recruiter', email='recruiter@example.com', password='pass12345',
+            user_type='recruiter', profile_completed=True,
+        )
+        cls.skills = [Skill.objects.create(name=name) for name in ('Python', 'SQL', 'Django')]
+        for i in range(30):
+            job = make_job(cls.recruiter, title=f'Python Developer {i}')
+            job.required_skills.set(cls.skills[:i % 3 + 1])
+
+    def setUp(self):
+        cache.clear()
+
+    def test_filtered_page_query_count(self):
+        params = {
+            'q': 'python', 'skills': [self.skills[0].pk, self.skills[1].pk],
+            'job_type': 'full_time', 'page': 2,
+        }
+        # COUNT, page of jobs, prefetched skills, the skill catalog and two
+        # facet queries on a cold cache
+        with self.assertNumQueries(6):
+            response = self.client.get(reverse('jobs:job_list'), params)
+        self.assertEqual(response.context['result_count'], 30)
+        self.assertEqual(len(response.context['jobs']), 12)
+
+        # Facets and the skill catalog are served from cache for the same query on another page
+        with self.assertNumQueries(3):
+            self.client.get(reverse('jobs:job_list'), dict(params, page=1))
+
+        # Repeating a page also serves every job card from cache, so no skills are loaded
+        with self.assertNumQueries(2):
+            self.client.get(reverse('jobs:job_list'), params)
+
+    def test_result_count_is_capped(self):
+        with self.settings(JOB_LIST_COUNT_LIMIT=20):
+            response = self.client.get(reverse('jobs:job_list'))
+        self.assertEqual(response.context['result_count'], 20)
+        self.assertTrue(response.context['result_count_approximate'])
+        self.assertContains(response, '20+ results')
+
+    def test_pages_past_the_capped_count_are_served(self):
+        with self.settings(JOB_LIST_COUNT_LIMIT=20):
+            response = self.client.get(reverse('jobs:job_list'), {'page': 3})
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(len(response.context['jobs']), 6)
+            self.assertFalse(response.context['page_obj'].has_next())
+            self.assertContains(response, 'Page 3<')
+
+            response = self.client.get(reverse('jobs:job_list'), {'page': 2})
+            self.assertTrue(response.context['page_obj'].has_next())
+
+            response = self.client.get(reverse('jobs:job_list'), {'page': 4})
+            self.assertEqual(response.status_code, 404)
+
+
+class JobFragmentCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.recruiter = CustomUser.objects.create_user(
+            username='recruiter', email='recruiter@example.com', password='pass12345',
+            user_type='recruiter', profile_completed=True,
+        )
+        cls.python = Skill.objects.create(name='Python')
+        cls.rust = Skill.objects.create(name='Rust')
+        cls.job = make_job(cls.recruiter, title='Backend Developer')
+        cls.job.required_skills.set([cls.python])
+
+    def setUp(self):
+        cache.clear()
+
+    def test_job_save_renders_new_card(self):
+        url = reverse('jobs:job_list')
+        self.assertContains(self.client.get(url), 'Backend Developer')
+        job = Job.objects.get(pk=self.job.pk)
+        job.title = 'Platform Engineer'
+        job.save()
+        response = self.client.get(url)
+        self.assertContains(response, 'Platform Engineer')
+        self.assertNotContains(response, 'Backend Developer')
+
+    def test_skill_changes_invalidate_card_and_detail(self):
+        list_url = reverse('jobs:job_list')
+        detail_url = reverse('jobs:job_detail', args=[self.job.pk])
+        badge = '<span class="badge bg-secondary">Rust</span>'
+        self.assertNotContains(self.client.get(list_url), badge, html=True)
+        self.assertNotContains(self.client.get(detail_url), 'Rust')
+
+        self.job.required_skills.add(self.rust)
+        self.assertContains(self.client.get(list_url), badge, html=True)
+        self.assertContains(self.client.get(detail_url), 'Rust')
+
+        self.rust.name = 'Rustlang'
+        self.rust.save()
+        self.assertContains(self.client.get(detail_url), 'Rustlang')
+
+
+class CursorPaginationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.recruiter = CustomUser.objects.create_user(
+            username='recruiter', email='recruiter@example.com', password='pass12345',
+            user_type='recruiter', profile_completed=True,
+        )
+        for i in range(30):
+            make_job(cls.recruiter, title=f'Job {i}', job_type='contract' if i % 2 else 'full_time')
+        # Identical timestamps must still page deterministically via the id tie-breaker
+        Job.objects.update(created_at=Job.objects.first().created_at)
+
+    def walk(self, params):
+        url = reverse('jobs:job_list')
+        response = self.client.get(url, dict(params, cursor=''))
+        pages = [response]
+        while response.context['page_obj'].has_next():
+            response = self.client.get(url, dict(params, cursor=response.context['page_obj'].next_cursor))
+            pages.append(response)
+        return pages
+
+    def test_walks_every_job_once_in_order(self):
+        pages = self.walk({})
+        seen = [job.pk for page in pages for job in page.context['jobs']]
+        expected = list(Job.objects.order_by('-created_at', '-id').values_list('pk', flat=True))
+        self.assertEqual(seen, expected)
+        self.assertEqual(len(pages), 3)
+        self.assertTrue(pages[0].context['cursor_mode'])
+
+    def test_previous_cursor_returns_prior_page(self):
+        pages = self.walk({})
+        previous = pages[2].context['page_obj'].previous_cursor
+        response = self.client.get(reverse('jobs:job_list'), {'cursor': previous})
+        self.assertEqual(list(response.context['jobs']), list(pages[1].context['jobs']))
+        self.assertTrue(response.context['page_obj'].has_previous())
+
+    def test_filters_are_preserved(self):
+        pages = self.walk({'job_type': 'contract'})
+        jobs = [job for page in pages for job in page.context['jobs']]
+        self.assertEqual(len(jobs), 15)
+        self.assertTrue(all(job.job_type == 'contract' for job in jobs))
+        self.assertEqual(pages[0].context['current_query'], 'job_type=contract')
+
+    def test_tampered_cursor_is_404(self):
+        response = self.client.get(reverse('jobs:job_list'), {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, 404)
+
+
+class JobFacetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.recruiter = CustomUser.objects.create_user(
+            username='recruiter', email='recruiter@example.com', password='pass12345',
+            user_type='recruiter', profile_completed=True,
+        )
+        cls.python = Skill.objects.create(name='Python')
+        cls.sql = Skill.objects.create(name='SQL')
+        make_job(cls.recruiter, job_type='full_time', location_type='remote').required_skills.set([cls.python])
+        make_job(cls.recruiter, job_type='full_time', visa_sponsorship=True).required_skills.set([cls.python, cls.sql])
+        make_job(cls.recruiter, job_type='contract', location_type='remote').required_skills.set([cls.sql])
+        make_job(cls.recruiter, job_type='contract', is_active=False)
+
+    def setUp(self):
+        cache.clear()
+
+    def test_counts_without_filters(self):
+        facets = compute_facets(Job.objects.filter(is_active=True), {})
+        self.assertEqual(facets['job_type'], {'full_time': 2, 'part_time': 0, 'contract': 1, 'internship': 0})
+        self.assertEqual(facets['location_type']['remote'], 2)
+        self.assertEqual(facets['visa_sponsorship'], {'yes': 1, 'no': 2})
+        self.assertEqual(facets['skills'], {self.python.pk: 2, self.sql.pk: 2})
+
+    def test_each_dimension_ignores_its_own_selection(self):
+        response = self.client.get(reverse('jobs:job_list'), {'job_type': 'full_time', 'location_type': 'remote'})
+        facets = response.context['facets']
+        # job_type counts apply only the location filter, and vice versa
+        self.assertEqual(facets['job_type']['contract'], 1)
+        self.assertEqual(facets['location_type'], {'remote': 1, 'onsite': 1, 'hybrid': 0})
+        self.assertEqual(facets['skills'], {self.python.pk: 1})
+        self.assertContains(response, 'Contract (1)')
+
+    def test_job_writes_invalidate_cached_counts(self):
+        url = reverse('jobs:job_list')
+        self.assertEqual(self.client.get(url).context['facets']['job_type']['internship'], 0)
+        make_job(self.recruiter, job_type='internship')
+        self.assertEqual(self.client.get(url).context['facets']['job_type']['internship'], 1)
+
+
+class SkillsFilterTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.recruiter = CustomUser.objects.create_user(
+            username='recruiter', email='recruiter@example.com', password='pass12345',
+            user_type='recruiter', profile_completed=True,
+        )
+        cls.python = Skill.objects.create(name='Python')
+        cls.sql = Skill.objects.create(name='SQL')
+        cls.both = make_job(cls.recruiter, title='Both')
+        cls.both.required_skills.set([cls.python, cls.sql])
+        cls.only_python = make_job(cls.recruiter, title='Only Python')
+        cls.only_python.required_skills.set([cls.python])
+        make_job(cls.recruiter, title='Neither')
+
+    def titles(self, **params):
+        response = self.client.get(reverse('jobs:job_list'), params)
+        return sorted(job.title for job in response.context['jobs'])
+
+    def test_any_mode_returns_each_job_once(self):
+        skills = [self.python.pk, self.sql.pk]
+        self.assertEqual(self.titles(skills=skills), ['Both', 'Only Python'])
+        self.assertEqual(self.titles(skills=skills, skills_match='any'), ['Both', 'Only Python'])
+
+    def test_all_mode_requires_every_skill(self):
+        self.assertEqual(self.titles(skills=[self.python.pk, self.sql.pk], skills_match='all'), ['Both'])
+        self.assertEqual(self.titles(skills=[self.python.pk], skills_match='all'), ['Both', 'Only Python'])
+
+
+class SeedAndBenchmarkCommandTests(TestCase):
+    def test_seed_then_benchmark(self):
+        call_command('seed_data', scale=0.02, seed=1, stdout=io.StringIO())
+        self.assertEqual(Job.objects.count(), 40)
+
+        with tempfile.NamedTemporaryFile(suffix='.json') as output:
+            call_command('benchmark', iterations=2, warmup=0, output=output.name, stderr=io.StringIO())
+            with open(output.name) as f:
+                report = json.load(f)
+        self.assertEqual(report['dataset']['jobs'], 40)
+        for name, result in report['results'].items():
+            self.assertEqual(result['status'], 200, name)
+            self.assertLessEqual(result['p50_ms'], result['p95_ms'])
+
+
+@override_settings(QUERY_INSTRUMENTATION=True, QUERY_BUDGET_ENFORCE=True)
+class QueryBudgetTests(TestCase):
+    """Every page with an entry in QUERY_BUDGETS must stay within it"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.recruiter = CustomUser.objects.create_user(
+            username='recruiter', email='recruiter@example.com', password='pass12345',
+            user_type='recruiter', profile_completed=True,
+        )
+        skills = [Skill.objects.create(name=f'Skill {i}') for i in range(5)]
+        seekers = [
+            CustomUser.objects.create_user(
+                username=f'seeker{i}', email=f'seeker{i}@example.com', password='pass12345',
+                user_type='job_seeker', profile_completed=True,
+            )
+            for i in range(15)
+        ]
+        cls.seeker = seekers[0]
+        for i in range(15):
+            job = make_job(cls.recruiter, title=f'Engineer {i}')
+            job.required_skills.set(skills)
+            for seeker in seekers:
+                Application.objects.create(job=job, applicant=seeker)
+        cls.job = job
+
+    def setUp(self):
+        cache.clear()
+
+    def get(self, user, url, params=None):
+        if user:
+            self.client.force_login(user)
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_job_list(self):
+        url = reverse('jobs:job_list')
+        self.get(None, url)
+        self.get(None, url, {'q': 'engineer', 'skills': [1, 2], 'job_type': 'full_time'})
+        self.get(self.seeker, url, {'page': 2})
+
+    def test_job_detail(self):
+        self.get(self.seeker, reverse('jobs:job_detail', args=[self.job.pk]))
+
+    def test_recruiter_pages(self):
+        self.get(self.recruiter, reverse('jobs:my_jobs'))
+        self.get(self.recruiter, reverse('jobs:job_applications', args=[self.job.pk]))
+
+    def test_my_applications(self):
+        self.get(self.seeker, reverse('applications:my_applications'))
+
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}})
+    def test_budgets_hold_with_the_cache_off(self):
+        self.test_job_list()
+        self.test_job_detail()
+        self.test_recruiter_pages()
+        self.test_my_applications()
+
+    def test_overrun_fails(self):
+        with self.settings(QUERY_BUDGETS={'jobs:job_list': 1}):
+            with self.assertRaises(QueryBudgetExceeded):
+                self.client.get(reverse('jobs:job_list'))
+
+
+class QueryRecorderTests(TestCase):
+    def test_fingerprint_collapses_literals(self):
+        self.assertEqual(
+            fingerprint("SELECT * FROM t WHERE a = 'x''y' AND b IN (1, 2, 3) LIMIT 21"),
+            'SELECT * FROM t WHERE a = ? AND b IN (...) LIMIT ?',
+        )
+
+    def test_repeated_queries_report_their_location(self):
+        recruiter = CustomUser.objects.create_user(username='r', email='r@example.com', user_type='recruiter')
+        for i in range(6):
+            make_job(recruiter, title=f'Job {i}')
+        recorder = QueryRecorder()
+        with connection.execute_wrapper(recorder):
+            for job in Job.objects.all():
+                job.required_skills.count()
+        [(shape, count, location)] = recorder.repeated(5)
+        self.assertEqual(count, 6)
+        self.assertIn('jobs/tests.py', location)
+
+
+class MatchingTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.recruiter = CustomUser.objects.create_user(
+            username='recruiter', email='recruiter@example.com', password='pass12345',
+            user_type='recruiter', profile_completed=True,
+        )
+        cls.python, cls.sql, cls.go = [Skill.objects.create(name=name) for name in ('Python', 'SQL', 'Go')]
+        cls.job = make_job(cls.recruiter, location='Atlanta, GA', salary_min=90000, salary_max=120000)
+        cls.job.required_skills.set([cls.python, cls.sql])
+
+        def seeker(name, skills, **kwargs):
+            user = CustomUser.objects.create_user(username=name, email=f'{name}@example.com', user_type='job_seeker')
+            profile = Profile.objects.create(user=user, **kwargs)
+            profile.skills.set(skills)
+            return profile
+
+        cls.best = seeker('best', [cls.python, cls.sql], location='Atlanta', preferred_salary_min=100000)
+        cls.partial = seeker('partial', [cls.python], location='Atlanta, GA', preferred_salary_min=100000)
+        cls.far = seeker('far', [cls.python, cls.sql], location='Boston, MA', preferred_salary_min=150000)
+        cls.closed = seeker('closed', [cls.python, cls.sql], location='Atlanta', open_to_work=False)
+
+    def setUp(self):
+        cache.clear()
+
+    def test_rank_candidates(self):
+        matches = {m.pk: m for m in rank_candidates(self.job)}
+        # Skills outweigh location: a full skill match elsewhere beats half a match in town
+        self.assertEqual(list(matches), [self.best.pk, self.far.pk, self.partial.pk])
+        self.assertEqual(matches[self.best.pk][1:], (1.0, 1.0, 1.0, 1.0))
+        self.assertEqual(matches[self.far.pk][1:], (0.8, 1.0, 0.8, 0.0))
+        self.assertEqual(matches[self.partial.pk].skills, 0.5)
+        self.assertIn(self.closed.pk, [m.pk for m in rank_candidates(self.job, include_closed=True)])
+
+    def test_profile_changes_rebuild_the_index(self):
+        rank_candidates(self.job)
+        self.partial.skills.add(self.sql)
+        self.partial.location = 'Atlanta'
+        self.partial.save()
+        self.assertEqual(rank_candidates(self.job)[0].skills, 1.0)
+        self.assertEqual(len(rank_candidates(self.job)), 3)
+
+    def test_rank_jobs(self):
+        other = make_job(self.recruiter, location='Boston, MA', location_type='remote')
+        other.required_skills.set([self.go])
+        self.assertEqual([m.pk for m in rank_jobs(self.best)], [self.job.pk, other.pk])
+
+    def test_salary_score(self):
+        self.assertEqual(salary_score(90000, 120000, 100000, float('nan')), 1.0)
+        self.assertAlmostEqual(float(salary_score(50000, 75000, 100000, 150000)), 0.75)
+        self.assertEqual(salary_score(float('nan'), float('nan'), 100000, 150000), 0.5)
+
+
+class TieredCacheTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_local_tier_serves_reads_and_deletes_reach_both_tiers(self):
+        cache.set('k', {'a': 1})
+        caches['shared'].delete('k')
+        # Still served from process memory until LOCAL_TIMEOUT
+        self.assertEqual(cache.get('k'), {'a': 1})
+        cache.delete('k')
+        self.assertIsNone(cache.get('k'))
+
+        caches['shared'].set('k', 2)
+        self.assertEqual(cache.get('k'), 2)
+        self.assertGreater(cache.stats['shared_hits'], 0)
+
+    def test_local_tier_is_shared_by_every_thread(self):
+        cache.set('k', 1)
+        caches['shared'].delete('k')
+        results = []
+
+        def read():
+            # Each thread gets its own backend instance from django.core.cache.caches
+            results.append((caches['default'], caches['default'].get('k')))
+
+        thread = threading.Thread(target=read)
+        thread.start()
+        thread.join()
+        instance, value = results[0]
+        self.assertIsNot(instance, caches['default'])
+        self.assertEqual(value, 1)
+        self.assertGreater(caches['default'].stats['local_hits'], 0)
+
+    def test_bump_namespace_changes_keys(self):
+        first = namespaced_key('companies', 'list', 1)
+        self.assertEqual(first, namespaced_key('companies', 'list', 1))
+        bump_namespace('companies')
+        self.assertNotEqual(first, namespaced_key('companies', 'list', 1))
+
+    def test_get_or_compute_runs_once_for_concurrent_misses(self):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.05)
+            return 'value'
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(get_or_compute('slow', compute)))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, ['value'] * 5)
+        self.assertEqual(len(calls), 1)
+
+
+class WorkerPoolTests(SimpleTestCase):
+    @override_settings(TEST_POOL_WORKERS=1, TEST_POOL_TIMEOUT=0.5)
+    def test_timed_out_child_is_killed(self):
+        pool = WorkerPool('TEST_POOL_WORKERS', 'TEST_POOL_TIMEOUT')
+        child = pool.run(os.getpid)
+        with self.assertRaises(TimeoutError):
+            pool.run(time.sleep, 30)
+        self.assertNotIn(child, [process.pid for process in multiprocessing.active_children()])
+        # The next call gets a fresh pool
+        self.assertNotEqual(pool.run(os.getpid), child)
+        pool.shutdown()
+
+    @override_settings(TEST_POOL_WORKERS=0)
+    def test_no_workers_runs_inline(self):
+        self.assertEqual(WorkerPool('TEST_POOL_WORKERS', 'TEST_POOL_TIMEOUT').run(os.getpid), os.getpid())
+
+
+class StaticAssetTests(SimpleTestCase):
+    def test_collected_assets_are_fingerprinted_compressed_and_immutable(self):
+        manifest = {
+            'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+            'staticfiles': {'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage'},
+        }
+        with tempfile.TemporaryDirectory() as root, self.settings(STATIC_ROOT=root, STORAGES=manifest):
+            call_command('collectstatic', interactive=False, verbosity=0, ignore_patterns=['admin'])
+            url = static('js/skill_picker.js')
+            self.assertRegex(url, r'^/static/js/skill_picker\.[0-9a-f]{12}\.js$')
+            path = os.path.join(root, url.removeprefix('/static/'))
+            self.assertTrue(os.path.exists(path + '.gz'))
+            self.assertTrue(os.path.exists(path + '.br'))
+
+            response = self.client.get(url, HTTP_ACCEPT_ENCODING='gzip, br')
+            self.assertEqual(response['Content-Encoding'], 'br')
+            self.assertEqual(response['Cache-Control'], 'max-age=315360000, public, immutable')
+            response.close()
+
+
+class JobFeedTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.recruiter = CustomUser.objects.create_user(
+            username='feeds', email='feeds@example.com', password='pass12345',
+            user_type='recruiter', profile_completed=True,
+        )
+        cls.python = Skill.objects.create(name='Python', category='Programming')
+        cls.sql = Skill.objects.create(name='SQL', category='Data')
+
+    def setUp(self):
+        self.client.force_login(self.recruiter)
+
+    def csv_upload(self, *rows):
+        header = 'title,description,requirements,company_name,location,location_type,job_type,' \
+                 'experience_level,salary_min,salary_max,required_skills,visa_sponsorship\n'
+        return SimpleUploadedFile('jobs.csv', (header + ''.join(rows)).encode())
+
+    def test_csv_upload_validates_rows(self):
+        upload = self.csv_upload(
+            'Data Engineer,Pipelines.,SQL.,Acme,Remote,remote,full_time,mid,90000,120000,python; sql,true\n',
+            'Analyst,Reports.,Excel.,Acme,Atlanta,onsite,full_time,entry,,,,false\n',
+            ',No title.,None.,Acme,Atlanta,onsite,full_time,entry,,,,\n',
+            'Cobol Dev,Legacy.,Cobol.,Acme,Atlanta,onsite,full_time,mid,,,Cobol,\n',
+        )
+        response = self.client.post(reverse('jobs:job_import'), {'file': upload})
+        self.assertContains(response, '2 rows could not be imported')
+        self.assertContains(response, 'Unknown skills: Cobol')
+        self.assertEqual([e[0] for e in response.context['result'].errors], [4, 5])
+
+        job = Job.objects.get(title='Data Engineer')
+        self.assertEqual(job.posted_by, self.recruiter)
+        self.assertTrue(job.visa_sponsorship)
+        self.assertEqual(set(job.required_skills.all()), {self.python, self.sql})
+        self.assertEqual(list(get_search_backend().search(Job.objects.all(), 'pipelines')), [job])
+
+    @override_settings(JOB_IMPORT_BATCH_SIZE=20)
+    def test_unreadable_upload_imports_nothing(self):
+        row = 'Data Engineer,Pipelines.,SQL.,Acme,Remote,remote,full_time,mid,,,,false\n'
+        upload = self.csv_upload(*[row] * 300)
+        upload.file.write(b'Caf\xe9,Bad encoding.,None.,Acme,Remote,remote,full_time,mid,,,,false\n')
+        upload.file.seek(0)
+        response = self.client.post(reverse('jobs:job_import'), {'file': upload})
+        self.assertContains(response, 'Could not read the file after line')
+        self.assertContains(response, 'No jobs were imported.')
+        self.assertFalse(Job.objects.exists())
+
+    def test_export_round_trip(self):
+        job = make_job(self.recruiter, title='Backend Developer', salary_min=100000, salary_max=150000)
+        job.required_skills.set([self.python])
+        make_job(CustomUser.objects.create_user(username='other', user_type='recruiter'))
+
+        response = self.client.get(reverse('jobs:job_export') + '?format=jsonl')
+        feed = b''.join(response.streaming_content).decode()
+        self.assertEqual(len(feed.splitlines()), 1)
+        self.assertEqual(json.loads(feed)['required_skills'], ['Python'])
+
+        with tempfile.NamedTemporaryFile('w', suffix='.jsonl') as path:
+            path.write(feed * 50)
+            path.flush()
+            # The recruiter, the import's transaction (a savepoint here) and 6 per batch
+            with self.assertNumQueries(3 + 6 * 3):
+                call_command('import_jobs', path.name, user='feeds', batch_size=20, no_notify=True,
+                             stdout=io.StringIO())
+        self.assertEqual(Job.objects.filter(title='Backend Developer').count(), 51)
+        self.assertEqual(Job.required_skills.through.objects.filter(skill=self.python).count(), 51)
+
+        response = self.client.get(reverse('jobs:job_export'))
+        rows = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual(len(rows), 52)
+        self.assertIn('Python', rows[-1])
+
+    def test_applicants_export_streams_constant_queries(self):
+        job = make_job(self.recruiter)
+        for i in range(3):
+            seeker = CustomUser.objects.create_user(
+                username=f'applicant{i}', email=f'applicant{i}@example.com', first_name='Ada', last_name=str(i),
+                user_type='job_seeker',
+            )
+            profile = Profile.objects.create(user=seeker, headline=f'Engineer {i}')
+            profile.skills.set([self.python, self.sql])
+            Application.objects.create(job=job, applicant=seeker)
+        Application.objects.create(
+            job=job, applicant=CustomUser.objects.create_user(username='noprofile', user_type='job_seeker'),
+        )
+
+        response = self.client.get(reverse('jobs:job_applicants_export', args=[job.pk]))
+        with self.assertNumQueries(2):
+            rows = list(csv.reader(b''.join(response.streaming_content).decode().splitlines()))
+        self.assertEqual(rows[0], ['name', 'email', 'status', 'applied_date', 'headline', 'skills'])
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(rows[1][0], 'noprofile')
+        self.assertEqual(rows[2][1:3], ['applicant2@example.com', 'Applied'])
+        self.assertEqual(rows[2][4:], ['Engineer 2', 'Python;SQL'])
+
+        other = CustomUser.objects.create_user(username='other-recruiter', user_type='recruiter', profile_completed=True)
+        self.client.force_login(other)
+        self.assertEqual(self.client.get(reverse('jobs:job_applicants_export', args=[job.pk])).status_code, 404)
+
+
+    def test_csv_exports_neutralize_formulas(self):
+        job = make_job(self.recruiter, description='- Build APIs\n- Review code', benefits='=1+1')
+        seeker = CustomUser.objects.create_user(
+            username='mallory', first_name='=HYPERLINK("http://evil.example","Click")', user_type='job_seeker',
+        )
+        Profile.objects.create(user=seeker, headline='@SUM(A1)')
+        Application.objects.create(job=job, applicant=seeker)
+
+        response = self.client.get(reverse('jobs:job_applicants_export', args=[job.pk]))
+        rows = list(csv.reader(b''.join(response.streaming_content).decode().splitlines()))
+        self.assertEqual(rows[1][0], '\'=HYPERLINK("http://evil.example","Click")')
+        self.assertEqual(rows[1][4], "'@SUM(A1)")
+
+        response = self.client.get(reverse('jobs:job_export'))
+        feed = b''.join(response.streaming_content).decode()
+        self.assertIn(",'=1+1,", feed)
+        # Imports drop the quote again
+        rows = [row for _, row in feeds.read_rows(io.StringIO(feed), 'csv')]
+        self.assertEqual((rows[0]['description'], rows[0]['benefits']), ('- Build APIs\n- Review code', '=1+1'))
+
+
+class JobApplicationsViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.recruiter = CustomUser.objects.create_user(
+            username='triage', email='triage@example.com', password='pass12345',
+            user_type='recruiter', profile_completed=True,
+        )
+        cls.job = make_job(cls.recruiter)
+        cls.python = Skill.objects.create(name='Python', category='Programming')
+        for i, status in enumerate(['applied', 'applied', 'review', 'rejected', 'applied']):
+            seeker = CustomUser.objects.create_user(
+                username=f'candidate{i}', first_name=['Ada', 'Grace', 'Alan', 'Linus', 'Ada'][i], last_name=f'L{i}',
+                user_type='job_seeker',
+            )
+            Profile.objects.create(user=seeker, headline=f'Headline {i}').skills.add(cls.python)
+            Application.objects.create(job=cls.job, applicant=seeker, status=status)
+
+    def setUp(self):
+        self.client.force_login(self.recruiter)
+        self.url = reverse('jobs:job_applications', args=[self.job.pk])
+
+    def usernames(self, response):
+        return [application.applicant.username for application in response.context['applications']]
+
+    def test_filter_search_and_sort(self):
+        response = self.client.get(self.url, {'status': 'applied', 'sort': 'oldest'})
+        self.assertEqual(self.usernames(response), ['candidate0', 'candidate1', 'candidate4'])
+
+        response = self.client.get(self.url, {'q': 'ada', 'sort': 'name'})
+        self.assertEqual(self.usernames(response), ['candidate0', 'candidate4'])
+        self.assertContains(response, 'Headline 0')
+
+        response = self.client.get(self.url, {'status': 'offer'})
+        self.assertContains(response, 'No Matching Applications')
+
+    def test_search_reads_extracted_resumes(self):
+        document = ResumeDocument.objects.create(
+            sha256='0' * 64, file='resumes/00/cv.txt', size=1, text='Shipped Kubernetes operators', status='done',
+        )
+        document.inferred_skills.add(self.python)
+        Profile.objects.filter(user__username='candidate2').update(resume_document=document)
+
+        response = self.client.get(self.url, {'q': 'kubernetes'})
+        self.assertEqual(self.usernames(response), ['candidate2'])
+        response = self.client.get(self.url, {'q': 'python'})
+        self.assertEqual(self.usernames(response), ['candidate2'])
+
+    def test_page_queries_do_not_grow_with_applicants(self):
+        with self.assertNumQueries(6) as small:
+            self.client.get(self.url, {'sort': 'status'})
+
+        for i in range(10):
+            seeker = CustomUser.objects.create_user(username=f'extra{i}', user_type='job_seeker')
+            Profile.objects.create(user=seeker).skills.add(self.python)
+            Application.objects.create(job=self.job, applicant=seeker)
+        with self.assertNumQueries(len(small.captured_queries)):
+            response = self.client.get(self.url, {'sort': 'status', 'page': 1})
+        self.assertEqual(response.context['paginator'].count, 15)
@@ -13,5 +13,8 @@ urlpatterns = [
     path('<int:pk>/edit/', views.JobUpdateView.as_view(), name='job_edit'),
     path('<int:pk>/delete/', views.JobDeleteView.as_view(), name='job_delete'),
     path('my-jobs/', views.MyJobsView.as_view(), name='my_jobs'),
+    path('import/', views.JobImportView.as_view(), name='job_import'),
+    path('export/', views.JobExportView.as_view(), name='job_export'),
     path('<int:pk>/applications/', views.JobApplicationsView.as_view(), name='job_applications'),
+    path('<int:pk>/applications/export/', views.JobApplicantsExportView.as_view(), name='job_applicants_export'),
 ]
\ No newline at end of file
@@ -1,13 +1,27 @@
-from django.views.generic import ListView, DetailView, CreateView, UpdateView, DeleteView
+
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from django.views import View
+from django.views.generic import ListView, DetailView, CreateView, UpdateView, DeleteView, FormView
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
 from django.contrib import messages
-from django.shortcuts import redirect
+from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse_lazy
-from django.db.models import Q, Count
+from django.db.models import Q
+from django.template.defaultfilters import pluralize
 
+from . import feeds
 from .models import Job
-from .forms import JobForm, JobFilterForm
+from .forms import JobForm, JobFilterForm, JobFeedUploadForm
+from .pagination import CappedCountPaginator, CursorPaginationMixin
+from .facets import facet_condition, get_facets
+from .fragments import render_fragment, render_fragments
+from .filters import skills_condition
+from .search import get_search_backend
+from applications.forms import ApplicationFilterForm
 from applications.models import Application
+from notifications.tasks import enqueue
+from thumbnails import derivatives
 
 
 class RecruiterRequiredMixin(UserPassesTestMixin):
@@ -19,40 +33,51 @@ class RecruiterRequiredMixin(UserPassesTestMixin):
         return redirect('home')
 
 
-class JobListView(ListView):
+class JobListView(CursorPaginationMixin, ListView):
     model = Job
     template_name = 'jobs/job_list.html'
     context_object_name = 'jobs'
     paginate_by = 12
+    paginator_class = CappedCountPaginator
 
     def get_queryset(self):
-        qs = Job.objects.filter(is_active=True).select_related('posted_by').prefetch_related('required_skills')
+        # Built once per request; the paginator and context reuse the same queryset
+        if not hasattr(self, '_filtered_queryset'):
+            self._filtered_queryset = self.build_queryset()
+        return self._filtered_queryset
+
+    def get_paginator(self, queryset, per_page, orphans=0, allow_empty_first_page=True, **kwargs):
+        return self.paginator_class(
+            queryset, per_page, orphans=orphans, allow_empty_first_page=allow_empty_first_page,
+            count_limit=getattr(settings, 'JOB_LIST_COUNT_LIMIT', None), **kwargs
+        )
+
+    def build_queryset(self):
+        qs = self.get_base_queryset()
+        for condition in self.get_facet_conditions().values():
+            qs = qs.filter(condition)
+
+        # Best matches first when the backend ranks results (cursor mode always pages by recency)
+        q = self.request.GET.get('q') or ''
+        search_backend = get_search_backend()
+        if q and search_backend.ranked and not self.use_cursor_pagination():
+            return search_backend.rank(qs, q).order_by('search_rank', '-created_at', '-id')
+        return qs.order_by('-created_at', '-id')
+
+    def get_base_queryset(self):
+        """Active jobs matching the keyword, location and salary filters"""
+        # Skills are only loaded for job cards missing from the fragment cache
+        qs = Job.objects.filter(is_active=True).select_related('posted_by')
         params = self.request.GET
 
         q = params.get('q') or ''
         if q:
-            qs = qs.filter(
-                Q(title__icontains=q) |
-                Q(description__icontains=q) |
-                Q(company_name__icontains=q)
-            )
+            qs = get_search_backend().search(qs, q)
 
         location = params.get('location') or ''
         if location:
             qs = qs.filter(location__icontains=location)
 
-        job_type = params.get('job_type') or ''
-        if job_type:
-            qs = qs.filter(job_type=job_type)
-
-        location_type = params.get('location_type') or ''
-        if location_type:
-            qs = qs.filter(location_type=location_type)
-
-        experience_level = params.get('experience_level') or ''
-        if experience_level:
-            qs = qs.filter(experience_level=experience_level)
-
         # Salary filters (inclusive)
         salary_min = params.get('salary_min')
         salary_max = params.get('salary_max')
@@ -69,30 +94,49 @@ class JobListView(ListView):
             except ValueError:
                 pass
 
+        return qs
+
+    def get_facet_conditions(self):
+        """Map each selected facet filter (the sidebar dropdowns and skills) to its Q object"""
+        params = self.request.GET
+        conditions = {}
+
+        for dimension in ('job_type', 'location_type', 'experience_level'):
+            value = params.get(dimension) or ''
+            if value:
+                conditions[dimension] = facet_condition(dimension, value)
+
         visa = params.get('visa_sponsorship')
-        if visa == 'yes':
-            qs = qs.filter(visa_sponsorship=True)
-        elif visa == 'no':
-            qs = qs.filter(visa_sponsorship=False)
+        if visa in ('yes', 'no'):
+            conditions['visa_sponsorship'] = facet_condition('visa_sponsorship', visa)
 
-        # Skills (list of IDs)
-        skill_ids = params.getlist('skills')
+        # Skills (list of IDs), matching any or all of them
+        skill_ids = [v for v in params.getlist('skills') if v.isdigit()]
         if skill_ids:
-            qs = qs.filter(required_skills__in=skill_ids).distinct()
+            match = 'all' if params.get('skills_match') == 'all' else 'any'
+            conditions['skills'] = skills_condition(skill_ids, match)
 
-        return qs.order_by('-created_at')
+        return conditions
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        form = JobFilterForm(self.request.GET or None)
+        facets = get_facets(self.request.GET, self.get_base_queryset(), self.get_facet_conditions())
+        form = JobFilterForm(self.request.GET or None, facets=facets)
         context['filter_form'] = form
+        context['facets'] = facets
 
-        # Preserve filters in pagination links
-        qd = self.request.GET.copy()
-        qd.pop('page', None)
-        context['current_query'] = qd.urlencode()
+        jobs = context['jobs']
+        for job, card_html in zip(jobs, render_fragments('card', jobs)):
+            job.card_html = card_html
 
-        context['result_count'] = self.get_queryset().count()
+        # Reuse the paginator's COUNT instead of running the filters again
+        paginator = context['paginator']
+        if paginator is not None:
+            context['result_count'] = paginator.count
+            context['result_count_approximate'] = paginator.count_is_approximate
+        else:
+            context['result_count'] = len(context['jobs'])
+            context['result_count_approximate'] = False
         return context
 
 
@@ -101,8 +145,12 @@ class JobDetailView(DetailView):
     template_name = 'jobs/job_detail.html'
     context_object_name = 'job'
 
+    def get_queryset(self):
+        return Job.objects.select_related('posted_by', 'company')
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
+        context['job_body'] = render_fragment('detail', self.object)
         if self.request.user.is_authenticated and getattr(self.request.user, 'user_type', '') == 'job_seeker':
             context['user_has_applied'] = Application.objects.filter(
                 job=self.object,
@@ -121,6 +169,8 @@ class JobCreateView(LoginRequiredMixin, RecruiterRequiredMixin, CreateView):
     def form_valid(self, form):
         form.instance.posted_by = self.request.user
         response = super().form_valid(form)
+        # Matching seekers are notified in the background, not in this request
+        enqueue('new_job_match', job_id=self.object.pk)
         messages.success(self.request, f'Job "{self.object.title}" has been posted successfully!')
         return response
 
@@ -158,31 +208,99 @@ class JobDeleteView(LoginRequiredMixin, RecruiterRequiredMixin, DeleteView):
         return super().delete(request, *args, **kwargs)
 
 
-class MyJobsView(LoginRequiredMixin, RecruiterRequiredMixin, ListView):
+class MyJobsView(LoginRequiredMixin, RecruiterRequiredMixin, CursorPaginationMixin, ListView):
     model = Job
     template_name = 'jobs/my_jobs.html'
     context_object_name = 'jobs'
     paginate_by = 10
 
     def get_queryset(self):
+        # application_count is a maintained counter column, so no join is needed
         return Job.objects.filter(
             posted_by=self.request.user
-        ).annotate(
-            application_count=Count('applications')
-        ).order_by('-created_at')
+        ).order_by('-created_at', '-id')
 
 
-class JobApplicationsView(LoginRequiredMixin, RecruiterRequiredMixin, DetailView):
-    model = Job
-    template_name = 'jobs/job_applications.html'
-    context_object_name = 'job'
+class JobImportView(LoginRequiredMixin, RecruiterRequiredMixin, FormView):
+    """Create jobs in bulk from an uploaded CSV or JSON Lines feed"""
+    form_class = JobFeedUploadForm
+    template_name = 'jobs/job_import.html'
+
+    def form_valid(self, form):
+        upload = form.cleaned_data['file']
+        fmt = form.cleaned_data['format'] or feeds.detect_format(upload.name)
+        try:
+            result = feeds.import_jobs(feeds.read_rows(upload.file, fmt), self.request.user)
+        except feeds.FeedReadError as exc:
+            form.add_error('file', f'{exc}. No jobs were imported.')
+            return self.form_invalid(form)
+
+        if result.created:
+            messages.success(self.request, f'Imported {result.created} job{pluralize(result.created)}.')
+        if not result.error_count:
+            return redirect('jobs:my_jobs')
+        messages.warning(self.request, f'{result.error_count} row{pluralize(result.error_count)} could not be imported.')
+        return self.render_to_response(self.get_context_data(form=form, result=result))
+
+
+class JobExportView(LoginRequiredMixin, RecruiterRequiredMixin, View):
+    """Stream the recruiter's jobs as CSV (default) or JSON Lines (?format=jsonl)"""
+
+    def get(self, request):
+        fmt = request.GET.get('format')
+        if fmt not in feeds.FORMATS:
+            fmt = 'csv'
+        jobs = Job.objects.filter(posted_by=request.user)
+        response = StreamingHttpResponse(feeds.export_jobs(jobs, fmt), content_type=feeds.FORMATS[fmt])
+        response['Content-Disposition'] = f'attachment; filename="jobs.{fmt}"'
+        return response
+
+
+class JobApplicantsExportView(LoginRequiredMixin, RecruiterRequiredMixin, DetailView):
+    """Stream a job's applicants as CSV"""
 
     def get_queryset(self):
         return Job.objects.filter(posted_by=self.request.user)
 
+    def get(self, request, *args, **kwargs):
+        job = self.get_object()
+        response = StreamingHttpResponse(feeds.export_applicants(job), content_type=feeds.FORMATS['csv'])
+        response['Content-Disposition'] = f'attachment; filename="job-{job.pk}-applicants.csv"'
+        return response
+
+
+class JobApplicationsView(LoginRequiredMixin, RecruiterRequiredMixin, ListView):
+    """A job's applications, filtered, searched, sorted and paginated for triage"""
+    template_name = 'jobs/job_applications.html'
+    context_object_name = 'applications'
+    paginate_by = 24
+
+    def get(self, request, *args, **kwargs):
+        self.job = get_object_or_404(Job, pk=kwargs['pk'], posted_by=request.user)
+        self.filter_form = ApplicationFilterForm(request.GET or None)
+        return super().get(request, *args, **kwargs)
+
+    def get_queryset(self):
+        # Profiles come with the page's join and their skills in one more query
+        applications = Application.objects.filter(job=self.job).select_related(
+            'applicant', 'applicant__profile'
+        ).prefetch_related('applicant__profile__skills')
+        return self.filter_form.filter(applications)
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['applications'] = Application.objects.filter(
-            job=self.object
-        ).select_related('applicant').order_by('-applied_date')
-        return context
\ No newline at end of file
+        context['job'] = self.job
+        context['filter_form'] = self.filter_form
+        context['filtered'] = any(self.request.GET.get(name) for name in ('status', 'q'))
+
+        # One query (or cache read) for every applicant photo on the page
+        profiles = [getattr(a.applicant, 'profile', None) for a in context['applications']]
+        context['prefetched_thumbnails'] = derivatives.prefetch(
+            p.profile_picture.name for p in profiles if p and p.profile_picture
+        )
+
+        # Preserve filters in pagination links
+        qd = self.request.GET.copy()
+        qd.pop('page', None)
+        context['current_query'] = qd.urlencode()
+        return context
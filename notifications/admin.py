@@ -1,8 +1,14 @@
 from django.contrib import admin
-from .models import Notification
+from .models import Notification, NotificationTask
 
 @admin.register(Notification)
 class NotificationAdmin(admin.ModelAdmin):
     list_display = ('title', 'recipient', 'notification_type', 'is_read', 'created_at')
     list_filter = ('notification_type', 'is_read', 'created_at')
-    search_fields = ('title', 'recipient__username')
\ No newline at end of file
+    search_fields = ('title', 'recipient__username')
+
+@admin.register(NotificationTask)
+class NotificationTaskAdmin(admin.ModelAdmin):
+    list_display = ('kind', 'status', 'attempts', 'result', 'created_at', 'run_after', 'finished_at')
+    list_filter = ('kind', 'status')
+    readonly_fields = ('kind', 'payload', 'attempts', 'result', 'error', 'created_at', 'started_at', 'finished_at')
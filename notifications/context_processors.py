@@ -0,0 +1,21 @@
+from django.conf import settings
+from django.utils.functional import SimpleLazyObject
+
+from .counters import get_unread_count
+
+
+def unread_notifications(request):
+    """
+    Unread count for the navbar badge, only looked up if a template uses it,
+    and whether pages should open the live notification stream
+    """
+    def count():
+        user = getattr(request, 'user', None)
+        if user is None or not user.is_authenticated:
+            return 0
+        return get_unread_count(user.pk)
+
+    return {
+        'unread_notification_count': SimpleLazyObject(count),
+        'notification_stream_enabled': getattr(settings, 'NOTIFICATIONS_STREAM_ENABLED', False),
+    }
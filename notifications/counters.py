@@ -0,0 +1,46 @@
+"""
+Per-user unread notification counts for the navbar badge.
+
+The count is computed once with COUNT(*) (served by notification_inbox_idx)
+and then kept in the cache, adjusted by the signal handlers and by
+mark_read() instead of being recounted on every page.
+"""
+from django.conf import settings
+from django.core.cache import cache
+
+from .models import Notification
+
+
+def cache_key(user_id):
+    return f'notifications:unread:{user_id}'
+
+
+def get_unread_count(user_id):
+    return cache.get_or_set(
+        cache_key(user_id),
+        lambda: Notification.objects.filter(recipient_id=user_id, is_read=False).count(),
+        getattr(settings, 'NOTIFICATION_UNREAD_CACHE_TIMEOUT', 3600),
+    )
+
+
+def adjust(user_id, delta):
+    """Add ``delta`` to a cached count; a count that isn't cached is left to be computed on read"""
+    if delta:
+        try:
+            cache.incr(cache_key(user_id), delta)
+        except ValueError:
+            pass
+
+
+def invalidate(user_ids):
+    cache.delete_many([cache_key(user_id) for user_id in user_ids])
+
+
+def mark_read(user, pks=None):
+    """Mark the user's unread notifications (all, or only ``pks``) read in one UPDATE"""
+    notifications = Notification.objects.filter(recipient=user, is_read=False)
+    if pks is not None:
+        notifications = notifications.filter(pk__in=pks)
+    updated = notifications.update(is_read=True)
+    adjust(user.pk, -updated)
+    return updated
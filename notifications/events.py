@@ -0,0 +1,220 @@
+"""
+Real-time events for the notification stream.
+
+Sync code (signal handlers, services) calls publish() with a user id and an
+event. After the transaction commits, the configured broker hands the event
+to the Hub of every worker process. Each Hub then queues it for that user's
+open connections in NotificationStreamView.
+
+Each connection is one asyncio.Queue of NOTIFICATION_STREAM_QUEUE_SIZE
+events. When a slow client lets its queue fill up, the oldest events are
+dropped and the client gets a 'resync' event telling it to refetch. Idle
+connections cost one suspended coroutine and a heartbeat comment now and then.
+
+LocalBroker delivers within this process, which is all a single worker (or
+the test suite) needs. RedisBroker uses Redis pub/sub to reach every worker.
+"""
+import asyncio
+import json
+import logging
+import threading
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = 'jobplatform:events'
+
+# Seconds between attempts to resubscribe after losing Redis, doubling up to the maximum
+RECONNECT_DELAY = 1
+MAX_RECONNECT_DELAY = 30
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def format_event(event):
+    """Serialize an event dict ({'event', 'data', optional 'id'}) as an SSE message"""
+    lines = []
+    if event.get('id') is not None:
+        lines.append(f"id: {event['id']}")
+    lines.append(f"event: {event['event']}")
+    lines.append(f"data: {json.dumps(event.get('data', {}), separators=(',', ':'))}")
+    return '\n'.join(lines) + '\n\n'
+
+
+class Subscription:
+    """One open stream: a bounded queue owned by the event loop serving it"""
+
+    def __init__(self, user_id, loop, maxsize):
+        self.user_id = user_id
+        self.loop = loop
+        self.queue = asyncio.Queue(maxsize)
+        self.overflowed = False
+
+    def deliver(self, event):
+        # Runs on self.loop, so no locking is needed around the queue
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.overflowed = True
+        self.queue.put_nowait(event)
+
+    async def get(self, timeout):
+        """Next event (or a resync after an overflow); None after ``timeout`` seconds idle"""
+        if self.overflowed:
+            self.overflowed = False
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            return {'event': 'resync', 'data': {}}
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class Hub:
+    """Open subscriptions of this process, by user id"""
+
+    def __init__(self):
+        self._subscriptions = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def subscribe(self, user_id, maxsize=None):
+        maxsize = maxsize or getattr(settings, 'NOTIFICATION_STREAM_QUEUE_SIZE', 100)
+        subscription = Subscription(user_id, asyncio.get_running_loop(), maxsize)
+        with self._lock:
+            self._subscriptions[user_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.user_id)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[subscription.user_id]
+
+    def deliver(self, user_id, event):
+        """Queue ``event`` for every connection of ``user_id`` (safe from any thread)"""
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(user_id, ()))
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.deliver, event)
+            except RuntimeError:
+                # The loop has closed; the stream's finally block will unsubscribe it
+                pass
+
+    def connection_count(self):
+        with self._lock:
+            return sum(len(s) for s in self._subscriptions.values())
+
+
+hub = Hub()
+
+
+class LocalBroker:
+    """Delivers events to this process only"""
+
+    def publish(self, user_id, event):
+        hub.deliver(user_id, event)
+
+    def start(self):
+        pass
+
+
+class RedisBroker:
+    """Fans events out to every worker through one Redis pub/sub channel"""
+
+    def __init__(self):
+        import redis
+
+        self.client = redis.Redis.from_url(settings.REDIS_URL)
+        self._listener = None
+        self._lock = threading.Lock()
+
+    def publish(self, user_id, event):
+        self.client.publish(CHANNEL, json.dumps({'user_id': user_id, 'event': event}))
+
+    def start(self):
+        """Start this process's listener thread (on the first subscription, or if it died)"""
+        with self._lock:
+            if self._listener is None or not self._listener.is_alive():
+                self._listener = threading.Thread(target=self.listen, name='notification-events', daemon=True)
+                self._listener.start()
+
+    def listen(self):
+        """Deliver published events to this process's hub, resubscribing whenever Redis drops us"""
+        delay = RECONNECT_DELAY
+        while True:
+            pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+            try:
+                pubsub.subscribe(CHANNEL)
+                delay = RECONNECT_DELAY
+                for message in pubsub.listen():
+                    self.dispatch(message)
+            except Exception:
+                logger.exception('Notification event subscription failed; resubscribing in %ss', delay)
+            finally:
+                pubsub.close()
+            time.sleep(delay)
+            delay = min(delay * 2, MAX_RECONNECT_DELAY)
+
+    def dispatch(self, message):
+        try:
+            payload = json.loads(message['data'])
+            user_id, event = payload['user_id'], payload['event']
+        except (TypeError, ValueError, KeyError):
+            logger.warning('Ignoring malformed notification event: %r', message.get('data'))
+            return
+        hub.deliver(user_id, event)
+
+
+def get_broker():
+    global _broker
+    with _broker_lock:
+        if _broker is None:
+            path = getattr(settings, 'NOTIFICATION_EVENT_BROKER', 'notifications.events.LocalBroker')
+            _broker = import_string(path)()
+        return _broker
+
+
+def publish(user_id, event_type, data, event_id=None):
+    """Send an event to ``user_id``'s open streams once the current transaction commits"""
+    event = {'event': event_type, 'data': data, 'id': event_id}
+    transaction.on_commit(lambda: get_broker().publish(user_id, event))
+
+
+def publish_many(messages):
+    """publish() for many ``(user_id, event_type, data)`` at once, with a single on_commit callback"""
+    messages = [(user_id, {'event': event_type, 'data': data, 'id': None}) for user_id, event_type, data in messages]
+
+    def send():
+        broker = get_broker()
+        for user_id, event in messages:
+            broker.publish(user_id, event)
+
+    if messages:
+        transaction.on_commit(send)
+
+
+def publish_notification(notification):
+    publish(notification.recipient_id, 'notification', {
+        'id': notification.pk,
+        'type': notification.notification_type,
+        'title': notification.title,
+        'related_job_id': notification.related_job_id,
+    }, event_id=notification.pk)
+
+
+def publish_application_status(application):
+    publish(application.applicant_id, 'application_status', {
+        'application_id': application.pk,
+        'job_id': application.job_id,
+        'status': application.status,
+        'status_display': application.get_status_display(),
+    })
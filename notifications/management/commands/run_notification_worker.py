@@ -0,0 +1,25 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from notifications.tasks import requeue_stale, run_pending
+
+
+class Command(BaseCommand):
+    help = "Process queued notification tasks (e.g. new job match fan-out)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Drain the queue once and exit')
+        parser.add_argument('--interval', type=float, default=2.0, help='Seconds to sleep when the queue is empty')
+        parser.add_argument('--batch', type=int, default=100)
+
+    def handle(self, *args, **options):
+        while True:
+            requeue_stale()
+            ran = run_pending(options['batch'])
+            if ran:
+                self.stdout.write(f'Ran {ran} task(s)')
+            if options['once'] and not ran:
+                return
+            if not ran:
+                time.sleep(options['interval'])
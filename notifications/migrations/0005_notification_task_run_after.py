@@ -0,0 +1,27 @@
+# Generated by Django 5.2.6 on 2026-10-18 13:42
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notifications", "0004_notification_inbox_idx"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="notificationtask",
+            name="notification_task_queue_idx",
+        ),
+        migrations.AddField(
+            model_name="notificationtask",
+            name="run_after",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AddIndex(
+            model_name="notificationtask",
+            index=models.Index(fields=["status", "run_after", "id"], name="notification_task_queue_idx"),
+        ),
+    ]
@@ -1,5 +1,6 @@
 from django.db import models
 from django.conf import settings
+from django.utils import timezone
 
 class Notification(models.Model):
     NOTIFICATION_TYPES = (
@@ -22,6 +23,47 @@ class Notification(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Inbox pages and the unread count for one recipient
+            models.Index(fields=['recipient', 'is_read', '-created_at'], name='notification_inbox_idx'),
+        ]
+        constraints = [
+            # One match notification per seeker and job, so fan-out retries are harmless
+            models.UniqueConstraint(
+                fields=['recipient', 'related_job_id'],
+                condition=models.Q(notification_type='new_job_match'),
+                name='unique_job_match_notification',
+            ),
+        ]
 
     def __str__(self):
-        return f"{self.title} for {self.recipient.username}"
\ No newline at end of file
+        return f"{self.title} for {self.recipient.username}"
+
+
+class NotificationTask(models.Model):
+    """A unit of background work in the database-backed queue (see notifications.tasks)"""
+    STATUS_CHOICES = (
+        ('pending', 'Pending'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    )
+
+    kind = models.CharField(max_length=50)
+    payload = models.JSONField(default=dict)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='pending')
+    attempts = models.PositiveIntegerField(default=0)
+    result = models.PositiveIntegerField(blank=True, null=True, help_text="Recipients processed")
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    # Not claimed before this time; pushed back after each failed attempt
+    run_after = models.DateTimeField(default=timezone.now)
+    started_at = models.DateTimeField(blank=True, null=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        ordering = ['id']
+        indexes = [models.Index(fields=['status', 'run_after', 'id'], name='notification_task_queue_idx')]
+
+    def __str__(self):
+        return f"{self.kind} #{self.pk} ({self.status})"
\ No newline at end of file
@@ -0,0 +1,24 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from . import counters, events
+from .models import Notification
+
+
+@receiver(post_save, sender=Notification)
+def update_unread_count_on_save(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    if created:
+        if not instance.is_read:
+            counters.adjust(instance.recipient_id, 1)
+        events.publish_notification(instance)
+    else:
+        # is_read may have been toggled (e.g. in the admin); recount on next read
+        counters.invalidate([instance.recipient_id])
+
+
+@receiver(post_delete, sender=Notification)
+def update_unread_count_on_delete(sender, instance, **kwargs):
+    if not instance.is_read:
+        counters.adjust(instance.recipient_id, -1)
@@ -0,0 +1,203 @@
+"""
+Database-backed background queue for notification fan-out.
+
+enqueue() stores a NotificationTask row in the caller's transaction, so the
+request that triggers it only pays for one INSERT. A worker process
+(``manage.py run_notification_worker``) claims pending tasks with a
+conditional UPDATE, which is safe with several workers, and runs the handler
+registered for the task's kind. A task that fails is retried after an
+exponentially growing delay, up to NOTIFICATION_TASK_MAX_ATTEMPTS attempts.
+With NOTIFICATION_TASKS_EAGER on (tests, local development without a worker)
+tasks run as soon as the transaction that enqueued them commits.
+"""
+import logging
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from . import counters, events
+from .models import Notification, NotificationTask
+from jobs.matching import rank_candidates
+from jobs.models import Job
+from profiles.models import Profile
+
+logger = logging.getLogger(__name__)
+
+HANDLERS = {}
+
+
+def handler(kind):
+    """Register a function as the handler for tasks of ``kind``"""
+    def register(func):
+        HANDLERS[kind] = func
+        return func
+    return register
+
+
+def enqueue(kind, **payload):
+    if kind not in HANDLERS:
+        raise ValueError(f'No handler registered for {kind!r}')
+    task = NotificationTask.objects.create(kind=kind, payload=payload)
+    if getattr(settings, 'NOTIFICATION_TASKS_EAGER', False):
+        transaction.on_commit(lambda: run_task(task.pk))
+    return task
+
+
+def enqueue_many(kind, payloads):
+    """enqueue() for many payloads with one bulk INSERT"""
+    if kind not in HANDLERS:
+        raise ValueError(f'No handler registered for {kind!r}')
+    tasks = NotificationTask.objects.bulk_create([NotificationTask(kind=kind, payload=p) for p in payloads])
+    if tasks and getattr(settings, 'NOTIFICATION_TASKS_EAGER', False):
+        pks = [task.pk for task in tasks]
+
+        def run_all():
+            for pk in pks:
+                run_task(pk)
+
+        transaction.on_commit(run_all)
+    return tasks
+
+
+def claim(pk):
+    """Move a due pending task to running; False if another worker got it first"""
+    return bool(NotificationTask.objects.filter(pk=pk, status='pending', run_after__lte=timezone.now()).update(
+        status='running', started_at=timezone.now(), attempts=F('attempts') + 1,
+    ))
+
+
+def run_task(pk):
+    """Claim and run one task, recording the outcome. Returns True if it ran."""
+    if not claim(pk):
+        return False
+    task = NotificationTask.objects.get(pk=pk)
+    try:
+        with transaction.atomic():
+            result = HANDLERS[task.kind](**task.payload)
+    except Exception:
+        logger.exception('Notification task %s failed', task)
+        retry = task.attempts < getattr(settings, 'NOTIFICATION_TASK_MAX_ATTEMPTS', 3)
+        now = timezone.now()
+        NotificationTask.objects.filter(pk=pk).update(
+            status='pending' if retry else 'failed', error=traceback.format_exc(), finished_at=now,
+            run_after=now + retry_delay(task.attempts),
+        )
+    else:
+        NotificationTask.objects.filter(pk=pk).update(
+            status='done', result=result, error='', finished_at=timezone.now(),
+        )
+    return True
+
+
+def retry_delay(attempts):
+    """Wait before the next attempt: NOTIFICATION_TASK_RETRY_DELAY, doubling per failed attempt"""
+    base = getattr(settings, 'NOTIFICATION_TASK_RETRY_DELAY', 30)
+    return timedelta(seconds=min(base * 2 ** (attempts - 1), 3600))
+
+
+def requeue_stale(timeout=None):
+    """Return tasks stuck in running (their worker died) to the queue"""
+    timeout = timeout or getattr(settings, 'NOTIFICATION_TASK_TIMEOUT', 600)
+    cutoff = timezone.now() - timedelta(seconds=timeout)
+    return NotificationTask.objects.filter(status='running', started_at__lt=cutoff).update(status='pending')
+
+
+def run_pending(limit=100):
+    """Run up to ``limit`` due pending tasks in queue order; return how many ran"""
+    pks = NotificationTask.objects.filter(status='pending', run_after__lte=timezone.now()).values_list('pk', flat=True)[:limit]
+    return sum(run_task(pk) for pk in list(pks))
+
+
+def new_notifications(notifications):
+    """
+    Drop the job-match notifications whose recipient already has one for the
+    job (rows unique_job_match_notification would reject), repeats included.
+    """
+    matches = [n for n in notifications if n.notification_type == 'new_job_match']
+    if not matches:
+        return notifications
+    existing = set(Notification.objects.filter(
+        notification_type='new_job_match',
+        recipient_id__in={n.recipient_id for n in matches},
+        related_job_id__in={n.related_job_id for n in matches},
+    ).values_list('recipient_id', 'related_job_id'))
+    fresh = []
+    for n in notifications:
+        if n.notification_type == 'new_job_match':
+            key = (n.recipient_id, n.related_job_id)
+            if key in existing:
+                continue
+            existing.add(key)
+        fresh.append(n)
+    return fresh
+
+
+def insert_new(notifications):
+    """Insert the notifications that don't exist yet and return them"""
+    try:
+        with transaction.atomic():
+            return Notification.objects.bulk_create(new_notifications(notifications))
+    except IntegrityError:
+        # A concurrent fan-out inserted some of them after we looked; look again
+        return Notification.objects.bulk_create(new_notifications(notifications))
+
+
+def create_notifications(notifications, batch_size=None, skip_existing=False):
+    """
+    Insert unsaved Notification objects in batches of NOTIFICATION_BATCH_SIZE,
+    then invalidate their recipients' unread counts and publish them to open
+    streams (bulk_create skips the signals that normally do both). With
+    ``skip_existing``, notifications the recipient already has are neither
+    inserted nor published.
+    """
+    batch_size = batch_size or getattr(settings, 'NOTIFICATION_BATCH_SIZE', 1000)
+    notifications = list(notifications)
+    for start in range(0, len(notifications), batch_size):
+        batch = notifications[start:start + batch_size]
+        if skip_existing:
+            batch = insert_new(batch)
+        else:
+            Notification.objects.bulk_create(batch)
+        counters.invalidate({n.recipient_id for n in batch})
+        events.publish_many((n.recipient_id, 'notification', {
+            'type': n.notification_type,
+            'title': n.title,
+            'related_job_id': n.related_job_id,
+        }) for n in batch)
+    return len(notifications)
+
+
+def bulk_notify(recipient_ids, batch_size=None, **fields):
+    """
+    Create one notification per recipient in batches, skipping recipients who
+    already have it (e.g. a new_job_match for the same job). Returns the number
+    of recipients processed.
+    """
+    notifications = (Notification(recipient_id=pk, **fields) for pk in recipient_ids)
+    return create_notifications(notifications, batch_size, skip_existing=True)
+
+
+@handler('new_job_match')
+def notify_job_matches(job_id):
+    """Notify the job seekers who best match a newly posted job"""
+    job = Job.objects.filter(pk=job_id, is_active=True).select_related('company').first()
+    if job is None:
+        return 0
+
+    min_score = getattr(settings, 'JOB_MATCH_MIN_SCORE', 0.6)
+    matches = rank_candidates(job, limit=getattr(settings, 'JOB_MATCH_NOTIFY_LIMIT', 1000))
+    profile_ids = [match.pk for match in matches if match.score >= min_score]
+    recipient_ids = Profile.objects.filter(pk__in=profile_ids).values_list('user_id', flat=True)
+
+    return bulk_notify(
+        recipient_ids,
+        notification_type='new_job_match',
+        title=f'New job match: {job.title}',
+        message=f'{job.get_company_name()} posted a {job.get_job_type_display().lower()} role in '
+                f'{job.location} that matches your profile.',
+        related_job_id=job.pk,
+    )
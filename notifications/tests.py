@@ -1,3 +1,269 @@
-from django.test import TestCase
+import asyncio
+import threading
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from . import counters, events, tasks
+from .models import Notification, NotificationTask
+from profiles.models import Profile, Skill
+from users.models import CustomUser
+
+
+class JobMatchFanOutTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.recruiter = CustomUser.objects.create_user(
+            username='recruiter', email='recruiter@example.com', password='pass12345',
+            user_type='recruiter', profile_completed=True,
+        )
+        cls.python = Skill.objects.create(name='Python')
+        cls.sql = Skill.objects.create(name='SQL')
+        cls.seekers = []
+        for i, skills in enumerate([[cls.python, cls.sql], [cls.python, cls.sql], [cls.sql]]):
+            user = CustomUser.objects.create_user(
+                username=f'seeker{i}', email=f'seeker{i}@example.com', user_type='job_seeker',
+            )
+            Profile.objects.create(user=user, location='Atlanta, GA').skills.set(skills)
+            cls.seekers.append(user)
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.recruiter)
+
+    def post_job(self):
+        return self.client.post(reverse('jobs:job_create'), {
+            'title': 'Data Engineer', 'description': 'Pipelines.', 'requirements': 'SQL.',
+            'company_name': 'Acme', 'location': 'Atlanta, GA', 'location_type': 'onsite',
+            'job_type': 'full_time', 'experience_level': 'mid', 'salary_currency': 'USD',
+            'required_skills': [self.python.pk, self.sql.pk],
+        })
+
+    def test_posting_only_enqueues(self):
+        response = self.post_job()
+        self.assertEqual(response.status_code, 302)
+        task = NotificationTask.objects.get()
+        self.assertEqual((task.kind, task.status), ('new_job_match', 'pending'))
+        self.assertFalse(Notification.objects.exists())
+
+        self.assertEqual(tasks.run_pending(), 1)
+        task.refresh_from_db()
+        self.assertEqual((task.status, task.result), ('done', 2))
+        self.assertCountEqual(
+            Notification.objects.values_list('recipient_id', flat=True), [u.pk for u in self.seekers[:2]],
+        )
+
+    @override_settings(NOTIFICATION_TASKS_EAGER=True)
+    def test_eager_mode_and_dedupe(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.post_job()
+        self.assertEqual(Notification.objects.filter(notification_type='new_job_match').count(), 2)
+
+        # Running the same fan-out again doesn't notify or push to anyone twice
+        job_id = NotificationTask.objects.get().payload['job_id']
+        published = []
+        with mock.patch.object(events, 'publish_many', side_effect=lambda messages: published.extend(messages)):
+            with self.captureOnCommitCallbacks(execute=True):
+                tasks.enqueue('new_job_match', job_id=job_id)
+        self.assertEqual(Notification.objects.filter(notification_type='new_job_match').count(), 2)
+        self.assertEqual(published, [])
+
+    @override_settings(NOTIFICATION_TASK_MAX_ATTEMPTS=2)
+    def test_failures_are_retried_then_marked_failed(self):
+        task = tasks.enqueue('new_job_match', job_id=1)
+        with mock.patch.dict(tasks.HANDLERS, {'new_job_match': mock.Mock(side_effect=RuntimeError('boom'))}):
+            with self.assertLogs('notifications.tasks', 'ERROR'):
+                tasks.run_pending()
+                task.refresh_from_db()
+                self.assertEqual(task.status, 'pending')
+                # Backed off: not retried until run_after
+                self.assertGreater(task.run_after, timezone.now())
+                self.assertEqual(tasks.run_pending(), 0)
+                NotificationTask.objects.filter(pk=task.pk).update(run_after=timezone.now())
+                tasks.run_pending()
+        task.refresh_from_db()
+        self.assertEqual((task.status, task.attempts), ('failed', 2))
+        self.assertIn('boom', task.error)
+
+
+class InboxTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user(
+            username='seeker', email='seeker@example.com', user_type='job_seeker', profile_completed=True,
+        )
+        cls.other = CustomUser.objects.create_user(
+            username='other', email='other@example.com', user_type='job_seeker', profile_completed=True,
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.user)
+
+    def notify(self, user=None, **kwargs):
+        return Notification.objects.create(
+            recipient=user or self.user, notification_type='system', title='Hello', message='Hi', **kwargs,
+        )
+
+    def test_unread_count_is_cached_and_adjusted(self):
+        first = self.notify()
+        self.notify(is_read=True)
+        self.assertEqual(counters.get_unread_count(self.user.pk), 1)
+        with self.assertNumQueries(0):
+            self.assertEqual(counters.get_unread_count(self.user.pk), 1)
+
+        self.notify()
+        self.assertEqual(cache.get(counters.cache_key(self.user.pk)), 2)
+        first.delete()
+        self.assertEqual(counters.get_unread_count(self.user.pk), 1)
+
+        tasks.bulk_notify([self.user.pk, self.other.pk], notification_type='system', title='Bulk', message='Hi')
+        self.assertEqual(counters.get_unread_count(self.user.pk), 2)
+
+    def test_bulk_mark_read_is_one_update(self):
+        mine = [self.notify() for _ in range(3)]
+        theirs = self.notify(user=self.other)
+        self.assertEqual(counters.get_unread_count(self.user.pk), 3)
+
+        with self.assertNumQueries(1):
+            counters.mark_read(self.user, [mine[0].pk, theirs.pk])
+        self.assertFalse(Notification.objects.get(pk=theirs.pk).is_read)
+        self.assertEqual(counters.get_unread_count(self.user.pk), 2)
+
+        response = self.client.post(reverse('notifications:mark_read'), {'all': '1'}, follow=True)
+        self.assertContains(response, 'Marked 2 notifications as read.')
+        self.assertEqual(counters.get_unread_count(self.user.pk), 0)
+
+    def test_inbox_and_detail(self):
+        notification = self.notify(related_job_id=None)
+        self.notify(user=self.other)
+        response = self.client.get(reverse('notifications:inbox'))
+        self.assertEqual(list(response.context['notifications']), [notification])
+        self.assertContains(response, '<span id="notification-badge" class="badge rounded-pill bg-danger">1</span>', html=True)
+
+        self.client.get(reverse('notifications:detail', args=[notification.pk]))
+        self.assertTrue(Notification.objects.get(pk=notification.pk).is_read)
+        self.assertEqual(counters.get_unread_count(self.user.pk), 0)
+        unread = self.client.get(reverse('notifications:inbox'), {'unread': 1}).context['notifications']
+        self.assertEqual(len(unread), 0)
+        self.assertEqual(
+            self.client.get(reverse('notifications:detail', args=[notification.pk + 1])).status_code, 404,
+        )
+
+
+class EventHubTests(SimpleTestCase):
+    async def test_delivery_from_other_threads_and_overflow(self):
+        hub = events.Hub()
+        subscription = hub.subscribe(7, maxsize=2)
+        other = hub.subscribe(8)
+
+        thread = threading.Thread(target=hub.deliver, args=(7, {'event': 'notification', 'data': {'id': 1}}))
+        thread.start()
+        thread.join()
+        self.assertEqual((await subscription.get(1))['data'], {'id': 1})
+        self.assertIsNone(await other.get(0.01))
+
+        # A slow reader that falls behind is told to resync instead of growing its queue
+        for i in range(5):
+            hub.deliver(7, {'event': 'notification', 'data': {'id': i}})
+        await asyncio.sleep(0)
+        self.assertEqual((await subscription.get(1))['event'], 'resync')
+        self.assertIsNone(await subscription.get(0.01))
+
+        hub.unsubscribe(subscription)
+        hub.unsubscribe(other)
+        self.assertEqual(hub.connection_count(), 0)
+
+    def test_format_event(self):
+        self.assertEqual(
+            events.format_event({'event': 'notification', 'id': 3, 'data': {'title': 'Hi'}}),
+            'id: 3\nevent: notification\ndata: {"title":"Hi"}\n\n',
+        )
+
+
+class StopListening(BaseException):
+    pass
+
+
+class RedisBrokerTests(SimpleTestCase):
+    @override_settings(REDIS_URL='redis://localhost:6379/0')
+    def test_listener_survives_disconnects_and_bad_messages(self):
+        import redis
+
+        def dropped():
+            raise redis.ConnectionError('Connection closed by server.')
+            yield
+
+        def messages():
+            yield {'data': b'not json'}
+            yield {'data': b'{"event": {}}'}
+            yield {'data': b'{"user_id": 7, "event": {"event": "notification"}}'}
+            raise redis.ConnectionError('Connection closed by server.')
+
+        broker = events.RedisBroker()
+        broker.client = mock.Mock()
+        pubsub = broker.client.pubsub.return_value
+        # Redis is down for two attempts, then drops the connection twice
+        pubsub.subscribe.side_effect = [redis.ConnectionError(), redis.ConnectionError(), None, None]
+        pubsub.listen.side_effect = [dropped(), messages()]
+        with mock.patch.object(events.hub, 'deliver') as deliver, \
+                mock.patch.object(events.time, 'sleep', side_effect=[None, None, None, StopListening]) as sleep, \
+                self.assertLogs('notifications.events', 'WARNING') as logs:
+            with self.assertRaises(StopListening):
+                broker.listen()
+        deliver.assert_called_once_with(7, {'event': 'notification'})
+        # Backs off while Redis is down, and starts over once a subscription works
+        self.assertEqual([call.args for call in sleep.call_args_list], [(1,), (2,), (1,), (1,)])
+        self.assertEqual(sum('malformed' in line for line in logs.output), 2)
+
+    @override_settings(REDIS_URL='redis://localhost:6379/0')
+    def test_start_replaces_a_dead_listener(self):
+        broker = events.RedisBroker()
+        broker._listener = threading.Thread(target=lambda: None)
+        broker._listener.start()
+        broker._listener.join()
+        with mock.patch.object(events.threading, 'Thread') as thread:
+            broker.start()
+        thread.return_value.start.assert_called_once_with()
+
+
+class NotificationStreamTests(TestCase):
+    def test_disabled_by_default_and_needs_asgi(self):
+        user = CustomUser.objects.create_user(username='seeker', user_type='job_seeker', profile_completed=True)
+        self.client.force_login(user)
+        self.assertEqual(self.client.get(reverse('notifications:stream')).status_code, 204)
+        self.assertNotContains(self.client.get(reverse('notifications:inbox')), 'EventSource')
+
+        with self.settings(NOTIFICATIONS_STREAM_ENABLED=True):
+            self.assertContains(self.client.get(reverse('notifications:inbox')), 'EventSource')
+            # The test client is a WSGI request, like runserver or gunicorn
+            self.assertEqual(self.client.get(reverse('notifications:stream')).status_code, 501)
+
+    @override_settings(NOTIFICATIONS_STREAM_ENABLED=True)
+    async def test_stream_pushes_new_notifications(self):
+        response = await self.async_client.get(reverse('notifications:stream'))
+        self.assertEqual(response.status_code, 401)
+
+        user = await CustomUser.objects.acreate(
+            username='seeker', email='seeker@example.com', user_type='job_seeker', profile_completed=True,
+        )
+        await self.async_client.aforce_login(user)
+        response = await self.async_client.get(reverse('notifications:stream'))
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        content = aiter(response.streaming_content)
+        first = await anext(content)
+        self.assertIn(b'event: unread\ndata: {"count":0}', first)
+
+        events.get_broker().publish(user.pk, {'event': 'notification', 'data': {'id': 1}, 'id': 1})
+        self.assertEqual(await anext(content), b'id: 1\nevent: notification\ndata: {"id":1}\n\n')
+
+        # A client disconnect cancels the pending read, which unsubscribes the stream
+        pending = asyncio.ensure_future(anext(content))
+        await asyncio.sleep(0.01)
+        pending.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await pending
+        self.assertEqual(events.hub.connection_count(), 0)
@@ -0,0 +1,11 @@
+from django.urls import path
+from . import views
+
+app_name = 'notifications'
+
+urlpatterns = [
+    path('', views.InboxView.as_view(), name='inbox'),
+    path('<int:pk>/', views.NotificationDetailView.as_view(), name='detail'),
+    path('mark-read/', views.MarkReadView.as_view(), name='mark_read'),
+    path('stream/', views.NotificationStreamView.as_view(), name='stream'),
+]
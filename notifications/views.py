@@ -1,3 +1,99 @@
-from django.shortcuts import render
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib import messages
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpResponse, StreamingHttpResponse
+from django.shortcuts import redirect
+from django.views import View
+from django.views.generic import DetailView, ListView
 
-# Create your views here.
+from . import counters
+from .events import format_event, get_broker, hub
+from .models import Notification
+
+
+class InboxView(LoginRequiredMixin, ListView):
+    template_name = 'notifications/inbox.html'
+    context_object_name = 'notifications'
+    paginate_by = 20
+
+    def get_queryset(self):
+        qs = Notification.objects.filter(recipient=self.request.user)
+        if self.request.GET.get('unread'):
+            qs = qs.filter(is_read=False)
+        return qs.order_by('-created_at', '-id')
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['unread_only'] = bool(self.request.GET.get('unread'))
+        return context
+
+
+class NotificationDetailView(LoginRequiredMixin, DetailView):
+    template_name = 'notifications/notification_detail.html'
+    context_object_name = 'notification'
+
+    def get_queryset(self):
+        return Notification.objects.filter(recipient=self.request.user)
+
+    def get_object(self, queryset=None):
+        notification = super().get_object(queryset)
+        if not notification.is_read:
+            counters.mark_read(self.request.user, [notification.pk])
+            notification.is_read = True
+        return notification
+
+
+class MarkReadView(LoginRequiredMixin, View):
+    """Mark the selected notifications (or all of them) read with a single UPDATE"""
+
+    def post(self, request, *args, **kwargs):
+        if request.POST.get('all'):
+            updated = counters.mark_read(request.user)
+        else:
+            pks = [pk for pk in request.POST.getlist('notification_ids') if pk.isdigit()]
+            updated = counters.mark_read(request.user, pks) if pks else 0
+        messages.success(request, f'Marked {updated} notification{"" if updated == 1 else "s"} as read.')
+        return redirect('notifications:inbox')
+
+
+class NotificationStreamView(View):
+    """
+    Server-Sent Events stream of the user's new notifications and application
+    status changes. Serve the project with an ASGI server so each open stream
+    is a suspended coroutine rather than a blocked thread, and turn on
+    NOTIFICATIONS_STREAM_ENABLED.
+    """
+
+    async def get(self, request, *args, **kwargs):
+        if not getattr(settings, 'NOTIFICATIONS_STREAM_ENABLED', False):
+            # 204 tells EventSource clients to stop reconnecting
+            return HttpResponse(status=204)
+        if not isinstance(request, ASGIRequest):
+            # Under WSGI the endless response would hold a worker thread forever
+            return HttpResponse('The notification stream needs an ASGI server.', status=501)
+
+        user = await request.auser()
+        if not user.is_authenticated:
+            return HttpResponse(status=401)
+
+        unread = await sync_to_async(counters.get_unread_count)(user.pk)
+        get_broker().start()
+        subscription = hub.subscribe(user.pk)
+
+        async def stream():
+            heartbeat = getattr(settings, 'NOTIFICATION_STREAM_HEARTBEAT', 15)
+            try:
+                yield f"retry: 5000\n\n{format_event({'event': 'unread', 'data': {'count': unread}})}"
+                while True:
+                    event = await subscription.get(heartbeat)
+                    # A comment line keeps proxies from closing idle connections
+                    yield ': keepalive\n\n' if event is None else format_event(event)
+            finally:
+                hub.unsubscribe(subscription)
+
+        response = StreamingHttpResponse(stream(), content_type='text/event-stream')
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'
+        return response
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Profile, Skill
+from .models import Profile, ResumeDocument, Skill
 
 @admin.register(Skill)
 class SkillAdmin(admin.ModelAdmin):
@@ -12,4 +12,16 @@ class ProfileAdmin(admin.ModelAdmin):
     list_display = ('user', 'headline', 'location', 'open_to_work', 'is_complete')
     search_fields = ('user__username', 'headline', 'location')
     list_filter = ('open_to_work', 'visibility', 'created_at')
-    filter_horizontal = ('skills',)
\ No newline at end of file
+    filter_horizontal = ('skills',)
+
+    def get_queryset(self, request):
+        # is_complete reads the prefetched skills instead of querying per row
+        return super().get_queryset(request).select_related('user').prefetch_related('skills')
+
+@admin.register(ResumeDocument)
+class ResumeDocumentAdmin(admin.ModelAdmin):
+    list_display = ('file', 'size', 'status', 'created_at', 'extracted_at')
+    list_filter = ('status',)
+    search_fields = ('sha256', 'text')
+    readonly_fields = ('sha256', 'file', 'size', 'status', 'error', 'created_at', 'extracted_at', 'text')
+    filter_horizontal = ('inferred_skills',)
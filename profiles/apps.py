@@ -4,3 +4,12 @@ from django.apps import AppConfig
 class ProfilesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "profiles"
+
+    def ready(self):
+        from jobplatform.cache import bump_namespace_on_change
+        from .models import Profile, Skill
+
+        bump_namespace_on_change('profiles', Profile, Profile.skills.through, Skill)
+        bump_namespace_on_change('skills', Skill)
+        # Registers the resume text extraction task
+        from . import resumes  # noqa: F401
@@ -0,0 +1,137 @@
+"""
+In-memory skill catalog.
+
+Each process keeps a snapshot of the Skill table (id, name, category) plus a
+prefix trie over every word start of every name, so "lea" completes "Machine
+Learning" as well as "Leadership". The snapshot is rebuilt when the 'skills'
+cache namespace is bumped (any Skill save or delete), and the rows it is built
+from are shared through the cache, so the table is read once per change
+rather than once per process. Skill fields validate and label their values,
+the typeahead endpoint completes names, feed imports resolve skill names and
+resume processing spots skills in resume text against the snapshot, none of
+them with a query.
+"""
+import re
+import threading
+
+from django.db import DEFAULT_DB_ALIAS
+
+from .models import Skill
+from jobplatform.cache import get_or_compute, namespace_version, namespaced_key
+
+NAMESPACE = 'skills'
+
+# Skills kept per trie node, and so the most a completion can return
+MAX_SUGGESTIONS = 20
+
+# Words as skill names use them: "C++", "C#", "Node.js", "CI/CD"
+WORD_RE = re.compile(r'[\w+#./-]+')
+
+_catalog = None
+_catalog_lock = threading.Lock()
+
+
+def normalize(text):
+    return ' '.join(text.lower().split())
+
+
+def word_starts(name):
+    """``name`` from the start of each of its words: 'a b c' -> 'a b c', 'b c', 'c'"""
+    return [name[i:] for i, char in enumerate(name) if char != ' ' and (i == 0 or name[i - 1] == ' ')]
+
+
+class TrieNode:
+    __slots__ = ('children', 'ids')
+
+    def __init__(self):
+        self.children = {}
+        # The first MAX_SUGGESTIONS skills below this node, in name order
+        self.ids = []
+
+
+class SkillCatalog:
+    def __init__(self, rows, version=None):
+        self.version = version
+        self.skills = {}
+        self.by_name = {}
+        self.root = TrieNode()
+        self.max_words = 0
+        for row in sorted(rows, key=lambda row: (normalize(row[1]), row[0])):
+            # Loaded as if from the database, so the skills can be assigned to relations
+            skill = Skill.from_db(DEFAULT_DB_ALIAS, ['id', 'name', 'category'], row)
+            self.skills[skill.pk] = skill
+            self.by_name[skill.name.lower()] = skill
+            self.max_words = max(self.max_words, len(skill.name.split()))
+            for text in word_starts(normalize(skill.name)):
+                self.insert(text, skill.pk)
+
+    def insert(self, text, pk):
+        node = self.root
+        for char in text:
+            child = node.children.get(char)
+            if child is None:
+                child = node.children[char] = TrieNode()
+            node = child
+            # Names are inserted in order, so a repeat can only be the last id
+            if len(node.ids) < MAX_SUGGESTIONS and (not node.ids or node.ids[-1] != pk):
+                node.ids.append(pk)
+
+    def __len__(self):
+        return len(self.skills)
+
+    def __iter__(self):
+        return iter(self.skills.values())
+
+    def get(self, pk):
+        """The skill with primary key ``pk`` (an int or a numeric string), or None"""
+        try:
+            return self.skills.get(int(pk))
+        except (TypeError, ValueError):
+            return None
+
+    def lookup(self, name):
+        """The skill named ``name``, ignoring case, or None"""
+        return self.by_name.get(name.strip().lower())
+
+    def complete(self, prefix, limit=10):
+        """
+        Up to ``limit`` skills with a word starting with ``prefix``; names that
+        start with it come first, then alphabetically
+        """
+        prefix = normalize(prefix)
+        if not prefix:
+            return []
+        node = self.root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return []
+        skills = [self.skills[pk] for pk in node.ids]
+        skills.sort(key=lambda skill: not normalize(skill.name).startswith(prefix))
+        return skills[:limit]
+
+    def find_in_text(self, text):
+        """Skills named anywhere in ``text`` (e.g. a resume), in order of first mention"""
+        words = [word.rstrip('.,/-') for word in WORD_RE.findall(text.lower())]
+        found = {}
+        for start in range(len(words)):
+            for length in range(1, self.max_words + 1):
+                skill = self.by_name.get(' '.join(words[start:start + length]))
+                if skill is not None:
+                    found.setdefault(skill.pk, skill)
+        return list(found.values())
+
+
+def load_rows():
+    return list(Skill.objects.order_by().values_list('pk', 'name', 'category'))
+
+
+def get_catalog():
+    """This process's catalog, rebuilt if the 'skills' namespace moved on"""
+    global _catalog
+    version = namespace_version(NAMESPACE)
+    with _catalog_lock:
+        if _catalog is None or _catalog.version != version:
+            rows = get_or_compute(namespaced_key(NAMESPACE, 'rows'), load_rows)
+            _catalog = SkillCatalog(rows, version)
+        return _catalog
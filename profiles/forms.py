@@ -1,12 +1,109 @@
+import os
+
 from django import forms
-from .models import Profile, Skill
+from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile
+from django.template.defaultfilters import filesizeformat
+from django.urls import reverse_lazy
+
+from . import resumes
+from .catalog import MAX_SUGGESTIONS, get_catalog
+from .models import Profile
+
+
+class SkillPickerWidget(forms.Widget):
+    """
+    Autocomplete skill picker: the selected skills as removable chips (hidden
+    inputs, so the form posts like a SelectMultiple) and a text box completed
+    from the skill search endpoint. Only the selected skills are rendered.
+    """
+    template_name = 'profiles/widgets/skill_picker.html'
+    search_url = reverse_lazy('profiles:skill_search')
+
+    class Media:
+        js = ['js/skill_picker.js']
+
+    def __init__(self, attrs=None):
+        super().__init__({'placeholder': 'Type to search skills...', **(attrs or {})})
+        self.label_from_instance = str
+
+    def format_value(self, value):
+        if value is None:
+            return []
+        if not isinstance(value, (list, tuple)):
+            value = [value]
+        return [str(getattr(v, 'pk', v)) for v in value]
+
+    def get_context(self, name, value, attrs):
+        context = super().get_context(name, value, attrs)
+        catalog = get_catalog()
+        selected = filter(None, (catalog.get(pk) for pk in context['widget']['value']))
+        context['widget']['selected'] = [(skill.pk, self.label_from_instance(skill)) for skill in selected]
+        context['widget']['search_url'] = self.search_url
+        context['widget']['limit'] = MAX_SUGGESTIONS
+        return context
+
+    def value_from_datadict(self, data, files, name):
+        getter = getattr(data, 'getlist', None)
+        return getter(name) if getter else data.get(name)
+
+    def value_omitted_from_data(self, data, files, name):
+        # An empty selection posts nothing, like a SelectMultiple
+        return False
+
+
+class SkillMultipleChoiceField(forms.Field):
+    """
+    Multiple skills by id, validated against the skill catalog instead of a
+    queryset. Cleans to a list of Skill instances, which ModelForms save to a
+    many-to-many like ModelMultipleChoiceField's queryset.
+    """
+    widget = SkillPickerWidget
+    default_error_messages = {
+        'invalid_list': 'Enter a list of skills.',
+        'invalid_choice': 'Select a valid skill. %(value)s is not one of the available skills.',
+    }
+
+    def label_from_instance(self, skill):
+        return skill.name
+
+    def __deepcopy__(self, memo):
+        result = super().__deepcopy__(memo)
+        # Look the label up on the field at render time, so forms can override it
+        result.widget.label_from_instance = lambda skill: result.label_from_instance(skill)
+        return result
+
+    def prepare_value(self, value):
+        if isinstance(value, (list, tuple)):
+            return [getattr(v, 'pk', v) for v in value]
+        return value
+
+    def to_python(self, value):
+        if value in self.empty_values:
+            return []
+        if not isinstance(value, (list, tuple)):
+            raise forms.ValidationError(self.error_messages['invalid_list'], code='invalid_list')
+        catalog = get_catalog()
+        skills = []
+        for pk in value:
+            skill = catalog.get(getattr(pk, 'pk', pk))
+            if skill is None:
+                raise forms.ValidationError(
+                    self.error_messages['invalid_choice'], code='invalid_choice', params={'value': pk},
+                )
+            if skill not in skills:
+                skills.append(skill)
+        return skills
+
+    def has_changed(self, initial, data):
+        if self.disabled:
+            return False
+        initial = {str(pk) for pk in self.prepare_value(initial or [])}
+        return initial != {str(pk) for pk in data or []}
+
 
 class ProfileCompletionForm(forms.ModelForm):
-    skills = forms.ModelMultipleChoiceField(
-        queryset=Skill.objects.all(),
-        widget=forms.CheckboxSelectMultiple,
-        required=True
-    )
+    skills = SkillMultipleChoiceField(required=True)
 
     class Meta:
         model = Profile
@@ -29,4 +126,28 @@ class ProfileCompletionForm(forms.ModelForm):
 class ProfileForm(forms.ModelForm):
     class Meta:
         model = Profile
-        fields = '__all__'  # Add your Profile fields here
\ No newline at end of file
+        fields = '__all__'  # Add your Profile fields here
+
+    def clean_resume(self):
+        resume = self.cleaned_data.get('resume')
+        if isinstance(resume, UploadedFile):
+            extension = os.path.splitext(resume.name)[1].lower()
+            if extension not in resumes.EXTRACTORS:
+                raise forms.ValidationError(
+                    f"Upload a resume as {', '.join(sorted(e.lstrip('.').upper() for e in resumes.EXTRACTORS))}."
+                )
+            max_size = getattr(settings, 'RESUME_MAX_UPLOAD_SIZE', 10 * 1024 * 1024)
+            if resume.size > max_size:
+                raise forms.ValidationError(f'Resumes can be at most {filesizeformat(max_size)}.')
+        return resume
+
+    def save(self, commit=True):
+        resume = self.cleaned_data.get('resume')
+        if isinstance(resume, UploadedFile):
+            # Stored once per distinct content instead of under upload_to
+            document = resumes.store(resume)
+            self.instance.resume_document = document
+            self.instance.resume = document.file.name
+        elif not resume:
+            self.instance.resume_document = None
+        return super().save(commit)
\ No newline at end of file
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.6 on 2026-10-18 13:25
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("profiles", "0002_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ResumeDocument",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("sha256", models.CharField(max_length=64, unique=True)),
+                ("file", models.FileField(upload_to="resumes/")),
+                ("size", models.PositiveIntegerField()),
+                ("text", models.TextField(blank=True)),
+                ("status", models.CharField(choices=[("pending", "Pending"), ("done", "Text extracted"), ("failed", "Extraction failed")], default="pending", max_length=10)),
+                ("error", models.TextField(blank=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("extracted_at", models.DateTimeField(blank=True, null=True)),
+                ("inferred_skills", models.ManyToManyField(blank=True, related_name="+", to="profiles.skill")),
+            ],
+        ),
+        migrations.AddField(
+            model_name="profile",
+            name="resume_document",
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name="profiles", to="profiles.resumedocument"),
+        ),
+    ]
@@ -12,6 +12,31 @@ class Skill(models.Model):
     class Meta:
         ordering = ['name']
 
+class ResumeDocument(models.Model):
+    """
+    One stored resume file per distinct content (see profiles/resumes.py);
+    profiles that upload identical files share it
+    """
+    STATUS_CHOICES = (
+        ('pending', 'Pending'),
+        ('done', 'Text extracted'),
+        ('failed', 'Extraction failed'),
+    )
+
+    sha256 = models.CharField(max_length=64, unique=True)
+    file = models.FileField(upload_to='resumes/')
+    size = models.PositiveIntegerField()
+    text = models.TextField(blank=True)
+    inferred_skills = models.ManyToManyField(Skill, blank=True, related_name='+')
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='pending')
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    extracted_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return self.file.name
+
+
 class Profile(models.Model):
     user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
     headline = models.CharField(max_length=255, blank=True)
@@ -22,6 +47,9 @@ class Profile(models.Model):
     linkedin = models.URLField(blank=True, validators=[URLValidator()])
     github = models.URLField(blank=True, validators=[URLValidator()])
     resume = models.FileField(upload_to='resumes/', blank=True)
+    resume_document = models.ForeignKey(
+        ResumeDocument, on_delete=models.SET_NULL, null=True, blank=True, editable=False, related_name='profiles',
+    )
     profile_picture = models.ImageField(upload_to='profile_pics/', blank=True)
     
     # Professional Information
@@ -62,4 +90,9 @@ class Profile(models.Model):
     def is_complete(self):
         """Check if profile has minimum required information"""
         required_fields = [self.headline, self.bio, self.location]
-        return all(field for field in required_fields) and self.skills.exists()
\ No newline at end of file
+        if not all(field for field in required_fields):
+            return False
+        # Use prefetched skills when available (e.g. admin changelist) instead of one query per row
+        if 'skills' in getattr(self, '_prefetched_objects_cache', {}):
+            return bool(self.skills.all())
+        return self.skills.exists()
\ No newline at end of file
@@ -0,0 +1,147 @@
+"""
+Resume storage and text extraction.
+
+store() hashes an upload chunk by chunk (Django's upload handlers have already
+streamed anything over FILE_UPLOAD_MAX_MEMORY_SIZE to a temporary file) and
+saves it under a content-addressed name, ``resumes/<ab>/<sha256>.<ext>``. An
+upload whose content is already stored reuses that ResumeDocument, so
+identical files are kept once however many profiles upload them.
+
+New documents get an 'extract_resume_text' task on the background queue (see
+notifications/tasks.py), so the request never parses the file. The worker
+hands parsing to a pool of RESUME_EXTRACTION_WORKERS processes (see
+jobplatform/pools.py; 0 parses in the worker itself), which keeps a slow or
+crashing parser off the worker's own process. It stores the text and the
+catalog skills it mentions, which recruiters' applicant search matches
+(see applications.forms.ApplicationFilterForm).
+"""
+import hashlib
+import io
+import os
+import re
+from concurrent.futures.process import BrokenProcessPool
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from .catalog import get_catalog
+from .models import ResumeDocument
+from jobplatform.pools import WorkerPool, path_or_content
+from notifications.tasks import enqueue, handler
+
+CHUNK_SIZE = 1024 * 1024
+
+# Longer extracted text is truncated
+MAX_TEXT_LENGTH = 100000
+
+pool = WorkerPool('RESUME_EXTRACTION_WORKERS', 'RESUME_EXTRACTION_TIMEOUT')
+
+
+def extract_pdf(source):
+    from pypdf import PdfReader
+
+    return '\n'.join(page.extract_text() or '' for page in PdfReader(source).pages)
+
+
+def extract_docx(source):
+    import docx
+
+    document = docx.Document(source)
+    lines = [paragraph.text for paragraph in document.paragraphs]
+    for table in document.tables:
+        for row in table.rows:
+            lines.append(' '.join(cell.text for cell in row.cells))
+    return '\n'.join(lines)
+
+
+def extract_plain(source):
+    if isinstance(source, io.BytesIO):
+        data = source.getvalue()
+    else:
+        with open(source, 'rb') as f:
+            data = f.read()
+    return data.decode('utf-8', errors='replace')
+
+
+EXTRACTORS = {
+    '.pdf': extract_pdf,
+    '.docx': extract_docx,
+    '.txt': extract_plain,
+}
+
+
+def extract_text(source, extension):
+    """Text of a resume given as a file path or bytes; runs in the pool's processes"""
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+    text = EXTRACTORS[extension](source)
+    text = re.sub(r'[^\S\n]+', ' ', text)
+    return re.sub(r'\s*\n\s*', '\n', text).strip()[:MAX_TEXT_LENGTH]
+
+
+def content_name(sha256, extension):
+    return f'resumes/{sha256[:2]}/{sha256}{extension}'
+
+
+def file_hash(upload):
+    digest = hashlib.sha256()
+    for chunk in upload.chunks(CHUNK_SIZE):
+        digest.update(chunk)
+    upload.seek(0)
+    return digest.hexdigest()
+
+
+def store(upload):
+    """
+    The ResumeDocument for an uploaded file, saving the file and queueing its
+    text extraction only if no identical file is stored yet
+    """
+    sha256 = file_hash(upload)
+    document = ResumeDocument.objects.filter(sha256=sha256).first()
+    if document is not None:
+        return document
+
+    name = content_name(sha256, os.path.splitext(upload.name)[1].lower())
+    if not default_storage.exists(name):
+        name = default_storage.save(name, upload)
+    try:
+        with transaction.atomic():
+            document = ResumeDocument.objects.create(sha256=sha256, file=name, size=upload.size)
+    except IntegrityError:
+        # The same file was uploaded concurrently and stored first
+        return ResumeDocument.objects.get(sha256=sha256)
+    enqueue('extract_resume_text', document_id=document.pk)
+    return document
+
+
+@handler('extract_resume_text')
+def extract_resume(document_id):
+    """Extract a stored resume's text and the skills it mentions; returns the number of skills"""
+    document = ResumeDocument.objects.filter(pk=document_id, status='pending').first()
+    if document is None:
+        return 0
+
+    extension = os.path.splitext(document.file.name)[1].lower()
+    source = path_or_content(document.file.storage, document.file.name)
+    try:
+        text = pool.run(extract_text, source, extension)
+    except BrokenProcessPool:
+        # Not necessarily this file's fault, so let the queue retry it (after a delay)
+        raise
+    except Exception as exc:
+        # Corrupt, encrypted or unsupported files, or a parser that timed out
+        ResumeDocument.objects.filter(pk=document.pk).update(
+            status='failed', error=f'{type(exc).__name__}: {exc}', extracted_at=timezone.now(),
+        )
+        return 0
+
+    skills = get_catalog().find_in_text(text)
+    document.text = text
+    document.status = 'done'
+    document.error = ''
+    document.extracted_at = timezone.now()
+    document.save(update_fields=['text', 'status', 'error', 'extracted_at'])
+    document.inferred_skills.set(skills)
+    return len(skills)
@@ -1,3 +1,144 @@
-from django.test import TestCase
+import io
+import os
+import shutil
+import tempfile
 
-# Create your tests here.
+import docx
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from . import resumes
+from .catalog import get_catalog
+from .forms import ProfileCompletionForm, ProfileForm
+from .models import Profile, ResumeDocument, Skill
+from notifications.models import NotificationTask
+from notifications.tasks import run_pending
+from users.models import CustomUser
+
+
+class SkillCatalogTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.python = Skill.objects.create(name='Python', category='Languages')
+        cls.ml = Skill.objects.create(name='Machine Learning', category='Data')
+        cls.leadership = Skill.objects.create(name='Leadership')
+        cls.postgres = Skill.objects.create(name='PostgreSQL', category='Databases')
+
+    def setUp(self):
+        cache.clear()
+
+    def test_completes_any_word_start(self):
+        catalog = get_catalog()
+        self.assertEqual([s.name for s in catalog.complete('lea')], ['Leadership', 'Machine Learning'])
+        self.assertEqual([s.name for s in catalog.complete('MACHINE  le')], ['Machine Learning'])
+        self.assertEqual([s.name for s in catalog.complete('p')], ['PostgreSQL', 'Python'])
+        self.assertEqual(catalog.complete('rust'), [])
+        self.assertEqual(catalog.lookup(' python '), self.python)
+
+    def test_snapshot_follows_skill_changes(self):
+        self.assertIsNone(get_catalog().lookup('Rust'))
+        rust = Skill.objects.create(name='Rust')
+        self.assertEqual(get_catalog().lookup('rust'), rust)
+        rust.delete()
+        self.assertIsNone(get_catalog().lookup('rust'))
+
+    def test_search_endpoint(self):
+        get_catalog()
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse('profiles:skill_search'), {'q': 'post'})
+        self.assertEqual(response.json(), {
+            'results': [{'id': self.postgres.pk, 'name': 'PostgreSQL', 'category': 'Databases'}],
+        })
+
+    def test_form_validates_and_renders_from_the_catalog(self):
+        user = CustomUser.objects.create_user(username='seeker', user_type='job_seeker')
+        profile = Profile.objects.create(user=user)
+        get_catalog()
+        # Only the profile's current skills (the form's initial value) are read
+        with self.assertNumQueries(1):
+            form = ProfileCompletionForm({'skills': [self.python.pk, 0]}, instance=profile)
+            self.assertEqual(list(form.errors), ['skills'])
+            html = str(form['skills'])
+        self.assertIn('Python', html)
+        self.assertNotIn('Leadership', html)
+
+        form = ProfileCompletionForm({'skills': [self.python.pk, self.ml.pk]}, instance=profile)
+        self.assertTrue(form.is_valid(), form.errors)
+        form.save()
+        self.assertEqual(set(profile.skills.all()), {self.python, self.ml})
+
+
+@override_settings(RESUME_EXTRACTION_WORKERS=0)
+class ResumePipelineTests(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        media_root = tempfile.mkdtemp()
+        cls.addClassCleanup(shutil.rmtree, media_root)
+        cls.enterClassContext(override_settings(MEDIA_ROOT=media_root))
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.python = Skill.objects.create(name='Python')
+        cls.ml = Skill.objects.create(name='Machine Learning')
+
+    def setUp(self):
+        cache.clear()
+
+    def docx_upload(self, *paragraphs):
+        document = docx.Document()
+        for paragraph in paragraphs:
+            document.add_paragraph(paragraph)
+        data = io.BytesIO()
+        document.save(data)
+        return SimpleUploadedFile('resume.docx', data.getvalue())
+
+    def test_identical_uploads_are_stored_once(self):
+        content = b'Data scientist: Python and machine learning.'
+        first = resumes.store(SimpleUploadedFile('cv.txt', content))
+        second = resumes.store(SimpleUploadedFile('resume.txt', content))
+        self.assertEqual(first, second)
+        self.assertEqual(first.file.name, f'resumes/{first.sha256[:2]}/{first.sha256}.txt')
+        self.assertEqual(os.listdir(os.path.dirname(first.file.path)), [f'{first.sha256}.txt'])
+        self.assertEqual(NotificationTask.objects.filter(kind='extract_resume_text').count(), 1)
+
+        self.assertEqual(run_pending(), 1)
+        first.refresh_from_db()
+        self.assertEqual(first.status, 'done')
+        self.assertEqual(first.text, content.decode())
+        self.assertEqual(list(first.inferred_skills.order_by('name')), [self.ml, self.python])
+
+    def test_extracts_docx_in_the_process_pool(self):
+        document = resumes.store(self.docx_upload('Jane Doe', 'Built   Python services'))
+        with self.settings(RESUME_EXTRACTION_WORKERS=1):
+            run_pending()
+        document.refresh_from_db()
+        self.assertEqual(document.text, 'Jane Doe\nBuilt Python services')
+        self.assertEqual(list(document.inferred_skills.all()), [self.python])
+
+    def test_unreadable_resume_is_marked_failed(self):
+        document = resumes.store(SimpleUploadedFile('resume.pdf', b'not a pdf'))
+        with self.assertLogs('pypdf', 'WARNING'):
+            run_pending()
+        document.refresh_from_db()
+        self.assertEqual(document.status, 'failed')
+        self.assertTrue(document.error)
+
+    def test_form_stores_upload_by_content(self):
+        form = ProfileForm(files={'resume': SimpleUploadedFile('resume.exe', b'MZ')})
+        self.assertIn('resume', form.errors)
+
+        user = CustomUser.objects.create_user(username='seeker', user_type='job_seeker')
+        profile = Profile.objects.create(user=user)
+        form = ProfileForm(
+            {'user': user.pk, 'visibility': 'public'},
+            {'resume': self.docx_upload('Python')},
+            instance=profile,
+        )
+        self.assertTrue(form.is_valid(), form.errors)
+        form.save()
+        profile.refresh_from_db()
+        self.assertEqual(profile.resume.name, profile.resume_document.file.name)
+        self.assertTrue(profile.resume.name.startswith('resumes/'))
@@ -5,4 +5,5 @@ urlpatterns = [
     # ...existing code...
     path('edit/', views.edit_profile, name='edit_profile'),
     path('view/', views.view_profile, name='view_profile'), 
+    path('skills/search/', views.skill_search, name='skill_search'),
 ]
\ No newline at end of file
@@ -1,6 +1,9 @@
+from django.http import JsonResponse
 from django.shortcuts import render
+from django.utils.cache import patch_cache_control
 
 import companies
+from .catalog import MAX_SUGGESTIONS, get_catalog
 from .forms import ProfileForm
 from companies.forms import CompanyProfileForm
 from companies.models import Company
@@ -39,4 +42,17 @@ def view_profile(request):
         profile_instance = company
     else:
         profile_instance = getattr(user, 'profile', None)
-    return render(request, 'profiles/view_profile.html', {'profile': profile_instance})
\ No newline at end of file
+    return render(request, 'profiles/view_profile.html', {'profile': profile_instance})
+
+def skill_search(request):
+    """Typeahead for skill pickers: ``?q=<prefix>&limit=<n>``, answered from the skill catalog"""
+    try:
+        limit = min(int(request.GET.get('limit', 10)), MAX_SUGGESTIONS)
+    except ValueError:
+        limit = 10
+    skills = get_catalog().complete(request.GET.get('q', ''), limit=max(limit, 1))
+    response = JsonResponse({
+        'results': [{'id': skill.pk, 'name': skill.name, 'category': skill.category} for skill in skills],
+    })
+    patch_cache_control(response, public=True, max_age=60)
+    return response
@@ -0,0 +1,121 @@
+// Autocomplete for SkillPickerWidget (profiles/forms.py): suggestions come from
+// the skill search endpoint, picked skills become chips with hidden inputs.
+(function () {
+  function init(picker) {
+    if (picker.dataset.ready) return;
+    picker.dataset.ready = '1';
+    var input = picker.querySelector('input[type=text]');
+    var selected = picker.querySelector('.skill-picker-selected');
+    var results = picker.querySelector('[data-skill-results]');
+    var timer = null;
+    var request = 0;
+
+    function chosen() {
+      return Array.prototype.map.call(selected.querySelectorAll('input[type=hidden]'), function (el) {
+        return el.value;
+      });
+    }
+
+    function close() {
+      results.classList.add('d-none');
+      results.innerHTML = '';
+      input.setAttribute('aria-expanded', 'false');
+    }
+
+    function add(skill) {
+      if (chosen().indexOf(String(skill.id)) === -1) {
+        var chip = document.createElement('span');
+        chip.className = 'badge bg-primary d-inline-flex align-items-center';
+        chip.setAttribute('data-skill-chip', '');
+        chip.appendChild(document.createTextNode(skill.name + ' '));
+        var hidden = document.createElement('input');
+        hidden.type = 'hidden';
+        hidden.name = picker.dataset.name;
+        hidden.value = skill.id;
+        chip.appendChild(hidden);
+        var remove = document.createElement('button');
+        remove.type = 'button';
+        remove.className = 'btn-close btn-close-white ms-1';
+        remove.style.fontSize = '.6em';
+        remove.setAttribute('aria-label', 'Remove ' + skill.name);
+        remove.setAttribute('data-skill-remove', '');
+        chip.appendChild(remove);
+        selected.appendChild(chip);
+      }
+      input.value = '';
+      close();
+      input.focus();
+    }
+
+    function show(skills) {
+      results.innerHTML = '';
+      var taken = chosen();
+      skills.filter(function (skill) { return taken.indexOf(String(skill.id)) === -1; }).forEach(function (skill) {
+        var item = document.createElement('button');
+        item.type = 'button';
+        item.className = 'list-group-item list-group-item-action py-1';
+        item.setAttribute('role', 'option');
+        item.textContent = skill.name;
+        if (skill.category) {
+          var category = document.createElement('small');
+          category.className = 'text-muted ms-2';
+          category.textContent = skill.category;
+          item.appendChild(category);
+        }
+        item.addEventListener('click', function () { add(skill); });
+        results.appendChild(item);
+      });
+      var empty = !results.children.length;
+      results.classList.toggle('d-none', empty);
+      input.setAttribute('aria-expanded', empty ? 'false' : 'true');
+    }
+
+    function search() {
+      var q = input.value.trim();
+      if (!q) return close();
+      var current = ++request;
+      var url = picker.dataset.searchUrl + '?q=' + encodeURIComponent(q) + '&limit=' + picker.dataset.limit;
+      fetch(url, {headers: {'Accept': 'application/json'}})
+        .then(function (response) { return response.json(); })
+        .then(function (data) {
+          // Ignore answers to queries the user has already typed past
+          if (current === request) show(data.results);
+        })
+        .catch(close);
+    }
+
+    input.addEventListener('input', function () {
+      clearTimeout(timer);
+      timer = setTimeout(search, 150);
+    });
+    input.addEventListener('keydown', function (event) {
+      if (event.key === 'Enter') {
+        // Pick the first suggestion instead of submitting the form
+        event.preventDefault();
+        var first = results.querySelector('button');
+        if (first) first.click();
+      } else if (event.key === 'Escape') {
+        close();
+      } else if (event.key === 'Backspace' && !input.value) {
+        var chips = selected.querySelectorAll('[data-skill-chip]');
+        if (chips.length) chips[chips.length - 1].remove();
+      }
+    });
+    input.addEventListener('blur', function () { setTimeout(close, 200); });
+    selected.addEventListener('click', function (event) {
+      if (event.target.hasAttribute('data-skill-remove')) {
+        event.target.closest('[data-skill-chip]').remove();
+      }
+    });
+  }
+
+  function initAll() {
+    document.querySelectorAll('[data-skill-picker]').forEach(init);
+  }
+
+  if (document.readyState === 'loading') {
+    document.addEventListener('DOMContentLoaded', initAll);
+  } else {
+    initAll();
+  }
+})();
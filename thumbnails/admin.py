@@ -0,0 +1,8 @@
+from django.contrib import admin
+from .models import Thumbnail
+
+@admin.register(Thumbnail)
+class ThumbnailAdmin(admin.ModelAdmin):
+    list_display = ('source', 'size', 'file', 'width', 'height', 'created_at')
+    list_filter = ('size',)
+    search_fields = ('source',)
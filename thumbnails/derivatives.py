@@ -0,0 +1,183 @@
+"""
+Thumbnails of uploaded images (profile pictures and company logos).
+
+Saving an image to one of SOURCES queues a 'generate_thumbnails' task on the
+background queue (see notifications/tasks.py). The worker decodes the image
+once, in a pool of THUMBNAIL_WORKERS processes (see jobplatform/pools.py),
+and writes one thumbnail per size in THUMBNAIL_SIZES, each fitted into a
+square of that many pixels and encoded as THUMBNAIL_FORMAT. Files are named
+after the source content, not its name:
+``thumbnails/<ab>/<sha256>-<size>.webp``. A thumbnail URL never changes what
+it points to, so it can be served with a far-future immutable Cache-Control,
+and identical uploads share their files.
+
+Templates ask for an image at a display size (see templatetags/thumbnails.py)
+and get the smallest thumbnail at least that big. Which thumbnails a source
+has is cached per source. Listing pages load them for a whole page with
+prefetch() and pass the result to templates as ``prefetched_thumbnails``.
+Until an image's thumbnails exist, pages show the original.
+"""
+import hashlib
+import io
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import transaction
+
+from .models import Thumbnail
+from jobplatform.pools import WorkerPool, path_or_content
+from notifications.tasks import enqueue, handler
+
+# (app label, model, ImageField) of every image that gets thumbnails
+SOURCES = [
+    ('profiles', 'Profile', 'profile_picture'),
+    ('companies', 'Company', 'logo'),
+]
+
+EXTENSIONS = {'WEBP': 'webp', 'JPEG': 'jpg', 'PNG': 'png'}
+
+CACHE_TIMEOUT = 24 * 60 * 60
+# How long a source without thumbnails is remembered as such, and the
+# interval between attempts to generate them
+MISSING_TIMEOUT = 10 * 60
+
+CHUNK_SIZE = 1024 * 1024
+
+pool = WorkerPool('THUMBNAIL_WORKERS', 'THUMBNAIL_TIMEOUT')
+
+
+def sizes():
+    return sorted(getattr(settings, 'THUMBNAIL_SIZES', [64, 128, 256, 512]))
+
+
+def pick_size(size):
+    """The smallest configured size of at least ``size`` pixels (else the largest)"""
+    available = sizes()
+    return next((s for s in available if s >= size), available[-1])
+
+
+def thumbnail_name(sha256, size, fmt):
+    return f'thumbnails/{sha256[:2]}/{sha256}-{size}.{EXTENSIONS[fmt]}'
+
+
+def render(source, sizes, fmt, quality):
+    """
+    Encode ``source`` (a file path or bytes) fitted into each of ``sizes``;
+    runs in the pool's processes. Returns ``[(size, data, width, height)]``.
+    """
+    from PIL import Image, ImageOps
+
+    image = Image.open(io.BytesIO(source) if isinstance(source, bytes) else source)
+    # Let the JPEG decoder downscale while decoding: far less work for phone photos
+    image.draft('RGB', (max(sizes), max(sizes)))
+    image = ImageOps.exif_transpose(image)
+    has_alpha = image.mode in ('RGBA', 'LA', 'PA') or 'transparency' in image.info
+    image = image.convert('RGBA' if has_alpha and fmt != 'JPEG' else 'RGB')
+
+    rendered = []
+    # Largest first, each scaled down from the previous one
+    for size in sorted(sizes, reverse=True):
+        image.thumbnail((size, size), Image.LANCZOS)
+        data = io.BytesIO()
+        image.save(data, fmt, quality=quality, optimize=True)
+        rendered.append((size, data.getvalue(), image.width, image.height))
+    return rendered
+
+
+def image_size(name):
+    from PIL import Image
+
+    with default_storage.open(name, 'rb') as f:
+        return Image.open(f).size
+
+
+def generate(source):
+    """Create (or reuse) every thumbnail of the image stored as ``source``; returns how many"""
+    fmt = getattr(settings, 'THUMBNAIL_FORMAT', 'WEBP')
+    digest = hashlib.sha256()
+    with default_storage.open(source, 'rb') as f:
+        for chunk in f.chunks(CHUNK_SIZE):
+            digest.update(chunk)
+    sha256 = digest.hexdigest()
+
+    names = {size: thumbnail_name(sha256, size, fmt) for size in sizes()}
+    # Another upload of the same image already produced these
+    missing = [size for size, name in names.items() if not default_storage.exists(name)]
+    rows = {}
+    if missing:
+        quality = getattr(settings, 'THUMBNAIL_QUALITY', 80)
+        content = path_or_content(default_storage, source)
+        for size, data, width, height in pool.run(render, content, missing, fmt, quality):
+            name = default_storage.save(names[size], ContentFile(data))
+            rows[size] = Thumbnail(source=source, size=size, file=name, width=width, height=height)
+    for size, name in names.items():
+        if size not in rows:
+            width, height = image_size(name)
+            rows[size] = Thumbnail(source=source, size=size, file=name, width=width, height=height)
+
+    with transaction.atomic():
+        Thumbnail.objects.filter(source=source).delete()
+        Thumbnail.objects.bulk_create(rows.values())
+    cache.delete(cache_key(source))
+    return len(rows)
+
+
+@handler('generate_thumbnails')
+def generate_task(source):
+    if not default_storage.exists(source):
+        # Replaced or deleted since the task was queued
+        return 0
+    return generate(source)
+
+
+def schedule(source):
+    """Queue thumbnail generation for ``source``, at most once per MISSING_TIMEOUT"""
+    if cache.add(f'thumbnails:scheduled:{cache_key(source)}', True, MISSING_TIMEOUT):
+        enqueue('generate_thumbnails', source=source)
+
+
+def cache_key(source):
+    return 'thumbnails:' + hashlib.sha1(source.encode()).hexdigest()
+
+
+def prefetch(sources):
+    """
+    ``{source: {size: (file, width, height)}}`` for storage names ``sources``,
+    from the cache or one query, queueing generation for images with none yet
+    """
+    sources = {source for source in sources if source}
+    if not sources:
+        return {}
+    keys = {cache_key(source): source for source in sources}
+    found = {keys[key]: value for key, value in cache.get_many(keys).items()}
+    missing = sources - found.keys()
+    if missing:
+        loaded = {source: {} for source in missing}
+        for thumbnail in Thumbnail.objects.filter(source__in=missing):
+            loaded[thumbnail.source][thumbnail.size] = (thumbnail.file, thumbnail.width, thumbnail.height)
+        cache.set_many({cache_key(s): t for s, t in loaded.items() if t}, CACHE_TIMEOUT)
+        for source, thumbnails in loaded.items():
+            if not thumbnails:
+                cache.set(cache_key(source), {}, MISSING_TIMEOUT)
+                schedule(source)
+        found.update(loaded)
+    return found
+
+
+def choose(thumbnails, size):
+    """``(url, width, height)`` of the thumbnail in ``thumbnails`` (as from prefetch()) for ``size``"""
+    if not thumbnails:
+        return None
+    chosen = pick_size(size)
+    if chosen not in thumbnails:
+        # THUMBNAIL_SIZES changed since this image was processed
+        chosen = min(thumbnails, key=lambda s: (s < size, abs(s - size)))
+    name, width, height = thumbnails[chosen]
+    return default_storage.url(name), width, height
+
+
+def thumbnail(source, size):
+    """``(url, width, height)`` of ``source``'s thumbnail for ``size``, or None if it has none yet"""
+    return choose(prefetch([source]).get(source), size)
@@ -0,0 +1,36 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from thumbnails import derivatives
+from thumbnails.models import Thumbnail
+
+
+class Command(BaseCommand):
+    help = "Generate missing thumbnails for every profile picture and company logo"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--all', action='store_true', help='Regenerate images that already have thumbnails')
+
+    def handle(self, *args, **options):
+        sources = set()
+        for app_label, model_name, field_name in derivatives.SOURCES:
+            model = apps.get_model(app_label, model_name)
+            sources.update(model.objects.exclude(**{field_name: ''}).values_list(field_name, flat=True))
+        if not options['all']:
+            sources -= set(Thumbnail.objects.values_list('source', flat=True))
+
+        # Each thread waits on a render in the process pool, so the pool stays busy
+        workers = max(1, getattr(settings, 'THUMBNAIL_WORKERS', 2))
+        with ThreadPoolExecutor(max_workers=workers) as threads:
+            created = sum(threads.map(self.generate, sorted(sources)))
+        self.stdout.write(self.style.SUCCESS(f'Generated {created} thumbnails for {len(sources)} images.'))
+
+    def generate(self, source):
+        try:
+            return derivatives.generate_task(source)
+        except Exception as exc:
+            self.stderr.write(f'{source}: {exc}')
+            return 0
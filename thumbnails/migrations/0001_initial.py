@@ -0,0 +1,29 @@
+# Generated by Django 5.2.6 on 2026-10-18 13:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Thumbnail",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("source", models.CharField(help_text="Storage name of the original image", max_length=255)),
+                ("size", models.PositiveIntegerField(help_text="Bounding box, in pixels")),
+                ("file", models.CharField(max_length=255)),
+                ("width", models.PositiveIntegerField()),
+                ("height", models.PositiveIntegerField()),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "constraints": [models.UniqueConstraint(fields=("source", "size"), name="unique_thumbnail_size")],
+            },
+        ),
+    ]
@@ -0,0 +1,19 @@
+from django.db import models
+
+
+class Thumbnail(models.Model):
+    """One stored size of an uploaded image (see thumbnails/derivatives.py)"""
+    source = models.CharField(max_length=255, help_text='Storage name of the original image')
+    size = models.PositiveIntegerField(help_text='Bounding box, in pixels')
+    file = models.CharField(max_length=255)
+    width = models.PositiveIntegerField()
+    height = models.PositiveIntegerField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['source', 'size'], name='unique_thumbnail_size'),
+        ]
+
+    def __str__(self):
+        return self.file
@@ -0,0 +1,20 @@
+from django.apps import apps
+from django.db.models.signals import post_save
+
+from . import derivatives
+
+
+def thumbnail_handler(field_name):
+    def queue_thumbnails(sender, instance, raw=False, **kwargs):
+        image = getattr(instance, field_name)
+        if image and not raw:
+            # Queues generation unless the image already has thumbnails
+            derivatives.prefetch([image.name])
+    return queue_thumbnails
+
+
+for app_label, model_name, field_name in derivatives.SOURCES:
+    post_save.connect(
+        thumbnail_handler(field_name), sender=apps.get_model(app_label, model_name), weak=False,
+        dispatch_uid=f'thumbnails:{app_label}.{model_name}.{field_name}',
+    )
@@ -0,0 +1,48 @@
+from django import template
+from django.utils.html import format_html, format_html_join
+
+from thumbnails import derivatives
+
+register = template.Library()
+
+
+def lookup(context, image):
+    """``image``'s thumbnails from the view's ``prefetched_thumbnails``, else from prefetch()"""
+    prefetched = context.get('prefetched_thumbnails') or {}
+    if image.name in prefetched:
+        return prefetched[image.name]
+    return derivatives.prefetch([image.name]).get(image.name)
+
+
+@register.simple_tag(takes_context=True)
+def thumbnail_url(context, image, size):
+    """URL of ``image`` (an ImageField value) for display at ``size`` pixels"""
+    if not image:
+        return ''
+    found = derivatives.choose(lookup(context, image), int(size))
+    return found[0] if found else image.url
+
+
+@register.simple_tag(takes_context=True)
+def thumbnail(context, image, size, **attrs):
+    """
+    ``<img>`` of ``image`` for display at ``size`` pixels, with a double-size
+    candidate for high-density screens. Extra keyword arguments become
+    attributes (e.g. ``alt="Logo" class="rounded"``).
+    """
+    if not image:
+        return ''
+    size = int(size)
+    thumbnails = lookup(context, image)
+    found = derivatives.choose(thumbnails, size)
+    if found:
+        url, width, height = found
+        attrs = {'src': url, 'width': width, 'height': height, **attrs}
+        double = derivatives.choose(thumbnails, size * 2)
+        if double and double[0] != url:
+            attrs['srcset'] = f'{url} 1x, {double[0]} 2x'
+    else:
+        # No thumbnails yet: the original, kept to the requested size
+        attrs = {'src': image.url, 'style': f'max-width: {size}px; max-height: {size}px', **attrs}
+    attrs = {'loading': 'lazy', 'decoding': 'async', **attrs}
+    return format_html('<img{}>', format_html_join('', ' {}="{}"', attrs.items()))
@@ -0,0 +1,120 @@
+import io
+import os
+import shutil
+import tempfile
+
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.template import Context, Template
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from PIL import Image
+
+from . import derivatives
+from .models import Thumbnail
+from applications.models import Application
+from companies.models import Company
+from jobs.models import Job
+from notifications.tasks import run_pending
+from profiles.models import Profile
+from users.models import CustomUser
+
+DUMMY_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}}
+
+
+def jpeg(width, height, color='red'):
+    data = io.BytesIO()
+    Image.new('RGB', (width, height), color).save(data, 'JPEG')
+    return SimpleUploadedFile('photo.jpg', data.getvalue())
+
+
+@override_settings(THUMBNAIL_SIZES=[64, 128], THUMBNAIL_FORMAT='WEBP', THUMBNAIL_WORKERS=0)
+class ThumbnailTests(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.media_root = tempfile.mkdtemp()
+        cls.addClassCleanup(shutil.rmtree, cls.media_root)
+        cls.enterClassContext(override_settings(MEDIA_ROOT=cls.media_root))
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user(username='seeker', user_type='job_seeker')
+
+    def setUp(self):
+        cache.clear()
+
+    def render(self, template, **context):
+        return Template('{% load thumbnails %}' + template).render(Context(context))
+
+    def test_upload_queues_content_addressed_thumbnails(self):
+        profile = Profile.objects.create(user=self.user, profile_picture=jpeg(1200, 600))
+        source = profile.profile_picture.name
+        # Until the worker runs, pages show the original
+        self.assertIn(f'src="/media/{source}"', self.render('{% thumbnail image 64 %}', image=profile.profile_picture))
+
+        self.assertEqual(run_pending(), 1)
+        thumbnails = {t.size: t for t in Thumbnail.objects.filter(source=source)}
+        self.assertEqual(sorted(thumbnails), [64, 128])
+        self.assertEqual((thumbnails[128].width, thumbnails[128].height), (128, 64))
+        self.assertRegex(thumbnails[64].file, r'^thumbnails/[0-9a-f]{2}/[0-9a-f]{64}-64\.webp$')
+        with Image.open(os.path.join(self.media_root, thumbnails[64].file)) as image:
+            self.assertEqual((image.format, image.size), ('WEBP', (64, 32)))
+
+        html = self.render('{% thumbnail image 50 alt="Me" %}', image=profile.profile_picture)
+        self.assertIn(f'src="/media/{thumbnails[64].file}"', html)
+        self.assertIn(f'/media/{thumbnails[128].file} 2x', html)
+        self.assertIn('width="64" height="32"', html)
+        self.assertIn('alt="Me"', html)
+        self.assertEqual(
+            self.render('{% thumbnail_url image 100 %}', image=profile.profile_picture),
+            f'/media/{thumbnails[128].file}',
+        )
+
+    def test_identical_images_share_thumbnail_files(self):
+        Profile.objects.create(user=self.user, profile_picture=jpeg(300, 300, 'blue'))
+        recruiter = CustomUser.objects.create_user(username='recruiter', user_type='recruiter')
+        company = Company.objects.create(name='Acme', created_by=recruiter, logo=jpeg(300, 300, 'blue'))
+        with self.settings(THUMBNAIL_WORKERS=1):
+            self.assertEqual(run_pending(), 2)
+
+        files = Thumbnail.objects.values_list('file', flat=True)
+        self.assertEqual(Thumbnail.objects.filter(source=company.logo.name).count(), 2)
+        self.assertEqual(len(set(files)), 2)
+
+    def test_prefetch_loads_many_sources_in_one_query(self):
+        names = [Profile.objects.create(user=CustomUser.objects.create_user(username=f'u{i}'),
+                                        profile_picture=jpeg(100, 100)).profile_picture.name for i in range(3)]
+        run_pending()
+        cache.clear()
+        with self.assertNumQueries(1):
+            found = derivatives.prefetch(names)
+        self.assertEqual({len(sizes) for sizes in found.values()}, {2})
+        with self.assertNumQueries(0):
+            derivatives.prefetch(names)
+
+    def test_applications_page_reads_photos_in_one_query(self):
+        recruiter = CustomUser.objects.create_user(username='recruiter', user_type='recruiter', profile_completed=True)
+        job = Job.objects.create(
+            title='Engineer', description='Build.', requirements='Skills.', company_name='Acme',
+            location='Remote', location_type='remote', job_type='full_time', experience_level='mid',
+            posted_by=recruiter,
+        )
+        self.client.force_login(recruiter)
+
+        def add_applicants(count):
+            for i in range(count):
+                seeker = CustomUser.objects.create_user(username=f'photo{Application.objects.count()}')
+                Profile.objects.create(user=seeker, profile_picture=jpeg(200, 200, f'#{i}{i}0000'))
+                Application.objects.create(job=job, applicant=seeker)
+            run_pending()
+            # Nothing cached: the page reads every photo's thumbnails itself, within its query budget
+            with self.settings(CACHES=DUMMY_CACHES, QUERY_INSTRUMENTATION=True, QUERY_BUDGET_ENFORCE=True):
+                with CaptureQueriesContext(connection) as queries:
+                    response = self.client.get(reverse('jobs:job_applications', args=[job.pk]))
+            self.assertContains(response, '/media/thumbnails/', count=3 * Application.objects.count())
+            return len(queries)
+
+        self.assertEqual(add_applicants(1), add_applicants(3))
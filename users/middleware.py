@@ -1,33 +1,68 @@
+import re
+
+from django.conf import settings
+from django.contrib import messages
+from django.contrib.auth import SESSION_KEY
 from django.shortcuts import redirect
 from django.urls import reverse
-from django.contrib import messages
+from django.utils.functional import cached_property
+
+# Session key caching CustomUser.profile_completed for the logged-in user
+PROFILE_COMPLETED_SESSION_KEY = 'profile_completed'
+
+# URL names (and path prefixes) reachable before the profile is complete
+EXEMPT_URL_NAMES = [
+    'account_login',
+    'account_logout',
+    'account_signup',
+    'profile_completion',
+    'users:profile_completion',
+    'users:complete_job_seeker_profile',
+    'users:complete_recruiter_profile',
+    # Skill pickers on the profile completion forms autocomplete from here
+    'profiles:skill_search',
+]
+EXEMPT_PREFIXES = ['/admin/', '/accounts/']
+
+
+def remember_profile_completed(request, user):
+    """Store the user's profile_completed flag in their session"""
+    if hasattr(request, 'session'):
+        request.session[PROFILE_COMPLETED_SESSION_KEY] = bool(user.profile_completed)
+
+
+def profile_completed(request):
+    """Read the flag from the session, loading the user only if it isn't cached yet"""
+    completed = request.session.get(PROFILE_COMPLETED_SESSION_KEY)
+    if completed is None:
+        # An anonymous user here means a stale session, which login_required handles
+        completed = bool(getattr(request.user, 'profile_completed', True))
+        request.session[PROFILE_COMPLETED_SESSION_KEY] = completed
+    return completed
+
 
 class ProfileCompletionMiddleware:
     """Ensure users complete their profiles before accessing the app"""
-    
+
     def __init__(self, get_response):
         self.get_response = get_response
 
+    @cached_property
+    def exempt_re(self):
+        # Resolved on the first request (the URLconf may not be importable yet in
+        # __init__) and then reused; static and media files are exempt too
+        prefixes = [reverse(name) for name in EXEMPT_URL_NAMES] + EXEMPT_PREFIXES
+        prefixes += [url for url in (settings.STATIC_URL, settings.MEDIA_URL) if url]
+        prefixes = sorted({'/' + p.lstrip('/') for p in prefixes}, key=len, reverse=True)
+        return re.compile('|'.join(re.escape(p) for p in prefixes))
+
     def __call__(self, request):
-        # URLs that don't require profile completion
-        exempt_urls = [
-            reverse('account_login'),
-            reverse('account_logout'),
-            reverse('account_signup'),
-            reverse('profile_completion'),
-            reverse('complete_job_seeker_profile'),
-            reverse('complete_recruiter_profile'),
-            '/admin/',
-            '/accounts/',
-        ]
-
-        if (request.user.is_authenticated and 
-            not request.user.profile_completed and 
-            request.path not in exempt_urls and
-            not any(request.path.startswith(url) for url in exempt_urls)):
-            
+        # Exempt paths never touch the session, and once the flag is cached in
+        # the session the user row isn't loaded here at all
+        if (not self.exempt_re.match(request.path) and
+                SESSION_KEY in request.session and
+                not profile_completed(request)):
             messages.info(request, 'Please complete your profile to continue.')
             return redirect('profile_completion')
 
-        response = self.get_response(request)
-        return response
\ No newline at end of file
+        return self.get_response(request)
@@ -0,0 +1,10 @@
+from django.contrib.auth.signals import user_logged_in
+from django.dispatch import receiver
+
+from .middleware import remember_profile_completed
+
+
+@receiver(user_logged_in)
+def cache_profile_completed_on_login(sender, request, user, **kwargs):
+    if request is not None:
+        remember_profile_completed(request, user)
@@ -1,3 +1,39 @@
 from django.test import TestCase
+from django.urls import reverse
 
-# Create your tests here.
+from .middleware import PROFILE_COMPLETED_SESSION_KEY
+from .models import CustomUser
+
+
+class ProfileCompletionMiddlewareTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user(
+            username='seeker', email='seeker@example.com', password='pass12345', user_type='job_seeker',
+        )
+
+    def test_incomplete_profile_is_redirected(self):
+        self.client.force_login(self.user)
+        self.assertRedirects(
+            self.client.get(reverse('jobs:job_list')), reverse('profile_completion'), fetch_redirect_response=False,
+        )
+        # Completion pages, static files and anonymous requests are let through
+        self.assertEqual(self.client.get(reverse('users:complete_job_seeker_profile')).status_code, 200)
+        self.assertEqual(self.client.get('/static/missing.css').status_code, 404)
+        self.client.logout()
+        self.assertEqual(self.client.get(reverse('jobs:job_list')).status_code, 200)
+
+    def test_flag_is_read_from_the_session(self):
+        self.user.profile_completed = True
+        self.user.save()
+        self.client.force_login(self.user)
+        self.assertTrue(self.client.session[PROFILE_COMPLETED_SESSION_KEY])
+        # Only the session lookup; the user row isn't loaded for the check
+        with self.assertNumQueries(1):
+            self.client.get('/nonexistent/')
+
+    def test_completion_elsewhere_resyncs_the_session(self):
+        self.client.force_login(self.user)
+        CustomUser.objects.filter(pk=self.user.pk).update(profile_completed=True)
+        self.assertRedirects(self.client.get(reverse('profile_completion')), reverse('home'))
+        self.assertEqual(self.client.get(reverse('jobs:job_list')).status_code, 200)
@@ -7,6 +7,7 @@ from django.contrib.auth.mixins import LoginRequiredMixin
 from profiles.models import Profile
 from profiles.forms import ProfileCompletionForm
 from django.views import View
+from .middleware import remember_profile_completed
 
 class DashboardRedirectView(View):
     def get(self, request, *args, **kwargs):
@@ -14,12 +15,14 @@ class DashboardRedirectView(View):
             return redirect('account_login')
         user_type = getattr(request.user, 'user_type', '')
         if user_type == 'recruiter':
-            return redirect('jobs:my_jobs')
+            return redirect('analytics:dashboard')
         return redirect('jobs:job_list')
 
 @login_required
 def profile_completion_required(request):
     """Redirect users to complete their profile if incomplete"""
+    # Resync the session flag, in case the profile was completed elsewhere (e.g. the admin)
+    remember_profile_completed(request, request.user)
     if request.user.profile_completed:
         return redirect('home')
     
@@ -60,6 +63,7 @@ class ProfileCompletionView(LoginRequiredMixin, UpdateView):
             # mark user and redirect to dashboard
             self.request.user.profile_completed = True
             self.request.user.save()
+            remember_profile_completed(self.request, self.request.user)
             messages.success(self.request, 'Profile completed successfully!')
             return redirect('dashboard')
         else: